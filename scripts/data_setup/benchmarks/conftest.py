@@ -0,0 +1,70 @@
+"""
+Offline extraction benchmarks (pytest-benchmark) over saved listing-page fixtures.
+
+Run from scripts/data_setup:
+
+    python -m pytest benchmarks                                # measure only
+    python -m pytest benchmarks --benchmark-save=baseline      # record a baseline
+    python -m pytest benchmarks --benchmark-compare            # fail on regressions vs. the latest saved run
+    python -m pytest benchmarks --benchmark-compare=0001       # ... or vs. a specific saved run
+
+Baselines are stored per machine under benchmarks/.baselines. When comparing, a test
+fails if its mean time regressed by more than REGRESSION_THRESHOLD unless
+--benchmark-compare-fail is given explicitly.
+"""
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+BASELINE_DIR = BENCHMARK_DIR / ".baselines"
+REGRESSION_THRESHOLD = "mean:25%"
+
+sys.path.insert(0, str(BENCHMARK_DIR.parent / "src"))
+
+# items/sec per benchmark name, printed in the terminal summary
+_ITEM_RATES: dict[str, tuple[int, float]] = {}
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    from pytest_benchmark.utils import parse_compare_fail
+
+    # The default storage (./.benchmarks) depends on the working directory
+    if config.getoption("benchmark_storage") == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BASELINE_DIR}"
+    if config.getoption("benchmark_compare") and not config.getoption("benchmark_compare_fail"):
+        config.option.benchmark_compare_fail = [parse_compare_fail(REGRESSION_THRESHOLD)]
+
+    # Per-page INFO logs from the scrapers would dominate the timings
+    logging.disable(logging.WARNING)
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture
+def record_item_rate(benchmark, request):
+    """Call with the item count after benchmark(...) has run to record items/sec."""
+
+    def record(item_count: int) -> None:
+        if benchmark.stats is None:  # --benchmark-disable: run once, nothing measured
+            return
+        mean = benchmark.stats.stats.mean
+        rate = item_count / mean if mean else 0.0
+        benchmark.extra_info["items"] = item_count
+        benchmark.extra_info["items_per_sec"] = round(rate, 1)
+        _ITEM_RATES[request.node.name] = (item_count, rate)
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not _ITEM_RATES:
+        return
+    terminalreporter.section("items/sec")
+    for name, (items, rate) in sorted(_ITEM_RATES.items(), key=lambda kv: kv[1][1]):
+        terminalreporter.write_line(f"{name:<50}{items:>6} items{rate:>14,.0f} items/s")
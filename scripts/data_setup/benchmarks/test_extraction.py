@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from scrap.arsenal_strength import ArsenalStrengthScraper
+from scrap.atlantis_strength import AtlantisScraper
+from scrap.booty_builder import BootyBuilderScraper
+from scrap.cybex import CybexScraper
+from scrap.drax import DraxScraper
+from scrap.dynaforce import DynaforceScraper
+from scrap.freemotion import FreemotionScraper
+from scrap.gym80 import Gym80Scraper
+from scrap.gymleco import GymlecoScraper
+from scrap.hammer_strength import HammerStrengthScraper
+from scrap.hoist import HoistScraper
+from scrap.legend_fitness import LegendFitnessScraper
+from scrap.Lexco import LexcoScraper
+from scrap.life_fitness import LifeFitnessScraper
+from scrap.matrix import MatrixScraper
+from scrap.nautilus import NautilusScraper
+from scrap.new_tech import NewTechScraper
+from scrap.panatta import PanattaScraper
+from scrap.precor import PrecorScraper
+from scrap.prime_fitness import PrimeScraper
+from scrap.technogym import TechnoGymScraper
+from scrap.usp import USPScraper
+from scrap.viliti import VilitiScraper
+from utils.storefront_api import StorefrontApiScraper
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+@dataclass
+class BrandCase:
+    fixture: str  # file in fixtures/ (listing page HTML, or API response JSON)
+    factory: Callable[[], Any]
+    url: str  # page the fixture stands for (relative image URLs are resolved against it)
+    detail_fixture: str | None = None  # served for every detail page URL
+
+    @property
+    def id(self) -> str:
+        return self.fixture.rsplit(".", 1)[0]
+
+
+# One case per scraper module in scrap/
+CASES = [
+    BrandCase(
+        "arsenal_strength.html",
+        partial(ArsenalStrengthScraper, "Line", "Plate-loaded"),
+        "https://www.ironcompany.com/strength-training-equipment/",
+    ),
+    BrandCase(
+        "atlantis_strength.json",
+        AtlantisScraper,
+        "https://rawfitnessequipment.com.au/collections/atlantis/products.json",
+    ),
+    BrandCase(
+        "booty_builder.json",
+        partial(BootyBuilderScraper, "Plate-loaded"),
+        "https://bootybuilder.com/wp-json/wc/store/v1/products",
+    ),
+    BrandCase(
+        "cybex.json",
+        CybexScraper,
+        "https://bestgymequipment.co.uk/collections/cybex/products.json",
+    ),
+    BrandCase(
+        "drax.html",
+        partial(DraxScraper, "Welliv Pro"),
+        "https://www.draxfit.com/ko/strength/welliv-pro/products",
+    ),
+    BrandCase(
+        "dynaforce.html",
+        DynaforceScraper,
+        "http://www.dynaforce.co.kr/bbs/board.php?bo_table=weight",
+    ),
+    BrandCase(
+        "freemotion.html",
+        partial(FreemotionScraper, "Genesis"),
+        "https://freemotionfitness.com/strength-machines/genesis/",
+    ),
+    BrandCase(
+        "gym80.html",
+        partial(Gym80Scraper, "Sygnum"),
+        "https://www.gym80.co.uk/product-ranges/sygnum",
+    ),
+    BrandCase(
+        "gymleco.json",
+        partial(GymlecoScraper, "Plate-loaded"),
+        "https://gymleco.com/collections/plate-loaded-machines/products.json",
+    ),
+    BrandCase(
+        "hammer_strength.html",
+        HammerStrengthScraper,
+        "https://www.lifefitness.com/en-us/catalog",
+    ),
+    BrandCase(
+        "hoist.json",
+        partial(HoistScraper, "Plate-loaded"),
+        "https://www.hoistfitness.com/collections/ccat-plate-loaded/products.json",
+    ),
+    BrandCase(
+        "legend_fitness.html",
+        LegendFitnessScraper,
+        "https://www.legendfitness.com/products/selectorized-equipment/",
+    ),
+    BrandCase(
+        "lexco.html",
+        partial(LexcoScraper, "팔콘"),
+        "http://www.lexco.kr/shop_list.php",
+    ),
+    BrandCase(
+        "life_fitness.html",
+        LifeFitnessScraper,
+        "https://www.lifefitness.com/en-us/catalog",
+    ),
+    BrandCase(
+        "matrix.html",
+        MatrixScraper,
+        "https://kr.matrixfitness.com/kor/strength/catalog",
+    ),
+    BrandCase(
+        "nautilus.json",
+        NautilusScraper,
+        "https://shop.corehandf.com/collections/impact-line/products.json",
+    ),
+    BrandCase(
+        "new_tech.html",
+        partial(NewTechScraper, "On Him"),
+        "https://www.newtech.co.kr/onhim",
+    ),
+    BrandCase(
+        "panatta.html",
+        partial(PanattaScraper, "Fit Evo"),
+        "https://www.panattasport.com/en/fit-evo",
+    ),
+    BrandCase(
+        "precor.html",
+        partial(PrecorScraper, "Discovery"),
+        "https://www.precor.com/en-us/strength/discovery",
+    ),
+    BrandCase(
+        "prime_fitness.json",
+        partial(PrimeScraper, "Hybrid"),
+        "https://www.primefitnessusa.com/collections/hybrid/products.json",
+    ),
+    BrandCase(
+        "technogym.html",
+        partial(TechnoGymScraper, "Plate-loaded"),
+        "https://www.technogym.com/en-INT/category/plate-loaded",
+    ),
+    BrandCase(
+        "usp.html",
+        partial(USPScraper, "LeverageSeries"),
+        "https://www.usp.co.kr/leverage",
+    ),
+    BrandCase(
+        "viliti.html",
+        VilitiScraper,
+        "https://kaesun.com/product/list.html",
+        detail_fixture="viliti_detail.html",
+    ),
+]
+
+
+def _read(name: str) -> str:
+    return (FIXTURE_DIR / name).read_text(encoding="utf-8")
+
+
+def _build(case: BrandCase):
+    scraper = case.factory()
+    scraper.use_http_cache = False
+    scraper.extract_in_browser = False  # fixtures are HTML
+    if case.detail_fixture:
+        # Detail pages come from the fixture instead of the network/browser
+        detail_html = _read(case.detail_fixture)
+        scraper._load_html = lambda url, loader: detail_html
+    return scraper
+
+
+def _item_count(scraper, document) -> int:
+    if isinstance(scraper, StorefrontApiScraper):
+        return len(document)
+    return len(document.select(scraper.item_selector))
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.id)
+def test_parse(benchmark, record_item_rate, case: BrandCase):
+    """Listing page → document, as fetch_page does (partial parsing where configured)."""
+    scraper = _build(case)
+    html = _read(case.fixture)
+
+    document = benchmark(scraper.parse_html, html, True)
+
+    item_count = _item_count(scraper, document)
+    assert item_count > 0
+    record_item_rate(item_count)
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.id)
+def test_extract(benchmark, record_item_rate, case: BrandCase):
+    """Parsed listing page → Machine items (brand overrides, detail pages included)."""
+    scraper = _build(case)
+    document = scraper.parse_html(_read(case.fixture), items_only=True)
+    scraper.current_base_url = scraper._get_base_url(case.url)
+    scraper.current_url = case.url
+
+    items = benchmark(scraper.extract_items, document)
+
+    # Every item in the fixture must still be extracted
+    assert len(items) == _item_count(scraper, document)
+    assert all(item.name and item.image_url for item in items)
+    record_item_rate(len(items))
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from scrap.arsenal_strength import ArsenalStrengthScraperConfig
+from scrap.gym80 import Gym80ScraperConfig
+from scrap.Lexco import LexcoScraperConfig
+from scrap.panatta import PanattaScraperConfig
+from utils.html_backends import compile_selector, parse_document
+from utils.model import ScraperConfig
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# The largest listing fixtures (by item count)
+LARGE_CATALOGS = {
+    "gym80": Gym80ScraperConfig,
+    "lexco": LexcoScraperConfig,
+    "arsenal_strength": ArsenalStrengthScraperConfig,
+    "panatta": PanattaScraperConfig,
+}
+
+
+def _lookup_strings(config: ScraperConfig, items: list) -> None:
+    for item in items:
+        item.select_one(config.name_selector)
+        item.select_one(config.image_selector)
+
+
+def _lookup_compiled(config: ScraperConfig, items: list) -> None:
+    name_matcher = compile_selector(config.name_selector)
+    image_matcher = compile_selector(config.image_selector)
+    for item in items:
+        name_matcher.select_one(item)
+        image_matcher.select_one(item)
+
+
+@pytest.mark.parametrize("lookup", [_lookup_strings, _lookup_compiled], ids=["string", "compiled"])
+@pytest.mark.parametrize("catalog", list(LARGE_CATALOGS))
+def test_item_lookup(benchmark, record_item_rate, catalog: str, lookup):
+    """Name + image lookup for every item on a page: raw selector strings vs compiled matchers."""
+    config = LARGE_CATALOGS[catalog]
+    html = (FIXTURE_DIR / f"{catalog}.html").read_text(encoding="utf-8")
+    items = compile_selector(config.item_selector).select(parse_document(html))
+    assert items
+
+    benchmark.group = f"item lookup: {catalog}"
+    benchmark(lookup, config, items)
+    record_item_rate(len(items))
@@ -1,5 +1,7 @@
+from functools import partial
+
 from scrap.arsenal_strength import ArsenalStrengthScraper
-from scrap.atlantis import AtlantisScraper
+from scrap.atlantis_strength import AtlantisScraper
 from scrap.booty_builder import BootyBuilderScraper
 from scrap.cybex import CybexScraper
 from scrap.drax import DraxScraper
@@ -16,389 +18,550 @@ from scrap.matrix import MatrixScraper
 from scrap.nautilus import NautilusScraper
 from scrap.new_tech import NewTechScraper
 from scrap.panatta import PanattaScraper
-from scrap.precor import PrecorScraper
 from scrap.prime_fitness import PrimeScraper
-from scrap.techno_gym import TechnoGymScraper
+from scrap.technogym import TechnoGymScraper
 from scrap.usp import USPScraper
 from scrap.viliti import VilitiScraper
+from utils.model import Pagination, ScrapEntry
 
+# 스크래퍼는 실행 시점에 factory로 생성됩니다 (import만으로 브라우저가 뜨지 않음).
+# 특정 브랜드만 수집하려면: python main.py scrap --brand Drax --series "Welliv Pro"
 SCRAP_CONFIG = [
-    # {
-    #     "scraper": ArsenalStrengthScraper(
-    #         machine_series="Plate-loaded", type_="Plate-loaded"),
-    #     "urls": [
-    #         "https://www.ironcompany.com/strength-training-equipment/"
-    #         "plate-loaded-leverage-gym-equipment/brand-arsenal_strength"
-    #     ],
-    # },
-    # {
-    #     "scraper": ArsenalStrengthScraper(
-    #         machine_series="Selectorized", type_="Selectorized"),
-    #     "urls": [
-    #         "https://www.ironcompany.com/strength-training-equipment/"
-    #         "selectorized-gym-equipment/brand-arsenal_strength"
-    #     ],
-    # },
-    # {
-    #     "scraper": AtlantisScraper(),
-    #     "urls": [
-    #         "https://rawfitnessequipment.com.au/collections/atlantis?page=3"
-    #         "&srsltid=AfmBOopi1LGGTpbWS3VpyoP52QgVwBorbevELH45tviUtGs7c0ozNg-C"
-    #     ],
-    # },
-    {
-        "scraper": BootyBuilderScraper(type_="Plate-loaded"),
-        "urls": [
+    ScrapEntry(
+        brand="Arsenal Strength",
+        series="Plate-loaded",
+        type_="Plate-loaded",
+        factory=partial(
+            ArsenalStrengthScraper, machine_series="Plate-loaded", type_="Plate-loaded"
+        ),
+        urls=[
+            "https://www.ironcompany.com/strength-training-equipment/"
+            "plate-loaded-leverage-gym-equipment/brand-arsenal_strength"
+        ],
+    ),
+    ScrapEntry(
+        brand="Arsenal Strength",
+        series="Selectorized",
+        type_="Selectorized",
+        factory=partial(
+            ArsenalStrengthScraper, machine_series="Selectorized", type_="Selectorized"
+        ),
+        urls=[
+            "https://www.ironcompany.com/strength-training-equipment/"
+            "selectorized-gym-equipment/brand-arsenal_strength"
+        ],
+    ),
+    ScrapEntry(
+        brand="Atlantis Strength",
+        factory=AtlantisScraper,
+        urls=["https://rawfitnessequipment.com.au/collections/atlantis"],
+    ),
+    ScrapEntry(
+        brand="Booty Builder",
+        type_="Plate-loaded",
+        factory=partial(BootyBuilderScraper, type_="Plate-loaded"),
+        urls=[
             "https://bootybuilder.com/product-category/machines/"
             "plate-loaded-machines/"
         ],
-    },
-    {
-        "scraper": BootyBuilderScraper(type_="Selectorized"),
-        "urls": [
+    ),
+    ScrapEntry(
+        brand="Booty Builder",
+        type_="Selectorized",
+        factory=partial(BootyBuilderScraper, type_="Selectorized"),
+        urls=[
             "https://bootybuilder.com/product-category/machines/"
             "weight-stack-machines/"
         ],
-    },
-    # {
-    #     "scraper": CybexScraper(),
-    #     "urls": [
-    #         f"https://bestgymequipment.co.uk/collections/cybex?page={i}&grid_list=grid-view"
-    #         for i in range(1, 6)
-    #     ],
-    # },
-    # {
-    #     "scraper": DraxScraper(machine_series="Welliv Pro", type_="Selectorized"),
-    #     "urls": ["https://www.draxfit.com/ko/strength/welliv-pro/products"],
-    # },
-    # {
-    #     "scraper": DraxScraper(machine_series="Welliv", type_="Selectorized"),
-    #     "urls": ["https://www.draxfit.com/ko/strength/welliv/products"],
-    # },
-    # {
-    #     "scraper": DraxScraper(machine_series="Welliv Pro Dual", type_="Selectorized"),
-    #     "urls": [
-    #         "https://www.draxfit.com/ko/strength/welliv-pro-dual/products"
-    #     ],
-    # },
-    # {
-    #     "scraper": DraxScraper(machine_series="Plate-loaded", type_="Plate-loaded"),
-    #     "urls": ["https://www.draxfit.com/ko/strength/plate-loaded/products"],
-    # },
-    # {
-    #     "scraper": DynaforceScraper(type_="Selectorized"),
-    #     "urls": [
-    #         "http://www.dynaforce.co.kr/bbs/board.php?bo_table=weight&page={i}"
-    #         for i in range(1, 3)
-    #     ],
-    # },
-    # {
-    #     "scraper": DynaforceScraper(type_="Plate-loaded"),
-    #     "urls": ["http://www.dynaforce.co.kr/bbs/board.php?bo_table=hammer"],
-    # },
-    # {
-    #     "scraper": FreemotionScraper(machine_series="Genesis", type_="Selectorized"),
-    #     "urls": ["https://freemotionfitness.com/strength-machines/genesis/"],
-    # },
-    # {
-    #     "scraper": FreemotionScraper(machine_series="Genesis DS", type_="Selectorized"),
-    #     "urls": ["https://freemotionfitness.com/strength-machines/genesis-ds/"],
-    # },
-    # {
-    #     "scraper": FreemotionScraper(machine_series="Epic Selectorized", type_="Selectorized"),
-    #     "urls": ["https://freemotionfitness.com/strength-machines/epic-selectorized/"],
-    # },
-    # {
-    #     "scraper": FreemotionScraper(machine_series="Epic Plate-Loaded", type_="Plate-loaded"),
-    #     "urls": ["https://freemotionfitness.com/strength-machines/epic-plate-loaded/"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Sygnum", "Selectorized"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/sygnum"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Sygnum Dual", "Selectorized"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/sygnum-dual"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Sygnum Cable Art", "Selectorized"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/sygnum-cable-art"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Sygnum Combo", "Selectorized"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/sygnum-combo"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Sygnum Stations", "Selectorized"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/sygnum-stations"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Pure Kraft Strong", "Plate-loaded"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/pure-kraft-strong"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Pure Kraft", "Plate-loaded"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/pure-kraft"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("80Athletics", "Plate-loaded"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/80athletics"],
-    # },
-    # {
-    #     "scraper": Gym80Scraper("Outdoor", "Plate-loaded"),
-    #     "urls": ["https://www.gym80.co.uk/product-ranges/outdoor"],
-    # },
-    # {
-    #     "scraper": GymlecoScraper(type_="Plate-loaded"),
-    #     "urls": ["https://gymleco.com/collections/plate-loaded-machines"],
-    # },
-    # {
-    #     "scraper": GymlecoScraper(type_="Selectorized"),
-    #     "urls": ["https://gymleco.com/collections/cable-stations"],
-    # },
-    # {
-    #     "scraper": GymlecoScraper(type_="Selectorized"),
-    #     "urls": ["https://gymleco.com/collections/selectorized-gym-machines"],
-    # },
-    # {
-    #     "scraper": GymlecoScraper(type_="Selectorized"),
-    #     "urls": ["https://gymleco.com/collections/combi-machines"],
-    # },
-    # {
-    #     "scraper": HammerStrengthScraper(),
-    #     "urls": [
-    #         "https://www.lifefitness.com/en-us/catalog?Brand=1053&Type=1079"
-    #         f"&pageNumber={i}#searchform"
-    #         for i in range(1, 10)
-    #     ]
-    # },
-    # {
-    #     "scraper": HoistScraper("Plate-loaded"),
-    #     "urls": [
-    #         "https://www.hoistfitness.com/collections/ccat-plate-loaded",
-    #     ]
-    # },
-    # {
-    #     "scraper": HoistScraper("Selectorized"),
-    #     "urls": [
-    #         "https://www.hoistfitness.com/collections/ccat-hd-dual-series",
-    #         "https://www.hoistfitness.com/collections/ccat-selectorized",
-    #         "https://www.hoistfitness.com/collections/ccat-multi-jungle-systems",
-    #     ]
-    # },
-    # {
-    #     "scraper": LegendFitnessScraper("Selectorized"),
-    #     "urls": [
-    #         "https://www.legendfitness.com/products/"
-    #         "selectorized-equipment/upper-body-selectorized-equipment/",
-    #         "https://www.legendfitness.com/products/"
-    #         "selectorized-equipment/lower-body-and-core-selectorized-equipment/",
-    #         "https://www.legendfitness.com/products/"
-    #         "selectorized-equipment/multi-stack-selectorized-equipment/",
-    #         "https://www.legendfitness.com/products/"
-    #         "selectorized-equipment/combo-stations-selectorized-equipment/",
-    #     ]
-    # },
-    # {
-    #     "scraper": LegendFitnessScraper("Plate-loaded"),
-    #     "urls": [
-    #         "https://www.legendfitness.com/products/"
-    #         "all-plate-loaded/upper-body-plate-loaded-equipment/",
-    #         "https://www.legendfitness.com/products/"
-    #         "all-plate-loaded/lower-body-plate-loaded-equipment/",
-    #     ]
-    # },
-    # {
-    #     "scraper": LexcoScraper("팔콘", "Selectorized"),
-    #     "urls": [
-    #         "http://www.lexco.kr/shop_list.php?gsp_p=1&gsp_md=shop_goods&gsp_srch_cate=188",
-    #         "http://www.lexco.kr/shop_list.php?gsp_p=2&gsp_md=shop_goods&gsp_srch_cate=188",
-    #     ]
-    # },
-    # {
-    #     "scraper": LexcoScraper("마스터 프로", "Selectorized"),
-    #     "urls": [
-    #         "http://www.lexco.kr/shop_list.php?gsp_srch_cate=208",
-    #     ]
-    # },
-    # {
-    #     "scraper": LexcoScraper("마스터", "Selectorized"),
-    #     "urls": [
-    #         "http://www.lexco.kr/shop_list.php?gsp_srch_cate=190",
-    #     ]
-    # },
-    # {
-    #     "scraper": LexcoScraper("타우러스", "Selectorized"),
-    #     "urls": [
-    #         "http://www.lexco.kr/shop_list.php?gsp_srch_cate=210",
-    #     ]
-    # },
-    # {
-    #     "scraper": LexcoScraper("마스터 프로", "Plate-loaded"),
-    #     "urls": [
-    #         "http://www.lexco.kr/shop_list.php?gsp_srch_cate=207",
-    #     ]
-    # },
-    # {
-    #     "scraper": LifeFitnessScraper(),
-    #     "urls": [
-    #         "https://www.lifefitness.com/en-us/catalog?Brand=1056&Type=1079"
-    #         f"&pageNumber={i}#searchform"
-    #         for i in range(1, 10)
-    #     ]
-    # },
-    # {
-    #     "scraper": MatrixScraper("Selectorized"),
-    #     "urls": [
-    #         "https://kr.matrixfitness.com/kor/strength/catalog?series=ultra",
-    #         "https://kr.matrixfitness.com/kor/strength/catalog?series=versa",
-    #         "https://kr.matrixfitness.com/kor/strength/catalog?series=aura",
-    #         "https://kr.matrixfitness.com/kor/strength/catalog?series=go",
-    #     ]
-    # },
-    # {
-    #     "scraper": MatrixScraper("Plate-loaded"),
-    #     "urls": [
-    #         "https://kr.matrixfitness.com/kor/strength/catalog?series=xult",
-    #     ]
-    # },
-    # {
-    #     "scraper": NautilusScraper("Selectorized"),
-    #     "urls": [
-    #         "https://shop.corehandf.com/collections/inspiration-line?page=1",
-    #         "https://shop.corehandf.com/collections/inspiration-line?page=2",
-    #     ] + [f"https://shop.corehandf.com/collections/impact-line?page={i}" for i in range(1, 4)]
-    #      + [f"https://shop.corehandf.com/collections/instinct-line?page={i}" for i in range(1, 4)]
-    #      + [f"https://shop.corehandf.com/collections/humansport-line"]
-    # },
-    # {
-    #     "scraper": NautilusScraper("Plate-loaded"),
-    #     "urls": [
-    #         "https://shop.corehandf.com/collections/leverage-line",
-    #         "https://shop.corehandf.com/collections/plate-loaded-line"
-    #     ]
-    # },
-    # {
-    #     "scraper": NewTechScraper("On Him", "Selectorized"),
-    #     "urls": [
-    #         "https://ntws.co.kr/54",
-    #         "https://ntws.co.kr/58",
-    #     ]
-    # },
-    # {
-    #     "scraper": NewTechScraper("Advance", "Selectorized"),
-    #     "urls": [
-    #         "https://ntws.co.kr/50",
-    #     ]
-    # },
-    # {
-    #     "scraper": NewTechScraper("Plate Load", "Plate-loaded"),
-    #     "urls": [
-    #         "https://ntws.co.kr/50",
-    #     ]
-    # },
-    # {
-    #     "scraper": NewTechScraper("M-torture", "Plate-loaded"),
-    #     "urls": [
-    #         "https://ntws.co.kr/51",
-    #         "https://ntws.co.kr/59",
-    #     ]
-    # },
-    # {
-    #     "scraper": NewTechScraper("Cable Motion", "Cable"),
-    #     "urls": [
-    #         "https://ntws.co.kr/53",
-    #     ]
-    # },
-    # {
-    #     "scraper": PanattaScraper("Monolith", "Selectorized"),
-    #     "urls": [
-    #         f"https://panattafitness.com/monolith/?product-page={i}"
-    #         for i in range(1, 6)
-    #     ]
-    # },
-    # {
-    #     "scraper": PanattaScraper("Fit Evo", "Selectorized"),
-    #     "urls": [
-    #         f"https://panattafitness.com/fit-evo/?product-page={i}"
-    #         for i in range(1, 12)
-    #     ]
-    # },
-    # {
-    #     "scraper": PanattaScraper("Sec", "Selectorized"),
-    #     "urls": [
-    #         f"https://panattafitness.com/sec/?product-page={i}"
-    #         for i in range(1, 7)
-    #     ]
-    # },
-    # {
-    #     "scraper": PanattaScraper("Freeweight Special", "Plate-loaded"),
-    #     "urls": [
-    #         f"https://panattafitness.com/freeweightspecial/?product-page={i}"
-    #         for i in range(1, 8)
-    #     ]
-    # },
-    # {
-    #     "scraper": PanattaScraper("Freeweight HP", "Plate-loaded"),
-    #     "urls": [
-    #         f"https://panattafitness.com/freeweight-hp/?product-page={i}"
-    #         for i in range(1, 9)
-    #     ]
-    # },
-    # {
-    #     "scraper": PanattaScraper("Freeweight One", "Plate-loaded"),
-    #     "urls": [
-    #         f"https://panattafitness.com/freeweight-one/?product-page={i}"
-    #         for i in range(1, 3)
-    #     ]
-    # },
-    # {
-    #     "scraper": PanattaScraper("Fantastic", "Selectorized"),
-    #     "urls": [
-    #         "https://www.panattasport.com/en/fantastic"
-    #     ]
-    # },
-    # {
-    #     "scraper": PrimeScraper("Evolution", "Selectorized"),
-    #     "urls": ["https://www.primefitnessusa.com/collections/evolution"]
-    # },
-    # {
-    #     "scraper": PrimeScraper("Hybrid", "Selectorized"),
-    #     "urls": [f"https://www.primefitnessusa.com/collections/hybrid?page={i}" for i in range(1, 4)]
-    # },
-    # {
-    #     "scraper": PrimeScraper("Plate-loaded", "Plate-loaded"),
-    #     "urls": [f"https://www.primefitnessusa.com/collections/plate-loaded-equipment?page={i}" for i in range(1, 3)]
-    # },
-    # {
-    #     "scraper": TechnoGymScraper("Plate-loaded"),
-    #     "urls": ["https://www.technogym.com/en-INT/category/plate-loaded"]
-    # },
-    # {
-    #     "scraper": TechnoGymScraper("Selectorized"),
-    #     "urls": ["https://www.technogym.com/en-INT/category/selectorized-strength-machines/"]
-    # },
-    # {
-    #     "scraper": USPScraper("LeverageSeries", "Plate-loaded"),
-    #     "urls": ["https://www.uspfitness.com/LeverageSeries"]
-    # },
-    # {
-    #     "scraper": VilitiScraper("Selectorized"),
-    #     "urls": ["https://kaesun.com/pages/upturn#none"]
-    # },
-    # {
-    #     "scraper": VilitiScraper("Selectorized"),
-    #     "urls": ["https://kaesun.com/pages/upturn#none"]
-    # },
-    # {
-    #     "scraper": VilitiScraper("Selectorized"),
-    #     "urls": ["https://kaesun.com/pages/upturn#none",
-    #              "https://kaesun.com/pages/weight#none"]
-    # },
-    # {
-    #     "scraper": VilitiScraper("Plate-loaded"),
-    #     "urls": ["https://kaesun.com/pages/xploseries#none",
-    #              "https://kaesun.com/pages/xplo#none",
-    #              "https://kaesun.com/pages/plateloaded“"]
-    # }
-]
\ No newline at end of file
+    ),
+    ScrapEntry(
+        brand="Cybex",
+        factory=CybexScraper,
+        urls=["https://bestgymequipment.co.uk/collections/cybex"],
+    ),
+    ScrapEntry(
+        brand="Drax",
+        series="Welliv Pro",
+        type_="Selectorized",
+        factory=partial(DraxScraper, machine_series="Welliv Pro", type_="Selectorized"),
+        urls=["https://www.draxfit.com/ko/strength/welliv-pro/products"],
+    ),
+    ScrapEntry(
+        brand="Drax",
+        series="Welliv",
+        type_="Selectorized",
+        factory=partial(DraxScraper, machine_series="Welliv", type_="Selectorized"),
+        urls=["https://www.draxfit.com/ko/strength/welliv/products"],
+    ),
+    ScrapEntry(
+        brand="Drax",
+        series="Welliv Pro Dual",
+        type_="Selectorized",
+        factory=partial(
+            DraxScraper, machine_series="Welliv Pro Dual", type_="Selectorized"
+        ),
+        urls=["https://www.draxfit.com/ko/strength/welliv-pro-dual/products"],
+    ),
+    ScrapEntry(
+        brand="Drax",
+        series="Plate-loaded",
+        type_="Plate-loaded",
+        factory=partial(DraxScraper, machine_series="Plate-loaded", type_="Plate-loaded"),
+        urls=["https://www.draxfit.com/ko/strength/plate-loaded/products"],
+    ),
+    ScrapEntry(
+        brand="Dynaforce",
+        type_="Selectorized",
+        factory=partial(DynaforceScraper, type_="Selectorized"),
+        pagination=Pagination(
+            url_template=(
+                "http://www.dynaforce.co.kr/bbs/board.php?bo_table=weight&page={page}"
+            )
+        ),
+    ),
+    ScrapEntry(
+        brand="Dynaforce",
+        type_="Plate-loaded",
+        factory=partial(DynaforceScraper, type_="Plate-loaded"),
+        urls=["http://www.dynaforce.co.kr/bbs/board.php?bo_table=hammer"],
+    ),
+    ScrapEntry(
+        brand="Freemotion",
+        series="Genesis",
+        type_="Selectorized",
+        factory=partial(FreemotionScraper, machine_series="Genesis", type_="Selectorized"),
+        urls=["https://freemotionfitness.com/strength-machines/genesis/"],
+    ),
+    ScrapEntry(
+        brand="Freemotion",
+        series="Genesis DS",
+        type_="Selectorized",
+        factory=partial(
+            FreemotionScraper, machine_series="Genesis DS", type_="Selectorized"
+        ),
+        urls=["https://freemotionfitness.com/strength-machines/genesis-ds/"],
+    ),
+    ScrapEntry(
+        brand="Freemotion",
+        series="Epic Selectorized",
+        type_="Selectorized",
+        factory=partial(
+            FreemotionScraper, machine_series="Epic Selectorized", type_="Selectorized"
+        ),
+        urls=["https://freemotionfitness.com/strength-machines/epic-selectorized/"],
+    ),
+    ScrapEntry(
+        brand="Freemotion",
+        series="Epic Plate-Loaded",
+        type_="Plate-loaded",
+        factory=partial(
+            FreemotionScraper, machine_series="Epic Plate-Loaded", type_="Plate-loaded"
+        ),
+        urls=["https://freemotionfitness.com/strength-machines/epic-plate-loaded/"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Sygnum",
+        type_="Selectorized",
+        factory=partial(Gym80Scraper, "Sygnum", "Selectorized"),
+        urls=["https://www.gym80.co.uk/product-ranges/sygnum"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Sygnum Dual",
+        type_="Selectorized",
+        factory=partial(Gym80Scraper, "Sygnum Dual", "Selectorized"),
+        urls=["https://www.gym80.co.uk/product-ranges/sygnum-dual"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Sygnum Cable Art",
+        type_="Selectorized",
+        factory=partial(Gym80Scraper, "Sygnum Cable Art", "Selectorized"),
+        urls=["https://www.gym80.co.uk/product-ranges/sygnum-cable-art"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Sygnum Combo",
+        type_="Selectorized",
+        factory=partial(Gym80Scraper, "Sygnum Combo", "Selectorized"),
+        urls=["https://www.gym80.co.uk/product-ranges/sygnum-combo"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Sygnum Stations",
+        type_="Selectorized",
+        factory=partial(Gym80Scraper, "Sygnum Stations", "Selectorized"),
+        urls=["https://www.gym80.co.uk/product-ranges/sygnum-stations"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Pure Kraft Strong",
+        type_="Plate-loaded",
+        factory=partial(Gym80Scraper, "Pure Kraft Strong", "Plate-loaded"),
+        urls=["https://www.gym80.co.uk/product-ranges/pure-kraft-strong"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Pure Kraft",
+        type_="Plate-loaded",
+        factory=partial(Gym80Scraper, "Pure Kraft", "Plate-loaded"),
+        urls=["https://www.gym80.co.uk/product-ranges/pure-kraft"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="80Athletics",
+        type_="Plate-loaded",
+        factory=partial(Gym80Scraper, "80Athletics", "Plate-loaded"),
+        urls=["https://www.gym80.co.uk/product-ranges/80athletics"],
+    ),
+    ScrapEntry(
+        brand="Gym80",
+        series="Outdoor",
+        type_="Plate-loaded",
+        factory=partial(Gym80Scraper, "Outdoor", "Plate-loaded"),
+        urls=["https://www.gym80.co.uk/product-ranges/outdoor"],
+    ),
+    ScrapEntry(
+        brand="Gymleco",
+        type_="Plate-loaded",
+        factory=partial(GymlecoScraper, type_="Plate-loaded"),
+        urls=["https://gymleco.com/collections/plate-loaded-machines"],
+    ),
+    ScrapEntry(
+        brand="Gymleco",
+        type_="Selectorized",
+        factory=partial(GymlecoScraper, type_="Selectorized"),
+        urls=["https://gymleco.com/collections/cable-stations"],
+    ),
+    ScrapEntry(
+        brand="Gymleco",
+        type_="Selectorized",
+        factory=partial(GymlecoScraper, type_="Selectorized"),
+        urls=["https://gymleco.com/collections/selectorized-gym-machines"],
+    ),
+    ScrapEntry(
+        brand="Gymleco",
+        type_="Selectorized",
+        factory=partial(GymlecoScraper, type_="Selectorized"),
+        urls=["https://gymleco.com/collections/combi-machines"],
+    ),
+    ScrapEntry(
+        brand="Hammer Strength",
+        factory=HammerStrengthScraper,
+        pagination=Pagination(
+            url_template=(
+                "https://www.lifefitness.com/en-us/catalog?Brand=1053&Type=1079"
+                "&pageNumber={page}#searchform"
+            )
+        ),
+    ),
+    ScrapEntry(
+        brand="Hoist",
+        type_="Plate-loaded",
+        factory=partial(HoistScraper, "Plate-loaded"),
+        urls=[
+            "https://www.hoistfitness.com/collections/ccat-plate-loaded",
+        ],
+    ),
+    ScrapEntry(
+        brand="Hoist",
+        type_="Selectorized",
+        factory=partial(HoistScraper, "Selectorized"),
+        urls=[
+            "https://www.hoistfitness.com/collections/ccat-hd-dual-series",
+            "https://www.hoistfitness.com/collections/ccat-selectorized",
+            "https://www.hoistfitness.com/collections/ccat-multi-jungle-systems",
+        ],
+    ),
+    ScrapEntry(
+        brand="Legend Fitness",
+        type_="Selectorized",
+        factory=partial(LegendFitnessScraper, "Selectorized"),
+        urls=[
+            "https://www.legendfitness.com/products/"
+            "selectorized-equipment/upper-body-selectorized-equipment/",
+            "https://www.legendfitness.com/products/"
+            "selectorized-equipment/lower-body-and-core-selectorized-equipment/",
+            "https://www.legendfitness.com/products/"
+            "selectorized-equipment/multi-stack-selectorized-equipment/",
+            "https://www.legendfitness.com/products/"
+            "selectorized-equipment/combo-stations-selectorized-equipment/",
+        ],
+    ),
+    ScrapEntry(
+        brand="Legend Fitness",
+        type_="Plate-loaded",
+        factory=partial(LegendFitnessScraper, "Plate-loaded"),
+        urls=[
+            "https://www.legendfitness.com/products/"
+            "all-plate-loaded/upper-body-plate-loaded-equipment/",
+            "https://www.legendfitness.com/products/"
+            "all-plate-loaded/lower-body-plate-loaded-equipment/",
+        ],
+    ),
+    ScrapEntry(
+        brand="Lexco",
+        series="팔콘",
+        type_="Selectorized",
+        factory=partial(LexcoScraper, "팔콘", "Selectorized"),
+        urls=[
+            "http://www.lexco.kr/shop_list.php?gsp_p=1&gsp_md=shop_goods&gsp_srch_cate=188",
+            "http://www.lexco.kr/shop_list.php?gsp_p=2&gsp_md=shop_goods&gsp_srch_cate=188",
+        ],
+    ),
+    ScrapEntry(
+        brand="Lexco",
+        series="마스터 프로",
+        type_="Selectorized",
+        factory=partial(LexcoScraper, "마스터 프로", "Selectorized"),
+        urls=[
+            "http://www.lexco.kr/shop_list.php?gsp_srch_cate=208",
+        ],
+    ),
+    ScrapEntry(
+        brand="Lexco",
+        series="마스터",
+        type_="Selectorized",
+        factory=partial(LexcoScraper, "마스터", "Selectorized"),
+        urls=[
+            "http://www.lexco.kr/shop_list.php?gsp_srch_cate=190",
+        ],
+    ),
+    ScrapEntry(
+        brand="Lexco",
+        series="타우러스",
+        type_="Selectorized",
+        factory=partial(LexcoScraper, "타우러스", "Selectorized"),
+        urls=[
+            "http://www.lexco.kr/shop_list.php?gsp_srch_cate=210",
+        ],
+    ),
+    ScrapEntry(
+        brand="Lexco",
+        series="마스터 프로",
+        type_="Plate-loaded",
+        factory=partial(LexcoScraper, "마스터 프로", "Plate-loaded"),
+        urls=[
+            "http://www.lexco.kr/shop_list.php?gsp_srch_cate=207",
+        ],
+    ),
+    ScrapEntry(
+        brand="Life Fitness",
+        factory=LifeFitnessScraper,
+        pagination=Pagination(
+            url_template=(
+                "https://www.lifefitness.com/en-us/catalog?Brand=1056&Type=1079"
+                "&pageNumber={page}#searchform"
+            )
+        ),
+    ),
+    ScrapEntry(
+        brand="Matrix",
+        type_="Selectorized",
+        factory=partial(MatrixScraper, "Selectorized"),
+        urls=[
+            "https://kr.matrixfitness.com/kor/strength/catalog?series=ultra",
+            "https://kr.matrixfitness.com/kor/strength/catalog?series=versa",
+            "https://kr.matrixfitness.com/kor/strength/catalog?series=aura",
+            "https://kr.matrixfitness.com/kor/strength/catalog?series=go",
+        ],
+    ),
+    ScrapEntry(
+        brand="Matrix",
+        type_="Plate-loaded",
+        factory=partial(MatrixScraper, "Plate-loaded"),
+        urls=[
+            "https://kr.matrixfitness.com/kor/strength/catalog?series=xult",
+        ],
+    ),
+    ScrapEntry(
+        brand="Nautilus",
+        type_="Selectorized",
+        factory=partial(NautilusScraper, "Selectorized"),
+        urls=[
+            "https://shop.corehandf.com/collections/inspiration-line",
+            "https://shop.corehandf.com/collections/impact-line",
+            "https://shop.corehandf.com/collections/instinct-line",
+            "https://shop.corehandf.com/collections/humansport-line",
+        ],
+    ),
+    ScrapEntry(
+        brand="Nautilus",
+        type_="Plate-loaded",
+        factory=partial(NautilusScraper, "Plate-loaded"),
+        urls=[
+            "https://shop.corehandf.com/collections/leverage-line",
+            "https://shop.corehandf.com/collections/plate-loaded-line",
+        ],
+    ),
+    ScrapEntry(
+        brand="New Tech",
+        series="On Him",
+        type_="Selectorized",
+        factory=partial(NewTechScraper, "On Him", "Selectorized"),
+        urls=[
+            "https://ntws.co.kr/54",
+            "https://ntws.co.kr/58",
+        ],
+    ),
+    ScrapEntry(
+        brand="New Tech",
+        series="Advance",
+        type_="Selectorized",
+        factory=partial(NewTechScraper, "Advance", "Selectorized"),
+        urls=[
+            "https://ntws.co.kr/50",
+        ],
+    ),
+    ScrapEntry(
+        brand="New Tech",
+        series="Plate Load",
+        type_="Plate-loaded",
+        factory=partial(NewTechScraper, "Plate Load", "Plate-loaded"),
+        urls=[
+            "https://ntws.co.kr/50",
+        ],
+    ),
+    ScrapEntry(
+        brand="New Tech",
+        series="M-torture",
+        type_="Plate-loaded",
+        factory=partial(NewTechScraper, "M-torture", "Plate-loaded"),
+        urls=[
+            "https://ntws.co.kr/51",
+            "https://ntws.co.kr/59",
+        ],
+    ),
+    ScrapEntry(
+        brand="New Tech",
+        series="Cable Motion",
+        type_="Cable",
+        factory=partial(NewTechScraper, "Cable Motion", "Cable"),
+        urls=[
+            "https://ntws.co.kr/53",
+        ],
+    ),
+    ScrapEntry(
+        brand="Panatta",
+        series="Monolith",
+        type_="Selectorized",
+        factory=partial(PanattaScraper, "Monolith", "Selectorized"),
+        pagination=Pagination(
+            url_template="https://panattafitness.com/monolith/?product-page={page}"
+        ),
+    ),
+    ScrapEntry(
+        brand="Panatta",
+        series="Fit Evo",
+        type_="Selectorized",
+        factory=partial(PanattaScraper, "Fit Evo", "Selectorized"),
+        pagination=Pagination(
+            url_template="https://panattafitness.com/fit-evo/?product-page={page}"
+        ),
+    ),
+    ScrapEntry(
+        brand="Panatta",
+        series="Sec",
+        type_="Selectorized",
+        factory=partial(PanattaScraper, "Sec", "Selectorized"),
+        pagination=Pagination(
+            url_template="https://panattafitness.com/sec/?product-page={page}"
+        ),
+    ),
+    ScrapEntry(
+        brand="Panatta",
+        series="Freeweight Special",
+        type_="Plate-loaded",
+        factory=partial(PanattaScraper, "Freeweight Special", "Plate-loaded"),
+        pagination=Pagination(
+            url_template="https://panattafitness.com/freeweightspecial/?product-page={page}"
+        ),
+    ),
+    ScrapEntry(
+        brand="Panatta",
+        series="Freeweight HP",
+        type_="Plate-loaded",
+        factory=partial(PanattaScraper, "Freeweight HP", "Plate-loaded"),
+        pagination=Pagination(
+            url_template="https://panattafitness.com/freeweight-hp/?product-page={page}"
+        ),
+    ),
+    ScrapEntry(
+        brand="Panatta",
+        series="Freeweight One",
+        type_="Plate-loaded",
+        factory=partial(PanattaScraper, "Freeweight One", "Plate-loaded"),
+        pagination=Pagination(
+            url_template="https://panattafitness.com/freeweight-one/?product-page={page}"
+        ),
+    ),
+    ScrapEntry(
+        brand="Panatta",
+        series="Fantastic",
+        type_="Selectorized",
+        factory=partial(PanattaScraper, "Fantastic", "Selectorized"),
+        urls=[
+            "https://www.panattasport.com/en/fantastic",
+        ],
+    ),
+    ScrapEntry(
+        brand="Prime Fitness",
+        series="Evolution",
+        type_="Selectorized",
+        factory=partial(PrimeScraper, "Evolution", "Selectorized"),
+        urls=["https://www.primefitnessusa.com/collections/evolution"],
+    ),
+    ScrapEntry(
+        brand="Prime Fitness",
+        series="Hybrid",
+        type_="Selectorized",
+        factory=partial(PrimeScraper, "Hybrid", "Selectorized"),
+        urls=["https://www.primefitnessusa.com/collections/hybrid"],
+    ),
+    ScrapEntry(
+        brand="Prime Fitness",
+        series="Plate-loaded",
+        type_="Plate-loaded",
+        factory=partial(PrimeScraper, "Plate-loaded", "Plate-loaded"),
+        urls=["https://www.primefitnessusa.com/collections/plate-loaded-equipment"],
+    ),
+    ScrapEntry(
+        brand="Technogym",
+        type_="Plate-loaded",
+        factory=partial(TechnoGymScraper, "Plate-loaded"),
+        urls=["https://www.technogym.com/en-INT/category/plate-loaded"],
+    ),
+    ScrapEntry(
+        brand="Technogym",
+        type_="Selectorized",
+        factory=partial(TechnoGymScraper, "Selectorized"),
+        urls=["https://www.technogym.com/en-INT/category/selectorized-strength-machines/"],
+    ),
+    ScrapEntry(
+        brand="USP",
+        series="LeverageSeries",
+        type_="Plate-loaded",
+        factory=partial(USPScraper, "LeverageSeries", "Plate-loaded"),
+        urls=["https://www.uspfitness.com/LeverageSeries"],
+    ),
+    ScrapEntry(
+        brand="Viliti",
+        type_="Selectorized",
+        factory=partial(VilitiScraper, "Selectorized"),
+        urls=[
+            "https://kaesun.com/pages/upturn#none",
+            "https://kaesun.com/pages/weight#none",
+        ],
+    ),
+    ScrapEntry(
+        brand="Viliti",
+        type_="Plate-loaded",
+        factory=partial(VilitiScraper, "Plate-loaded"),
+        urls=[
+            "https://kaesun.com/pages/xploseries#none",
+            "https://kaesun.com/pages/xplo#none",
+            "https://kaesun.com/pages/plateloaded",
+        ],
+    ),
+]
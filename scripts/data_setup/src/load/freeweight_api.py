@@ -8,6 +8,14 @@ from typing import Tuple
 
 from dotenv import load_dotenv
 
+try:  # Package execution
+    from ..utils.rate_limiter import RateLimiter
+except ImportError:  # Standalone execution fallback
+    SRC_ROOT = Path(__file__).resolve().parents[1]
+    if str(SRC_ROOT) not in sys.path:
+        sys.path.append(str(SRC_ROOT))
+    from utils.rate_limiter import RateLimiter  # type: ignore
+
 load_dotenv()
 
 RAPID_API_HOST = "exercisedb.p.rapidapi.com"
@@ -21,6 +29,36 @@ DATA_DIR = PROJECT_ROOT / "scripts" / "data_setup" / "data"
 EXERCISE_DATA_FILE = DATA_DIR / "exercise_DB_freeweights.json"
 IMAGES_DIR = DATA_DIR / "images"
 
+# 고정 지연 대신 공용 요청 제한기의 호스트별 속도로 적용
+# (burst=1: 첫 요청부터 요청 사이에 지연 시간만큼 간격을 둠)
+if REQUEST_DELAY_SECONDS > 0:
+    RateLimiter.shared().set_host_rate(RAPID_API_HOST, 1 / REQUEST_DELAY_SECONDS, burst=1)
+
+
+def _get(path: str, headers: dict[str, str]) -> Tuple[int, str, str, bytes]:
+    """RapidAPI GET (요청 제한 + 429/5xx 재시도). (status, reason, content type, body) 반환"""
+    limiter = RateLimiter.shared()
+    attempt = 0
+    while True:
+        limiter.wait(RAPID_API_HOST)
+        conn = http.client.HTTPSConnection(RAPID_API_HOST)
+        try:
+            conn.request("GET", path, headers=headers)
+            res = conn.getresponse()
+            body = res.read()
+            status, reason = res.status, res.reason
+            content_type = res.getheader("Content-Type", "")
+            response_headers = res.headers
+        finally:
+            conn.close()
+
+        delay = limiter.update(RAPID_API_HOST, status, response_headers, attempt)
+        if delay is None or attempt >= limiter.max_retries:
+            return status, reason, content_type, body
+        print(f"RapidAPI responded {status}; retrying in {delay:.1f}s", file=sys.stderr)
+        time.sleep(delay)
+        attempt += 1
+
 
 def _fetch_all_exercises(limit: int = PAGE_LIMIT) -> list[dict]:
     if not RAPID_API_KEY:
@@ -38,34 +76,25 @@ def _fetch_all_exercises(limit: int = PAGE_LIMIT) -> list[dict]:
     offset = 0
 
     while True:
-        conn = http.client.HTTPSConnection(RAPID_API_HOST)
-        try:
-            path = f"/exercises?limit={limit}&offset={offset}"
-            conn.request("GET", path, headers=headers)
+        path = f"/exercises?limit={limit}&offset={offset}"
+        _, _, _, body = _get(path, headers)
+        raw = body.decode("utf-8", errors="replace")
 
-            res = conn.getresponse()
-            raw = res.read().decode("utf-8", errors="replace")
-
-            try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError as exc:
-                raise RuntimeError(
-                    f"Unexpected response at offset {offset}: {raw}"
-                ) from exc
-
-            if not isinstance(payload, list):
-                raise RuntimeError(f"Expected list payload but received: {payload}")
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(
+                f"Unexpected response at offset {offset}: {raw}"
+            ) from exc
 
-            if not payload:
-                break
+        if not isinstance(payload, list):
+            raise RuntimeError(f"Expected list payload but received: {payload}")
 
-            exercises.extend(payload)
-            offset += limit
-        finally:
-            conn.close()
+        if not payload:
+            break
 
-        if REQUEST_DELAY_SECONDS > 0:
-            time.sleep(REQUEST_DELAY_SECONDS)
+        exercises.extend(payload)
+        offset += limit
 
     return exercises
 
@@ -79,25 +108,17 @@ def _fetch_image(exercise_id: str) -> Tuple[bytes, str]:
         "x-rapidapi-host": RAPID_API_HOST,
     }
 
-    conn = http.client.HTTPSConnection(RAPID_API_HOST)
-    try:
-        path = f"/image/?exerciseId={exercise_id}&resolution=720"
-        conn.request("GET", path, headers=headers)
-
-        res = conn.getresponse()
-        content_type = res.getheader("Content-Type", "")
+    path = f"/image/?exerciseId={exercise_id}&resolution=720"
+    status, reason, content_type, body = _get(path, headers)
 
-        if res.status != 200:
-            raw = res.read().decode("utf-8", errors="replace")
-            raise RuntimeError(
-                "Failed to fetch image for "
-                f"{exercise_id}: {res.status} {res.reason}. Body: {raw}"
-            )
+    if status != 200:
+        raw = body.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            "Failed to fetch image for "
+            f"{exercise_id}: {status} {reason}. Body: {raw}"
+        )
 
-        image_data = res.read()
-        return image_data, content_type
-    finally:
-        conn.close()
+    return body, content_type
 
 
 def save_to_file(records: list[dict], output_path: Path) -> None:
@@ -177,9 +198,6 @@ def download_images_from_dataset() -> None:
 
         print(f"Downloaded image for {exercise_id} → {output_path.name}")
 
-        if REQUEST_DELAY_SECONDS > 0:
-            time.sleep(REQUEST_DELAY_SECONDS)
-
 
 if __name__ == "__main__":
     download_images_from_dataset()
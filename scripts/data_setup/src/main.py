@@ -2,8 +2,10 @@ import argparse
 
 # Import the new high-level functions from the refactored modules
 from process.scraping import run_scraping
+from process.catalog_diff import run_diff
 from process.preprocess import run_preprocessing
 from process.upload import run_brand_uploads, run_machine_uploads
+from process.parser_benchmark import run_parser_benchmark
 
 def main():
     """Main function to parse arguments and run tasks."""
@@ -13,12 +15,126 @@ def main():
 
     # --- Scrap Command ---
     parser_scrap = subparsers.add_parser("scrap", help="Run all data scraping tasks.")
-    parser_scrap.set_defaults(func=run_scraping)
+    parser_scrap.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of SCRAP_CONFIG entries to scrape at once (pages are fetched asynchronously).",
+    )
+    parser_scrap.add_argument(
+        "--max-browsers",
+        type=int,
+        default=2,
+        help="Maximum number of Chrome instances shared by Selenium scrapers.",
+    )
+    parser_scrap.add_argument(
+        "--brand",
+        dest="brands",
+        action="append",
+        help="Only scrape this brand (repeatable, case-insensitive).",
+    )
+    parser_scrap.add_argument(
+        "--series",
+        action="append",
+        help="Only scrape this machine series (repeatable, case-insensitive).",
+    )
+    parser_scrap.add_argument(
+        "--record",
+        metavar="ARCHIVE",
+        help="Save every fetched page into this compressed archive (zip).",
+    )
+    parser_scrap.add_argument(
+        "--replay",
+        metavar="ARCHIVE",
+        help="Serve pages from a recorded archive instead of the network/browser.",
+    )
+    parser_scrap.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Run entries in separate processes: this many HTTP-only jobs at once, "
+        "plus --max-browsers Selenium jobs (0 = run in this process).",
+    )
+    parser_scrap.add_argument(
+        "--job-timeout",
+        type=float,
+        default=1800,
+        help="With --processes, seconds before a job is terminated.",
+    )
+    parser_scrap.add_argument(
+        "--retries",
+        type=int,
+        default=1,
+        help="With --processes, how many times a failed or timed-out job is retried.",
+    )
+    existing_data = parser_scrap.add_mutually_exclusive_group()
+    existing_data.add_argument(
+        "--fresh",
+        dest="fresh",
+        action="store_true",
+        help="Delete previous results and checkpoints (of the selected entries) first.",
+    )
+    existing_data.add_argument(
+        "--resume",
+        dest="fresh",
+        action="store_false",
+        help="Skip URLs finished in earlier runs and retry failed ones (default).",
+    )
+    parser_scrap.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the slowest brands, phases and URLs from the run's timing metrics.",
+    )
+    parser_scrap.add_argument(
+        "--discover",
+        action="store_true",
+        help="For entries with a sitemap/product feed (and Shopify/WooCommerce collections), "
+        "scrape only the product pages that are new or changed (lastmod) since the last run.",
+    )
+    parser_scrap.set_defaults(func=run_scraping, fresh=False)
+
+    # --- Parser Benchmark Command ---
+    bench_help = "Compare HTML parser backends on pages from a recorded archive."
+    parser_bench = subparsers.add_parser("bench_parsers", help=bench_help)
+    parser_bench.add_argument(
+        "--archive",
+        required=True,
+        help="Page archive recorded with `scrap --record`.",
+    )
+    parser_bench.add_argument(
+        "--backend",
+        dest="backends",
+        action="append",
+        choices=["bs4", "lxml", "selectolax", "bs4-partial"],
+        help="Backend to time (repeatable, default: all).",
+    )
+    parser_bench.add_argument("--brand", dest="brands", action="append")
+    parser_bench.add_argument("--series", action="append")
+    parser_bench.add_argument(
+        "--repeat", type=int, default=3, help="Runs per page (mean is reported)."
+    )
+    parser_bench.set_defaults(func=run_parser_benchmark)
+
+    # --- Diff Command ---
+    # Compares the scraped machines with the last accepted snapshot.
+    diff_help = "Write the added/removed/changed machines since the last accepted scrape."
+    parser_diff = subparsers.add_parser("diff", help=diff_help)
+    parser_diff.add_argument(
+        "--accept",
+        action="store_true",
+        help="Make the current scrape the accepted snapshot (after processing the delta).",
+    )
+    parser_diff.set_defaults(func=run_diff)
 
     # --- Preprocess Command ---
     # This now runs only the local data merging and normalization.
     preprocess_help = "Run local data preprocessing (merge and normalize scraped data)."
     parser_preprocess = subparsers.add_parser("preprocess", help=preprocess_help)
+    parser_preprocess.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only the added and changed machines from the last `diff`.",
+    )
     parser_preprocess.set_defaults(func=run_preprocessing)
 
     # --- Upload Command ---
@@ -32,6 +148,11 @@ def main():
     # This uploads all data to Supabase: logos, brand info, and machine images.
     upload_help = "Upload all data (logos, brand info, machine images) to Supabase."
     parser_upload = subparsers.add_parser("upload_machine", help=upload_help)
+    parser_upload.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only the machines from `preprocess --delta`.",
+    )
     parser_upload.set_defaults(func=run_machine_uploads)
 
     args = parser.parse_args()
@@ -39,7 +160,13 @@ def main():
     # Execute the function associated with the chosen command
     if hasattr(args, "func"):
         print(f"Running command: {args.command}")
-        args.func()
+        # Pass any command-specific options through to the task function
+        options = {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("command", "func")
+        }
+        args.func(**options)
         print(f"\nCommand '{args.command}' finished.")
 
 if __name__ == "__main__":
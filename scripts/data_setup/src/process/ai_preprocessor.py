@@ -1,7 +1,9 @@
+import argparse
 import json
 import os
 
 from process import prompts
+from process.catalog_diff import DELTA_PATH, load_delta
 from utils.data_repository import DataRepository
 from utils.gemini_manager import GeminiManager
 
@@ -164,12 +166,23 @@ class PreprocessingOrchestrator:
         )
         self.processed_items.add((brand, original_machine_name))
 
-    def run(self, purpose: str = "format"):
+    def run(self, purpose: str = "format", delta: dict | None = None):
+        """
+        Formats or translates every machine name not processed yet. With a catalog
+        `delta` (process/catalog_diff.py), only added and renamed machines are sent
+        to Gemini, and brands without any are skipped.
+        """
         self._load_existing_data()
+        only = None
+        if delta is not None:
+            renamed = [c["after"] for c in delta["changed"] if "name" in c["fields"]]
+            only = {(m["brand"], m["name"]) for m in delta["added"] + renamed}
         try:
             brands = self.repository.get_brand_names()
             print(f"Brands found: {brands}")
             for brand in brands:
+                if only is not None and all(b != brand for b, _ in only):
+                    continue
                 machines, brand_context = self._get_brand_context(
                     brand, purpose=purpose
                 )
@@ -185,6 +198,8 @@ class PreprocessingOrchestrator:
                     original_name = machine.get("original_name", machine["name"])
                     if (brand, original_name) in self.processed_items:
                         continue
+                    if only is not None and (brand, original_name) not in only:
+                        continue
 
                     self._process_machine(
                         machine,
@@ -200,11 +215,26 @@ class PreprocessingOrchestrator:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Translate machine names with Gemini.")
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only the added and renamed machines from the last `diff`.",
+    )
+    args = parser.parse_args()
+
+    delta = None
+    if args.delta:
+        delta = load_delta()
+        if delta is None:
+            print(f"Error: No catalog delta found at {DELTA_PATH}. Run `diff` first.")
+            return
+
     output_path = (
         "/home/user/IronDex/scripts/data_setup/init_data/translated_machine_names.json"
     )
     orchestrator = PreprocessingOrchestrator(output_path=output_path)
-    orchestrator.run(purpose="translate")
+    orchestrator.run(purpose="translate", delta=delta)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,210 @@
+import json
+import os
+import time
+from collections import defaultdict
+
+from utils.dedup_index import normalize_text
+
+DATA_SETUP_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+INIT_DATA_DIR = os.path.join(DATA_SETUP_DIR, "init_data")
+# The catalog as of the last run whose downstream stages finished (`diff --accept`)
+SNAPSHOT_PATH = os.path.join(INIT_DATA_DIR, "catalog_snapshot.json")
+# Added / removed / changed machines of the latest scrape against the snapshot
+DELTA_PATH = os.path.join(INIT_DATA_DIR, "catalog_delta.json")
+
+DIFF_FIELDS = ("name", "image_url", "detail")
+
+# Set on changed machines whose name changed, so uploads can update the old row
+PREVIOUS_NAME_KEY = "previous_name"
+
+
+def machine_key(machine: dict) -> str:
+    """
+    Stable machine key: brand + name, ignoring case, width, whitespace and punctuation,
+    so cosmetic name edits on the brand site show up as changes, not remove + add.
+    """
+    name = normalize_text(machine.get("name"))
+    return f"{(machine.get('brand') or '').casefold()}::{name}"
+
+
+def _by_key(machines: list[dict]) -> dict[str, dict]:
+    # Later files win when the same machine was scraped more than once
+    return {machine_key(machine): machine for machine in machines}
+
+
+def _changed_fields(before: dict, after: dict) -> list[str]:
+    return [field for field in DIFF_FIELDS if before.get(field) != after.get(field)]
+
+
+def diff_catalogs(previous: list[dict], current: list[dict]) -> dict:
+    """
+    Compares two catalogs by machine_key and returns
+    {"added": [...], "removed": [...], "changed": [{"key", "fields", "before", "after"}],
+    "skipped_brands": [...]}.
+
+    A removed and an added machine of the same brand with the same image_url are
+    reported as one renamed (changed) machine. Brands with no machines in `current`
+    are skipped rather than reported as removed, since that is almost always a failed
+    scrape.
+    """
+    before, after = _by_key(previous), _by_key(current)
+    current_brands = {machine.get("brand") for machine in after.values()}
+    skipped_brands = sorted(
+        {m.get("brand") for m in before.values()} - current_brands, key=str
+    )
+
+    changed = []
+    for key in before.keys() & after.keys():
+        fields = _changed_fields(before[key], after[key])
+        if fields:
+            changed.append(
+                {"key": key, "fields": fields, "before": before[key], "after": after[key]}
+            )
+
+    added = {key: after[key] for key in after.keys() - before.keys()}
+    removed = {
+        key: before[key]
+        for key in before.keys() - after.keys()
+        if before[key].get("brand") in current_brands
+    }
+
+    # Renames: same brand and image, different name
+    added_by_image = defaultdict(list)
+    for key, machine in added.items():
+        if machine.get("image_url"):
+            added_by_image[(machine.get("brand"), machine["image_url"])].append(key)
+    for old_key, machine in list(removed.items()):
+        candidates = added_by_image.get((machine.get("brand"), machine.get("image_url")))
+        if not candidates:
+            continue
+        new_key = candidates.pop(0)
+        new_machine = added.pop(new_key)
+        del removed[old_key]
+        changed.append(
+            {
+                "key": new_key,
+                "fields": _changed_fields(machine, new_machine),
+                "before": machine,
+                "after": new_machine,
+            }
+        )
+
+    return {
+        "added": list(added.values()),
+        "removed": list(removed.values()),
+        "changed": sorted(changed, key=lambda change: change["key"]),
+        "skipped_brands": skipped_brands,
+    }
+
+
+def delta_machines(delta: dict) -> list[dict]:
+    """
+    Machines the downstream stages have to (re)process: the added ones plus the new
+    version of each changed one (with PREVIOUS_NAME_KEY if it was renamed).
+    """
+    machines = [dict(machine) for machine in delta["added"]]
+    for change in delta["changed"]:
+        machine = dict(change["after"])
+        if "name" in change["fields"]:
+            machine[PREVIOUS_NAME_KEY] = change["before"].get("name")
+        machines.append(machine)
+    return machines
+
+
+def _read(path: str) -> dict | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _write(data: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+
+
+def load_snapshot(path: str = SNAPSHOT_PATH) -> dict | None:
+    """The last accepted catalog ({"accepted_at", "machines"}), or None before the first accept."""
+    return _read(path)
+
+
+def load_delta(path: str = DELTA_PATH) -> dict | None:
+    return _read(path)
+
+
+def accept_snapshot(
+    machines: list[dict], skipped_brands: list[str] = (), path: str = SNAPSHOT_PATH
+) -> dict:
+    """
+    Makes `machines` the accepted catalog. Machines of skipped brands (not scraped this
+    time) are carried over from the previous snapshot so they are not lost.
+    """
+    previous = load_snapshot(path)
+    carried = []
+    if previous and skipped_brands:
+        carried = [m for m in previous["machines"] if m.get("brand") in skipped_brands]
+    snapshot = {
+        "accepted_at": time.time(),
+        "machines": list(_by_key(machines).values()) + carried,
+    }
+    _write(snapshot, path)
+    return snapshot
+
+
+def print_delta_summary(delta: dict) -> None:
+    print(
+        f"Catalog delta: {len(delta['added'])} added, {len(delta['removed'])} removed, "
+        f"{len(delta['changed'])} changed"
+    )
+    field_counts = defaultdict(int)
+    for change in delta["changed"]:
+        for field in change["fields"]:
+            field_counts[field] += 1
+    if field_counts:
+        print("  changed fields: " + ", ".join(f"{f} {n}" for f, n in field_counts.items()))
+    if delta["skipped_brands"]:
+        print(
+            "  skipped (no machines scraped, kept as in the snapshot): "
+            + ", ".join(delta["skipped_brands"])
+        )
+
+
+def run_diff(accept: bool = False) -> None:
+    """
+    Compares the scraped machines with the last accepted snapshot and writes the delta
+    to init_data/catalog_delta.json for `preprocess --delta` and `upload_machine --delta`.
+
+    With `accept`, the current scrape becomes the new snapshot instead (run it once the
+    delta has been processed downstream). Before the first accept every machine is added.
+    """
+    from process.preprocess import Preprocessor
+
+    print("======== Starting Catalog Diff ========")
+    current = Preprocessor().read_scraped_machines()
+    if current is None:
+        return
+
+    snapshot = load_snapshot()
+    previous = snapshot["machines"] if snapshot else []
+    if snapshot:
+        accepted_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(snapshot["accepted_at"]))
+        print(f"Comparing {len(current)} scraped machines with the snapshot of {accepted_at}")
+    else:
+        print(f"No accepted snapshot at {SNAPSHOT_PATH}: every machine is new.")
+
+    delta = diff_catalogs(previous, current)
+    print_delta_summary(delta)
+
+    if accept:
+        accepted = accept_snapshot(current, delta["skipped_brands"])
+        print(f"Accepted {len(accepted['machines'])} machines as the new snapshot: {SNAPSHOT_PATH}")
+    else:
+        delta["created_at"] = time.time()
+        delta["snapshot_accepted_at"] = snapshot["accepted_at"] if snapshot else None
+        _write(delta, DELTA_PATH)
+        print(f"Wrote the delta to {DELTA_PATH}")
+    print("======== Catalog Diff Finished ========")
@@ -0,0 +1,130 @@
+import logging
+import time
+
+from utils.html_backends import PARSER_BACKENDS, item_strainer, parse_document
+from utils.page_archive import PageArchive
+from utils.storefront_api import StorefrontApiScraper
+
+
+def _recorded_urls(entry, recorded: set[str]) -> list[str]:
+    """The entry's listing URLs found in the archive (paginated entries: consecutive pages)."""
+    if entry.pagination is None:
+        return entry.urls if all(url in recorded for url in entry.urls) else []
+
+    urls = []
+    pagination = entry.pagination
+    for page in range(pagination.start, pagination.start + pagination.max_pages):
+        url = pagination.url(page)
+        if url not in recorded:
+            break
+        urls.append(url)
+    return urls
+
+
+def _time_entry(
+    entry, urls: list[str], archive: PageArchive, backend: str, repeat: int
+) -> tuple[float, float, int]:
+    """Returns (parse seconds, extract seconds, item count) for one entry's archived pages."""
+    scraper = entry.build()
+    # "bs4-partial" parses only the item_selector subtrees (partial_parse)
+    partial = backend == "bs4-partial"
+    if partial and item_strainer(scraper.item_selector) is None:
+        raise ValueError("item_selector is not simple enough for partial parsing")
+    backend = "bs4" if partial else backend
+    scraper.parser_backend = backend
+    parse_time = extract_time = 0.0
+    item_count = 0
+    for url in urls:
+        html = archive.read(url)
+        for _ in range(repeat):
+            started = time.perf_counter()
+            document = parse_document(
+                html, backend, scraper.item_selector if partial else None
+            )
+            parse_time += time.perf_counter() - started
+
+            scraper.current_base_url = scraper._get_base_url(url)
+            started = time.perf_counter()
+            items = scraper.extract_items(document)
+            extract_time += time.perf_counter() - started
+        item_count += len(items)
+    return parse_time / repeat, extract_time / repeat, item_count
+
+
+def run_parser_benchmark(
+    archive: str,
+    backends: list[str] | None = None,
+    brands: list[str] | None = None,
+    series: list[str] | None = None,
+    repeat: int = 3,
+) -> None:
+    """
+    Times parsing and item extraction per SCRAP_CONFIG entry for each parser backend,
+    using pages from a recorded archive (see `scrap --record`) so runs are comparable.
+    """
+    backends = backends or [*PARSER_BACKENDS, "bs4-partial"]
+    # Per-item logs would dominate the timings
+    logging.disable(logging.WARNING)
+    try:
+        _report(archive, backends, brands, series, repeat)
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def _report(
+    archive: str,
+    backends: list[str],
+    brands: list[str] | None,
+    series: list[str] | None,
+    repeat: int,
+) -> None:
+    from process.scraping import select_entries
+
+    with PageArchive.activate(archive, "replay") as page_archive:
+        recorded = set(page_archive.urls())
+        entries = [
+            (entry, urls)
+            for entry in select_entries(brands, series)
+            # JSON API scrapers have no HTML to parse
+            if not isinstance(entry.build(), StorefrontApiScraper)
+            and (urls := _recorded_urls(entry, recorded))
+        ]
+        if not entries:
+            print(f"No SCRAP_CONFIG entries have all of their pages in {archive}.")
+            return
+
+        header = f"{'entry':<40}{'items':>6}"
+        header += "".join(f"{backend:>22}" for backend in backends)
+        print(f"Parse + extract time per entry (ms, mean of {repeat} runs)")
+        print(header)
+        print("-" * len(header))
+
+        totals = {backend: 0.0 for backend in backends}
+        for entry, urls in entries:
+            row = ""
+            counts = set()
+            for backend in backends:
+                try:
+                    parse_time, extract_time, count = _time_entry(
+                        entry, urls, page_archive, backend, repeat
+                    )
+                except ImportError as e:
+                    row += f"{'missing: ' + (e.name or backend):>22}"
+                    continue
+                except ValueError:
+                    row += f"{'n/a':>22}"
+                    continue
+                totals[backend] += parse_time + extract_time
+                counts.add(count)
+                row += f"{parse_time * 1000:>10.1f} +{extract_time * 1000:>8.1f} ms"
+            item_count = str(max(counts)) if counts else "-"
+            row = f"{entry.label[:39]:<40}{item_count:>6}" + row
+            if len(counts) > 1:
+                row += f"  (item counts differ: {sorted(counts)})"
+            print(row)
+
+        print("-" * len(header))
+        print(
+            f"{'total':<46}"
+            + "".join(f"{totals[backend] * 1000:>19.1f} ms" for backend in backends)
+        )
@@ -1,5 +1,14 @@
 import json
 import os
+import re
+
+from process.catalog_diff import DELTA_PATH, delta_machines, load_delta
+from utils.dedup_index import dedup_key
+from utils.jsonl_writer import read_jsonl
+
+# Scraper output files end in the Unix time the run started: <brand>_<series>_machines_<ts>.jsonl
+SCRAPED_FILE_TIMESTAMP = re.compile(r"_(\d+)\.jsonl?$")
+
 
 class Preprocessor:
     """
@@ -15,6 +24,7 @@ class Preprocessor:
         self.scraped_data_dir = os.path.join(self.data_setup_dir, "scraped_data")
         self.output_dir = os.path.join(self.data_setup_dir, "init_data")
         self.output_file = os.path.join(self.output_dir, "machines.json")
+        self.delta_output_file = os.path.join(self.output_dir, "machines_delta.json")
 
     def _read_json(self, file_path):
         """Reads and returns data from a JSON file."""
@@ -28,6 +38,14 @@ class Preprocessor:
             print(f"Error: Could not decode JSON from {file_path}")
             return None
 
+    def _read_jsonl(self, file_path):
+        """Reads one machine per line from a JSON Lines file written by the scrapers."""
+        try:
+            return list(read_jsonl(file_path))
+        except FileNotFoundError:
+            print(f"Error: File not found at {file_path}")
+            return None
+
     def _write_json(self, data, file_path):
         """Writes data to a JSON file."""
         if not os.path.exists(os.path.dirname(file_path)):
@@ -36,38 +54,85 @@ class Preprocessor:
             json.dump(data, f, indent=4, ensure_ascii=False)
         print(f"Successfully wrote {len(data)} items to {file_path}")
 
-    def run(self):
+    def _scraped_file_time(self, filename):
+        """When a scraped file was written: its timestamp suffix, or its mtime if it has none."""
+        match = SCRAPED_FILE_TIMESTAMP.search(filename)
+        if match:
+            return int(match.group(1))
+        return os.path.getmtime(os.path.join(self.scraped_data_dir, filename))
+
+    def read_scraped_machines(self):
         """
-        Executes the full preprocessing pipeline: merging and normalizing scraped data.
+        Reads every machine from the scraped JSON / JSON Lines files, oldest file first
+        (by the timestamp in the file name, or mtime). Rows with the same dedup key
+        (utils/dedup_index.py) are collapsed and the one from the newest file wins, so a
+        page re-scraped by `scrap --discover` replaces the listing row it took over.
+        Returns None if the directory is missing.
         """
-        print("======== Starting Data Preprocessing ========")
         if not os.path.exists(self.scraped_data_dir):
             print(f"Error: Scraped data directory not found at {self.scraped_data_dir}")
-            return
-
-        all_machines, all_keys = [], set()
+            return None
 
-        print("Reading files and collecting keys...")
-        for filename in os.listdir(self.scraped_data_dir):
+        machines = {}
+        row_count = 0
+        filenames = sorted(
+            os.listdir(self.scraped_data_dir),
+            key=lambda name: (self._scraped_file_time(name), name),
+        )
+        for filename in filenames:
+            filepath = os.path.join(self.scraped_data_dir, filename)
             if filename.endswith(".json"):
-                filepath = os.path.join(self.scraped_data_dir, filename)
                 data = self._read_json(filepath)
-                if data:
-                    for machine in data:
-                        if "detail" in machine and isinstance(machine.get("detail"), dict):
-                            machine.update(machine.pop("detail"))
-                        all_machines.append(machine)
-                        all_keys.update(machine.keys())
+            elif filename.endswith(".jsonl"):
+                data = self._read_jsonl(filepath)
+            else:
+                continue
+            for machine in data or []:
+                machines[dedup_key(machine)] = machine
+                row_count += 1
+        if row_count > len(machines):
+            print(f"Collapsed {row_count - len(machines)} superseded rows from earlier scrapes.")
+        return list(machines.values())
+
+    def run(self, delta=False):
+        """
+        Executes the full preprocessing pipeline: merging and normalizing scraped data.
+
+        With `delta`, only the added and changed machines of the last `diff`
+        (init_data/catalog_delta.json) are normalized, into machines_delta.json.
+        """
+        print("======== Starting Data Preprocessing ========")
+        if delta:
+            catalog_delta = load_delta()
+            if catalog_delta is None:
+                print(f"Error: No catalog delta found at {DELTA_PATH}. Run `diff` first.")
+                return
+            print("Reading machines from the catalog delta...")
+            machines = delta_machines(catalog_delta)
+            output_file = self.delta_output_file
+        else:
+            print("Reading files and collecting keys...")
+            machines = self.read_scraped_machines()
+            if machines is None:
+                return
+            output_file = self.output_file
+
+        all_machines, all_keys = [], set()
+        for machine in machines:
+            if "detail" in machine and isinstance(machine.get("detail"), dict):
+                machine.update(machine.pop("detail"))
+            all_machines.append(machine)
+            all_keys.update(machine.keys())
 
         print(f"Found {len(all_keys)} unique keys across {len(all_machines)} machines.")
 
         print("Normalizing machine objects...")
         normalized_machines = [{key: machine.get(key) for key in all_keys} for machine in all_machines]
 
-        self._write_json(normalized_machines, self.output_file)
+        self._write_json(normalized_machines, output_file)
         print("======== Preprocessing Finished ========")
 
-def run_preprocessing():
+def run_preprocessing(delta=False):
     """Initializes and runs the main Preprocessor."""
     preprocessor = Preprocessor()
-    preprocessor.run()
\ No newline at end of file
+    preprocessor.run(delta=delta)
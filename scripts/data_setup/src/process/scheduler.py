@@ -0,0 +1,235 @@
+import multiprocessing
+import queue
+import signal
+import sys
+import time
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+
+from utils.model import ScrapEntry
+
+
+@dataclass
+class JobResult:
+    index: int  # position in SCRAP_CONFIG (children rebuild the entry from it)
+    label: str
+    brand: str
+    needs_browser: bool
+    status: str = "pending"  # ok / failed / timeout
+    attempts: int = 0
+    duration: float = 0.0
+    item_count: int = 0
+    error: str | None = None
+    # HttpCache / ConnectionStats counters reported by each attempt's child process
+    http_stats: list[dict] = field(default_factory=list)
+
+
+def _terminate_on_sigterm(signum, frame) -> None:
+    # Raising SystemExit lets the WebDriver pool and archive context managers close Chrome.
+    sys.exit(1)
+
+
+def _run_job(
+    index: int,
+    replay: str | None,
+    drivers_per_job: int,
+    discover: bool,
+    results: multiprocessing.Queue,
+) -> None:
+    """Child process entry point: scrapes one SCRAP_CONFIG entry and reports the item count."""
+    signal.signal(signal.SIGTERM, _terminate_on_sigterm)
+
+    from config.scrap import SCRAP_CONFIG
+    from utils.checkpoint import CheckpointStore
+    from utils.dedup_index import DedupIndex
+    from utils.page_archive import PageArchive
+    from utils.webdriver_pool import WebDriverPool
+
+    entry = SCRAP_CONFIG[index]
+    try:
+        with ExitStack() as stack:
+            if replay:
+                stack.enter_context(PageArchive.activate(replay, "replay"))
+            driver_pool = WebDriverPool.shared()
+            driver_pool.max_drivers = drivers_per_job
+            stack.enter_context(driver_pool)
+            scraper = entry.build()
+            scraper.scrap(
+                entry.scrape_targets(scraper, discover),
+                keep_items=False,
+                checkpoint=CheckpointStore(),
+                dedup=DedupIndex(),
+            )
+        results.put((index, "ok", scraper.last_item_count, None, _http_stats()))
+    except Exception as e:
+        results.put((index, "failed", 0, f"{type(e).__name__}: {e}", _http_stats()))
+
+
+def _http_stats() -> dict:
+    """This process's cache and connection counters (lost when the child exits otherwise)."""
+    from utils.http_cache import HttpCache
+    from utils.http_client import HttpClient
+
+    return {
+        "cache": HttpCache.shared().counters(),
+        "connections": HttpClient.shared().stats.counters(),
+    }
+
+
+class ScrapScheduler:
+    """
+    Runs SCRAP_CONFIG entries in separate processes.
+
+    Browser and non-browser jobs have their own slot limits, so the number of Chrome
+    instances stays at most `browser_slots * drivers_per_job` however many HTTP jobs run.
+    Jobs exceeding `job_timeout` seconds are terminated; failed or timed-out jobs are
+    retried up to `retries` times.
+    """
+
+    def __init__(
+        self,
+        browser_slots: int = 2,
+        http_slots: int = 4,
+        job_timeout: float = 1800,
+        retries: int = 1,
+        drivers_per_job: int = 1,
+        replay: str | None = None,
+        discover: bool = False,
+    ) -> None:
+        self.browser_slots = browser_slots
+        self.http_slots = http_slots
+        self.job_timeout = job_timeout
+        self.retries = retries
+        self.drivers_per_job = drivers_per_job
+        self.replay = replay
+        self.discover = discover
+        # spawn: children start clean instead of inheriting the parent's threads and locks
+        self._context = multiprocessing.get_context("spawn")
+
+    def run(self, entries: list[ScrapEntry]) -> list[JobResult]:
+        from config.scrap import SCRAP_CONFIG
+
+        jobs = {}
+        for entry in entries:
+            index = next(i for i, e in enumerate(SCRAP_CONFIG) if e is entry)
+            jobs[index] = JobResult(
+                index=index,
+                label=entry.label,
+                brand=entry.brand,
+                needs_browser=entry.needs_browser,
+            )
+
+        results = self._context.Queue()
+        reported: dict[int, tuple] = {}
+        pending = deque(jobs)
+        running: dict[int, tuple[multiprocessing.Process, float]] = {}
+
+        while pending or running:
+            self._start_jobs(jobs, pending, running, results)
+            self._drain(results, reported)
+
+            now = time.perf_counter()
+            for index, (process, started) in list(running.items()):
+                job = jobs[index]
+                if process.is_alive() and now - started > self.job_timeout:
+                    print(f"[{job.label}] timed out after {self.job_timeout:.0f}s, terminating")
+                    self._stop(process)
+                    self._drain(results, reported)
+                    reported.pop(index, None)
+                    job.status, job.error = "timeout", f"exceeded {self.job_timeout:.0f}s"
+                elif process.is_alive():
+                    continue
+                else:
+                    process.join()
+                    self._drain(results, reported)
+                    message = reported.pop(index, None)
+                    if message is None:
+                        job.status, job.item_count = "failed", 0
+                        job.error = f"process exited with code {process.exitcode}"
+                    else:
+                        _, job.status, job.item_count, job.error, stats = message
+                        job.http_stats.append(stats)
+
+                job.duration += now - started
+                del running[index]
+                if job.status != "ok" and job.attempts <= self.retries:
+                    print(f"[{job.label}] {job.status}: {job.error}; retrying")
+                    pending.append(index)
+
+            time.sleep(0.2)
+
+        results.close()
+        return list(jobs.values())
+
+    def _start_jobs(self, jobs, pending, running, results) -> None:
+        """Starts as many pending jobs as the browser/HTTP slots allow."""
+        browser_running = sum(jobs[i].needs_browser for i in running)
+        http_running = len(running) - browser_running
+
+        for _ in range(len(pending)):
+            index = pending.popleft()
+            job = jobs[index]
+            if job.needs_browser and browser_running >= self.browser_slots:
+                pending.append(index)
+                continue
+            if not job.needs_browser and http_running >= self.http_slots:
+                pending.append(index)
+                continue
+
+            process = self._context.Process(
+                target=_run_job,
+                args=(index, self.replay, self.drivers_per_job, self.discover, results),
+                name=f"scrap-{index}",
+            )
+            process.start()
+            job.attempts += 1
+            running[index] = (process, time.perf_counter())
+            if job.needs_browser:
+                browser_running += 1
+            else:
+                http_running += 1
+            print(f"[{job.label}] started (attempt {job.attempts}, pid {process.pid})")
+
+    @staticmethod
+    def _drain(results: multiprocessing.Queue, reported: dict[int, tuple]) -> None:
+        while True:
+            try:
+                message = results.get_nowait()
+            except queue.Empty:
+                return
+            reported[message[0]] = message
+
+    @staticmethod
+    def _stop(process: multiprocessing.Process, grace: float = 15) -> None:
+        """SIGTERM first so the child can quit its browsers, then SIGKILL."""
+        process.terminate()
+        process.join(grace)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+def print_summary(results: list[JobResult]) -> None:
+    """Prints per-job and per-brand durations and item counts."""
+    print(f"\n{'job':<45}{'status':>9}{'tries':>7}{'time':>9}{'items':>7}")
+    print("-" * 77)
+    for job in results:
+        print(
+            f"{job.label[:44]:<45}{job.status:>9}{job.attempts:>7}"
+            f"{job.duration:>8.1f}s{job.item_count:>7}"
+        )
+        if job.status != "ok" and job.error:
+            print(f"    {job.error}")
+
+    brands: dict[str, list[JobResult]] = {}
+    for job in results:
+        brands.setdefault(job.brand, []).append(job)
+
+    print(f"\n{'brand':<30}{'jobs ok':>9}{'time':>10}{'items':>8}")
+    print("-" * 57)
+    for brand, jobs in brands.items():
+        ok = sum(job.status == "ok" for job in jobs)
+        duration = sum(job.duration for job in jobs)
+        items = sum(job.item_count for job in jobs)
+        print(f"{brand[:29]:<30}{f'{ok}/{len(jobs)}':>9}{duration:>9.1f}s{items:>8}")
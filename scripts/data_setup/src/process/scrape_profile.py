@@ -0,0 +1,105 @@
+from collections import defaultdict
+from pathlib import Path
+
+from utils.scrape_metrics import read_metrics
+
+# Phases in pipeline order (unknown phases are listed after these)
+PHASE_ORDER = [
+    "wait",
+    "connect",
+    "ttfb",
+    "transfer",
+    "decode",
+    "navigate",
+    "browser_action",
+    "page_source",
+    "browser_extract",
+    "parse",
+    "detail_prefetch",
+    "extract_item",
+]
+
+# Wall-clock spans around other recorded spans (detail_prefetch wraps the detail-page
+# fetches, which record their own connect/ttfb/.../parse spans). They are reported as
+# markers and left out of every total and share so that time is not counted twice.
+WALL_CLOCK_PHASES = {"detail_prefetch"}
+
+
+def print_profile_report(path: str | Path, top: int = 10) -> None:
+    """
+    Prints the slowest brands, phases and URLs from a metrics file written during
+    `scrap` (see utils/scrape_metrics.py). Times are summed over spans, so with
+    concurrency a brand's total can exceed the wall-clock time of the run.
+    WALL_CLOCK_PHASES (detail_prefetch) only wrap other spans: their rows show the
+    wall-clock time but no share, and they are excluded from the brand, URL and
+    overall totals.
+    """
+    records = read_metrics(path) if Path(path).exists() else []
+    if not records:
+        print(f"No timing data recorded in {path}.")
+        return
+
+    brand_phases: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    brand_urls: dict[str, set[str]] = defaultdict(set)
+    phase_totals: dict[str, float] = defaultdict(float)
+    phase_spans: dict[str, int] = defaultdict(int)
+    item_count = 0
+    url_totals: dict[tuple[str, str], float] = defaultdict(float)
+
+    for record in records:
+        brand = record["brand"] or "-"
+        if record["series"]:
+            brand = f"{brand} / {record['series']}"
+        phase, seconds = record["phase"], record["seconds"]
+        brand_urls[brand].add(record["url"])
+        phase_totals[phase] += seconds
+        phase_spans[phase] += 1
+        if phase in WALL_CLOCK_PHASES:
+            continue
+        brand_phases[brand][phase] += seconds
+        if phase == "extract_item":
+            item_count += record["count"]
+        url_totals[(brand, record["url"])] += seconds
+
+    total = sum(
+        seconds for phase, seconds in phase_totals.items() if phase not in WALL_CLOCK_PHASES
+    )
+    print(f"\nScrape profile ({len(records)} spans, {total:.1f}s summed): {path}")
+
+    print(f"\nSlowest brands (top {top})")
+    print(f"{'brand':<40}{'pages':>6}{'time':>10}  top phases")
+    print("-" * 90)
+    brand_totals = {brand: sum(phases.values()) for brand, phases in brand_phases.items()}
+    for brand, seconds in sorted(brand_totals.items(), key=lambda kv: -kv[1])[:top]:
+        phases = sorted(brand_phases[brand].items(), key=lambda kv: -kv[1])[:3]
+        top_phases = ", ".join(f"{phase} {value:.2f}s" for phase, value in phases)
+        print(f"{brand[:39]:<40}{len(brand_urls[brand]):>6}{seconds:>9.2f}s  {top_phases}")
+
+    print("\nTime by phase")
+    print(f"{'phase':<18}{'spans':>7}{'total':>10}{'mean':>11}{'share':>8}")
+    print("-" * 54)
+    order = {phase: i for i, phase in enumerate(PHASE_ORDER)}
+    for phase in sorted(phase_totals, key=lambda p: (order.get(p, len(order)), p)):
+        seconds = phase_totals[phase]
+        spans = phase_spans[phase]
+        mean = f"{seconds / spans * 1000:.1f}ms"
+        if phase in WALL_CLOCK_PHASES:
+            share = f"{'wall':>8}"
+        else:
+            share = f"{seconds / total * 100 if total else 0:>7.1f}%"
+        print(f"{phase:<18}{spans:>7}{seconds:>9.2f}s{mean:>11}{share}")
+    if phase_spans["ttfb"]:
+        # "connect" is only recorded for requests that opened a new connection
+        reused = 1 - phase_spans["connect"] / phase_spans["ttfb"]
+        print(
+            f"connections: {phase_spans['connect']} opened for {phase_spans['ttfb']} "
+            f"requests (reuse {reused:.0%})"
+        )
+    if item_count:
+        per_item = phase_totals["extract_item"] / item_count * 1000
+        print(f"extract_item_info: {item_count} items, {per_item:.2f}ms per item")
+
+    print(f"\nSlowest URLs (top {top})")
+    print("-" * 90)
+    for (brand, url), seconds in sorted(url_totals.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"{seconds:>8.2f}s  {brand[:25]:<26}{url}")
@@ -1,32 +1,259 @@
+import asyncio
 import os
 import shutil
+import time
+from pathlib import Path
 
+from process.scheduler import ScrapScheduler, print_summary
+from process.scrape_profile import print_profile_report
+from utils.async_fetcher import AsyncFetcher
+from utils.checkpoint import CheckpointStore
+from utils.dedup_index import DedupIndex
+from utils.discovery import DiscoveryState
+from utils.http_cache import HttpCache
+from utils.http_client import ConnectionStats, HttpClient
+from utils.model import ScrapEntry
+from utils.page_archive import PageArchive
+from utils.scrape_metrics import ScrapeMetrics
+from utils.webdriver_pool import WebDriverPool
 
-def run_scraping() -> None:
-    """Runs all scraping tasks."""
-    print("Running scraping tasks...")
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_setup_dir = os.path.dirname(os.path.dirname(script_dir))
-    data_dir = os.path.join(data_setup_dir, "scraped_data")
+async def _scrap_concurrently(
+    entries: list[ScrapEntry],
+    concurrency: int,
+    checkpoint: CheckpointStore,
+    dedup: DedupIndex,
+    discover: bool = False,
+) -> None:
+    """Runs SCRAP_CONFIG entries concurrently, at most `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_entry(entry: ScrapEntry) -> None:
+        async with semaphore:
+            try:
+                scraper = entry.build()
+                await scraper.scrap_async(
+                    entry.scrape_targets(scraper, discover),
+                    fetcher,
+                    keep_items=False,
+                    checkpoint=checkpoint,
+                    dedup=dedup,
+                )
+            except Exception as e:
+                print(f"Scraping failed for {entry.label}: {e}")
+
+    async with AsyncFetcher() as fetcher:
+        await asyncio.gather(*(run_entry(entry) for entry in entries))
 
-    answer = (
-        input("기존에 수집된 데이터를 모두 삭제하고 새로 수집하시겠습니까? (y/n): ")
-        .strip()
-        .lower()
+
+def _scrap_in_processes(
+    entries: list[ScrapEntry],
+    processes: int,
+    max_browsers: int,
+    job_timeout: float,
+    retries: int,
+    discover: bool = False,
+) -> None:
+    """
+    Runs the entries through the multi-process scheduler and prints its summary, with
+    the HTTP cache and connection counters of all child processes added up.
+    """
+    archive = PageArchive.current()
+    scheduler = ScrapScheduler(
+        browser_slots=max_browsers,
+        http_slots=processes,
+        job_timeout=job_timeout,
+        retries=retries,
+        replay=str(archive.path) if archive and archive.replaying else None,
+        discover=discover,
+    )
+    print(
+        f"Scraping {len(entries)} entries in up to {processes} HTTP + "
+        f"{max_browsers} browser processes..."
     )
-    if answer == "y":
+    started = time.perf_counter()
+    results = scheduler.run(entries)
+    print_summary(results)
+    print(f"\nScraped {len(entries)} entries in {time.perf_counter() - started:.1f}s")
+
+    cache, connections = HttpCache.shared(), ConnectionStats()
+    for job in results:
+        for stats in job.http_stats:
+            cache.merge(stats["cache"])
+            connections.merge(stats["connections"])
+    print(cache.summary())
+    print(connections.summary())
+
+
+def select_entries(
+    brands: list[str] | None = None, series: list[str] | None = None
+) -> list[ScrapEntry]:
+    """Returns the SCRAP_CONFIG entries matching the brand/series filters."""
+    from config.scrap import SCRAP_CONFIG
+
+    return [entry for entry in SCRAP_CONFIG if entry.matches(brands, series)]
+
+
+def _clear_scraped_data(data_dir: str, entries: list[ScrapEntry] | None = None) -> None:
+    """Deletes scraped files, either all of them or only those of the given entries."""
+    if entries is None:
         if os.path.exists(data_dir):
             shutil.rmtree(data_dir)
         os.makedirs(data_dir)
-    elif answer == "n":
-        pass
+        return
+
+    if not os.path.isdir(data_dir):
+        os.makedirs(data_dir)
+        return
+
+    prefixes = tuple(
+        f"{entry.brand}_{entry.series}_" if entry.series else f"{entry.brand}_"
+        for entry in entries
+    )
+    for filename in os.listdir(data_dir):
+        if filename.startswith(prefixes):
+            os.remove(os.path.join(data_dir, filename))
+
+
+def run_scraping(
+    concurrency: int = 1,
+    max_browsers: int = 2,
+    brands: list[str] | None = None,
+    series: list[str] | None = None,
+    record: str | None = None,
+    replay: str | None = None,
+    processes: int = 0,
+    job_timeout: float = 1800,
+    retries: int = 1,
+    fresh: bool = False,
+    profile: bool = False,
+    discover: bool = False,
+) -> None:
+    """
+    Runs all scraping tasks (optionally limited to some brands/series).
+
+    With `record`, every fetched page is also saved to a compressed archive;
+    with `replay`, pages are served from such an archive with no network or browser.
+    With `processes`, entries run in separate processes (see process/scheduler.py):
+    up to `processes` HTTP-only jobs plus `max_browsers` Selenium jobs at a time.
+
+    By default the run resumes: URLs recorded as finished in the checkpoint store are
+    skipped and only failed or missing ones are scraped. With `fresh`, previous results,
+    checkpoints and dedup index entries (of the selected entries) are deleted first.
+
+    Machines already scraped by another page or entry (same normalized brand, name and
+    image URL, see utils/dedup_index.py) are dropped before they are written, so
+    overlapping SCRAP_CONFIG entries don't produce duplicate uploads and Gemini calls.
+
+    With `discover`, entries with a `discovery` (sitemap or product feed), and Shopify /
+    WooCommerce entries through their collection feeds, scrape the product pages listed
+    there instead of their listing pages, and only those that are new or whose lastmod
+    changed since they were last scraped (utils/discovery.py). Other entries are scraped
+    from their listing pages as usual.
+
+    Per-URL phase timings (request, decode, parse, browser actions, item extraction)
+    are written to a JSON Lines file under .cache/metrics; with `profile` the slowest
+    brands, phases and URLs are printed at the end.
+    """
+    if record and replay:
+        print("--record and --replay cannot be used together.")
+        return
+    if record and processes:
+        print("--record cannot be combined with --processes (one archive per process).")
+        return
+
+    if record or replay:
+        mode = "record" if record else "replay"
+        with PageArchive.activate(record or replay, mode) as archive:
+            print(f"Page archive ({mode}): {archive.path}")
+            run_scraping(
+                concurrency,
+                max_browsers,
+                brands,
+                series,
+                processes=processes,
+                job_timeout=job_timeout,
+                retries=retries,
+                fresh=fresh,
+                profile=profile,
+                discover=discover,
+            )
+        return
+
+    print("Running scraping tasks...")
+
+    entries = select_entries(brands, series)
+    if not entries:
+        print(f"No SCRAP_CONFIG entries match brand={brands} series={series}.")
+        return
+    print(f"Selected {len(entries)} entries: {', '.join(e.label for e in entries)}")
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    data_setup_dir = os.path.dirname(os.path.dirname(script_dir))
+    data_dir = os.path.join(data_setup_dir, "scraped_data")
+
+    checkpoint = CheckpointStore()
+    dedup = DedupIndex()
+    filtered = bool(brands or series)
+    if fresh:
+        # With a brand/series filter only the selected entries' files are replaced
+        print("Fresh run: deleting previous results, checkpoints, dedup index and discovery state.")
+        _clear_scraped_data(data_dir, entries if filtered else None)
+        scraper_keys = [entry.build().checkpoint_key for entry in entries] if filtered else None
+        checkpoint.clear(scraper_keys)
+        dedup.clear(scraper_keys)
+        DiscoveryState().clear(scraper_keys)
     else:
-        print("잘못된 입력입니다. 'y' 또는 'n'을 입력해주세요.")
+        os.makedirs(data_dir, exist_ok=True)
+        counts = checkpoint.counts()
+        print(
+            f"Resuming: {counts.get('done', 0)} pages done, "
+            f"{counts.get('failed', 0)} failed in earlier runs (use --fresh to start over)."
+        )
+
+    metrics_path = ScrapeMetrics.start_run()
+    print(f"Timing metrics: {metrics_path}")
+    run_started = time.time()
+
+    if processes > 0:
+        _scrap_in_processes(entries, processes, max_browsers, job_timeout, retries, discover)
+        print(dedup.summary(since=run_started))
+        _finish_metrics(metrics_path, profile)
         return
 
-    from config.scrap import SCRAP_CONFIG
+    # Selenium scrapers borrow browsers from the shared pool; close them all at the end.
+    driver_pool = WebDriverPool.shared()
+    driver_pool.max_drivers = max_browsers
+    started = time.perf_counter()
+    with driver_pool:
+        if concurrency > 1:
+            print(f"Scraping {len(entries)} entries with concurrency {concurrency}...")
+            asyncio.run(
+                _scrap_concurrently(entries, concurrency, checkpoint, dedup, discover)
+            )
+        else:
+            for entry in entries:
+                try:
+                    scraper = entry.build()
+                    scraper.scrap(
+                        entry.scrape_targets(scraper, discover),
+                        keep_items=False,
+                        checkpoint=checkpoint,
+                        dedup=dedup,
+                    )
+                except Exception as e:
+                    print(f"Scraping failed for {entry.label}: {e}")
+
+    print(f"Scraped {len(entries)} entries in {time.perf_counter() - started:.1f}s")
+    print(HttpCache.shared().summary())
+    print(dedup.summary(since=run_started))
+    http_client = HttpClient.shared()
+    print(http_client.stats.summary())
+    http_client.close()
+    _finish_metrics(metrics_path, profile)
+
 
-    for config in SCRAP_CONFIG:
-        scraper = config["scraper"]
-        scraper.scrap(config["urls"])
+def _finish_metrics(metrics_path: Path, profile: bool) -> None:
+    ScrapeMetrics.shared().close()
+    if profile:
+        print_profile_report(metrics_path)
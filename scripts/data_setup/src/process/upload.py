@@ -2,6 +2,8 @@ import json
 import os
 
 from config.supabase import SUPABASE_URL
+from process.catalog_diff import DELTA_PATH, PREVIOUS_NAME_KEY, load_delta
+from utils.http_client import HttpClient
 from utils.supabase_manager import SupabaseManager
 
 
@@ -60,25 +62,43 @@ def run_brand_data_upload(sb_manager: SupabaseManager):
     print("--- Brand Data Upload Finished ---")
 
 
-def run_machine_image_upload(sb_manager: SupabaseManager):
+def _machine_files(delta: bool) -> tuple[str, str, str]:
+    """
+    Returns the (preprocessed, with Supabase URLs, ready for the database) machine files,
+    either for the full catalog or for the catalog delta (`preprocess --delta`).
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    data_setup_dir = os.path.dirname(os.path.dirname(script_dir))
+    prefix = os.path.join(
+        data_setup_dir, "init_data", "machines_delta" if delta else "machines"
+    )
+    return (
+        f"{prefix}.json",
+        f"{prefix}_with_supabase_urls.json",
+        f"{prefix}_with_supabase_urls_and_preprocessed.json",
+    )
+
+
+def run_machine_image_upload(sb_manager: SupabaseManager, delta: bool = False):
     """
     Reads machine data, uploads images to Supabase if they haven't been uploaded yet,
     and saves a new JSON with updated URLs. This process is idempotent.
+    With `delta`, only the machines of the catalog delta are processed.
     """
     print("\n--- Starting Machine Image Upload ---")
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_setup_dir = os.path.dirname(os.path.dirname(script_dir))
-
-    source_file = os.path.join(data_setup_dir, "init_data", "machines.json")
-    output_file = os.path.join(
-        data_setup_dir, "init_data", "machines_with_supabase_urls.json"
-    )
+    source_file, output_file, _ = _machine_files(delta)
 
     # If the output file already exists,
     # use it as the source to make the script resumable.
     # Otherwise, use the original machine data.
-    if os.path.exists(output_file):
+    # (A delta output is only resumed if it belongs to the current delta.)
+    resumable = os.path.exists(output_file) and (
+        not delta
+        or not os.path.exists(source_file)
+        or os.path.getmtime(output_file) >= os.path.getmtime(source_file)
+    )
+    if resumable:
         print(f"Resuming from existing file: {output_file}")
         input_to_process = output_file
     else:
@@ -135,15 +155,15 @@ def run_machine_image_upload(sb_manager: SupabaseManager):
     print("--- Machine Image Upload Finished ---")
 
 
-def run_machine_data_upload(sb_manager: SupabaseManager):
-    """Uploads machine data from the JSON file to the Supabase 'machines' table."""
+def run_machine_data_upload(sb_manager: SupabaseManager, delta: bool = False):
+    """
+    Uploads machine data from the JSON file to the Supabase 'machines' table.
+    With `delta`, renamed machines update their existing row (matched by the previous
+    name) and the rest are upserted.
+    """
     print("\n--- Starting Machine Data Upload ---")
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_setup_dir = os.path.dirname(os.path.dirname(script_dir))
-    json_path = os.path.join(
-        data_setup_dir, "init_data", "machines_with_supabase_urls_and_preprocessed.json"
-    )
+    _, _, json_path = _machine_files(delta)
     table_name = "machines"
 
     try:
@@ -158,27 +178,32 @@ def run_machine_data_upload(sb_manager: SupabaseManager):
         print(f"Error decoding JSON from {json_path}. Skipping machine data upload.")
         return
 
+    if delta:
+        renamed = [m for m in machines_data if m.get(PREVIOUS_NAME_KEY)]
+        machines_data = [m for m in machines_data if not m.get(PREVIOUS_NAME_KEY)]
+        for machine in renamed:
+            previous_name = machine.pop(PREVIOUS_NAME_KEY)
+            sb_manager.update_in_table(
+                table_name=table_name,
+                data=machine,
+                match={"brand_id": machine["brand_id"], "name": previous_name},
+            )
+
     sb_manager.upsert_to_table(table_name=table_name, data=machines_data)
     print("--- Machine Data Upload Finished ---")
 
 
-def process_machine_json_for_database(sb_manager: SupabaseManager):
+def process_machine_json_for_database(sb_manager: SupabaseManager, delta: bool = False):
     """
     Processes machines_with_supabase_urls.json to prepare for database upload:
     1. Removes 'price' and 'detail' fields
     2. Converts 'brand' to 'brand_id' by looking up brands table
     3. Overwrites the original JSON file with cleaned data
+    With `delta`, the delta files are used and renamed machines keep their previous name.
     """
     print("\n--- Starting Machine JSON Processing ---")
 
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_setup_dir = os.path.dirname(os.path.dirname(script_dir))
-    input_path = os.path.join(
-        data_setup_dir, "init_data", "machines_with_supabase_urls.json"
-    )
-    output_path = os.path.join(
-        data_setup_dir, "init_data", "machines_with_supabase_urls_and_preprocessed.json"
-    )
+    _, input_path, output_path = _machine_files(delta)
 
     # Load current machine data
     with open(input_path, "r", encoding="utf-8") as f:
@@ -203,7 +228,8 @@ def process_machine_json_for_database(sb_manager: SupabaseManager):
         processed_machine = {}
 
         # Copy fields we want to keep
-        for field in ["image_url", "name", "type"]:
+        fields = ["image_url", "name", "type"] + ([PREVIOUS_NAME_KEY] if delta else [])
+        for field in fields:
             if field in machine:
                 processed_machine[field] = machine[field]
 
@@ -249,13 +275,28 @@ def run_brand_uploads():
     print("======== All Upload Tasks Finished ========")
 
 
-def run_machine_uploads():
-    """Initializes the manager and runs all machine upload tasks."""
+def run_machine_uploads(delta: bool = False):
+    """
+    Initializes the manager and runs all machine upload tasks.
+    With `delta`, only the machines of the catalog delta (`preprocess --delta`) are
+    uploaded; removed machines are listed but left in the database.
+    """
     print("======== Starting All Machine Upload Tasks ========")
+    if delta:
+        catalog_delta = load_delta()
+        if catalog_delta is None:
+            print(f"No catalog delta found at {DELTA_PATH}. Run `diff` first.")
+            return
+        for machine in catalog_delta["removed"]:
+            print(
+                "  Removed from the brand site (not deleted): "
+                f"{machine['brand']} - {machine['name']}"
+            )
     sb_manager = SupabaseManager()
-    run_machine_image_upload(sb_manager)
-    process_machine_json_for_database(sb_manager)
-    run_machine_data_upload(sb_manager)
+    run_machine_image_upload(sb_manager, delta)
+    process_machine_json_for_database(sb_manager, delta)
+    run_machine_data_upload(sb_manager, delta)
+    print(HttpClient.shared().stats.summary())
     print("======== All Machine Upload Tasks Finished ========")
 
 
@@ -11,6 +11,8 @@ LexcoScraperConfig = ScraperConfig(
     item_selector="div.item",
     name_selector="div.tit",
     image_selector="img",
+    # 목록 페이지가 크고 아이템 밖의 요소는 쓰지 않으므로 아이템 서브트리만 파싱
+    partial_parse=True,
 )
 
 
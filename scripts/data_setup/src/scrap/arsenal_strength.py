@@ -2,7 +2,7 @@ import logging
 
 from bs4.element import Tag
 from utils.base_scraper import BaseScraper
-from utils.model import ScraperConfig
+from utils.model import FAST_BROWSER_PROFILE, ScraperConfig
 
 logger = logging.getLogger(__name__)
 
@@ -11,26 +11,25 @@ ArsenalStrengthScraperConfig = ScraperConfig(
     item_selector="form.item.h-full.product.product-item.product_addtocart_form",
     name_selector="a.product-item-link",
     image_selector="img.object-contain",
+    browser_profile=FAST_BROWSER_PROFILE,
+    extract_in_browser=True,
 )
 
 
 class ArsenalStrengthScraper(BaseScraper):
+    use_selenium = True
+
     def __init__(self, machine_series: str, type_: str):
         super().__init__(
             ArsenalStrengthScraperConfig,
             contain_series=False,
-            use_selenium=True,
         )
         self.type_ = type_
         self.machine_series = machine_series
 
     def handle_browser_action(self) -> None:
-        """Load More 버튼을 반복적으로 클릭"""
-        if not self.driver:
-            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
-        import time
-
-        time.sleep(5)
+        """아이템 목록이 다 그려질 때까지 대기"""
+        self.wait_for_items()
 
     def extract_additional_info(self, item: Tag) -> dict:
         return {"type": self.type_}
@@ -1,35 +1,23 @@
 import logging
 
-from bs4 import Tag
-from utils.base_scraper import BaseScraper
 from utils.model import ScraperConfig
+from utils.storefront_api import WooCommerceScraper
 
 logger = logging.getLogger(__name__)
 
-BootyBuilderScraperConfig = ScraperConfig(
-    brand_name="Booty Builder",
-    item_selector="div.product-small.col",
-    name_selector="a.woocommerce-LoopProduct-link.woocommerce-loop-product__link",
-    image_selector="img.attachment-woocommerce_thumbnail",
-)
+# bootybuilder.com (WooCommerce Store API)
+BootyBuilderScraperConfig = ScraperConfig(brand_name="Booty Builder")
 
 
-class BootyBuilderScraper(BaseScraper):
+class BootyBuilderScraper(WooCommerceScraper):
     def __init__(self, type_: str = "Selectorized"):
-        super().__init__(BootyBuilderScraperConfig, contain_series=False, use_selenium=True)
+        super().__init__(BootyBuilderScraperConfig, contain_series=False)
         self.machine_series = ""
         self.type_ = type_
 
-    def extract_additional_info(self, item: Tag) -> dict[str, str]:
+    def extract_additional_info(self, item: dict) -> dict[str, str]:
         return {"type": self.type_}
 
-    def handle_browser_action(self):
-        if not self.driver:
-            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
-        import time
-
-        time.sleep(120)
-
 
 if __name__ == "__main__":
     scraper = BootyBuilderScraper(type_="Plate-loaded")
@@ -1,19 +1,15 @@
 import logging
 
-from utils.base_scraper import BaseScraper
 from utils.model import ScraperConfig
+from utils.storefront_api import ShopifyScraper
 
 logger = logging.getLogger(__name__)
 
-CybexScraperConfig = ScraperConfig(
-    brand_name="Cybex",
-    item_selector="div.productitem__container",
-    name_selector="span.visually-hidden",
-    image_selector="img",
-)
+# bestgymequipment.co.uk (Shopify) 컬렉션을 products.json으로 수집
+CybexScraperConfig = ScraperConfig(brand_name="Cybex")
 
 
-class CybexScraper(BaseScraper):
+class CybexScraper(ShopifyScraper):
     def __init__(self):
         super().__init__(CybexScraperConfig, contain_series=False)
         self.machine_series = ""
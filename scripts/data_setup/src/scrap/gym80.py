@@ -12,7 +12,9 @@ Gym80ScraperConfig = ScraperConfig(
     brand_name="Gym80",
     item_selector="div.collection-item.w-dyn-item",
     name_selector="h2.product_name.text_white",
-    image_selector="div.product_image"
+    image_selector="div.product_image",
+    # 목록 페이지가 크고 아이템 밖의 요소는 쓰지 않으므로 아이템 서브트리만 파싱
+    partial_parse=True,
 )
 
 
@@ -24,7 +26,7 @@ class Gym80Scraper(BaseScraper):
 
     def extract_image_url(self, item: Tag) -> str:
 
-        bg_elem = item.select_one(self.image_selector)
+        bg_elem = self.image_matcher.select_one(item)
         style = bg_elem.attrs.get("style", "") if bg_elem else ""
 
         # background-image:url("...") 패턴 추출
@@ -1,27 +1,21 @@
 import logging
 
-from bs4 import Tag
-
-from utils.base_scraper import BaseScraper
 from utils.model import ScraperConfig
+from utils.storefront_api import ShopifyScraper
 
 logger = logging.getLogger(__name__)
 
-GymlecoScraperConfig = ScraperConfig(
-    brand_name="Gymleco",
-    item_selector="div.block-inner-inner",
-    name_selector="div.product-block__title.product-block-title",
-    image_selector="img.theme-img",
-)
+# gymleco.com (Shopify)
+GymlecoScraperConfig = ScraperConfig(brand_name="Gymleco")
 
 
-class GymlecoScraper(BaseScraper):
+class GymlecoScraper(ShopifyScraper):
     def __init__(self, type_: str = "Selectorized"):
         super().__init__(GymlecoScraperConfig, contain_series=False)
         self.machine_series = ""
         self.type_ = type_
 
-    def extract_additional_info(self, item: Tag) -> dict[str, str]:
+    def extract_additional_info(self, item: dict) -> dict[str, str]:
         return {"type": self.type_}
 
 
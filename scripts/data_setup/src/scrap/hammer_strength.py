@@ -4,7 +4,7 @@ import re
 from bs4 import Tag
 
 from utils.base_scraper import BaseScraper
-from utils.model import ScraperConfig
+from utils.model import FAST_BROWSER_PROFILE, ScraperConfig
 
 logger = logging.getLogger(__name__)
 
@@ -12,22 +12,25 @@ HammerStrengthScraperConfig = ScraperConfig(
     brand_name="Hammer Strength",
     item_selector="a.product-grid--item",
     name_selector="span.product-grid--item-name",
-    image_selector="div.product-grid--item-image"
+    image_selector="div.product-grid--item-image",
+    browser_profile=FAST_BROWSER_PROFILE,
+    extract_in_browser=True,
 )
 
 
 class HammerStrengthScraper(BaseScraper):
+    use_selenium = True
+
     def __init__(self):
         super().__init__(
             HammerStrengthScraperConfig,
             contain_series=False,
-            use_selenium=True
         )
         self.machine_series = ""
 
     def extract_image_url(self, item: Tag) -> str:
         """div 태그의 background-image 스타일에서 이미지 URL 추출"""
-        image_elem = item.select_one(self.image_selector)
+        image_elem = self.image_matcher.select_one(item)
         if not image_elem:
             return ""
 
@@ -42,11 +45,8 @@ class HammerStrengthScraper(BaseScraper):
         return ""
 
     def handle_browser_action(self):
-        if not self.driver:
-            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
-        import time
-
-        time.sleep(10)
+        """아이템 목록이 다 그려질 때까지 대기"""
+        self.wait_for_items()
 
 
 if __name__ == "__main__":
@@ -1,21 +1,15 @@
 import logging
 
-from bs4 import Tag
-
-from utils.base_scraper import BaseScraper
 from utils.model import ScraperConfig
+from utils.storefront_api import ShopifyScraper
 
 logger = logging.getLogger(__name__)
 
-HoistScraperConfig = ScraperConfig(
-    brand_name="Hoist",
-    item_selector="div.product_line_card_div",
-    name_selector="h6",
-    image_selector="img",
-)
+# hoistfitness.com (Shopify)
+HoistScraperConfig = ScraperConfig(brand_name="Hoist")
 
 
-class HoistScraper(BaseScraper):
+class HoistScraper(ShopifyScraper):
     def __init__(self, type_: str):
         super().__init__(
             HoistScraperConfig,
@@ -24,40 +18,22 @@ class HoistScraper(BaseScraper):
         self.machine_series = ""
         self.type_ = type_
 
-    def extract_name(self, item):
-        name_elem = item.select_one(self.name_selector)
-        if name_elem is None:
-            raise ValueError(
-                f"Name element not found with selector: {self.name_selector}"
-            )
-
-        name = name_elem.get_text(strip=True)
+    def extract_name(self, item: dict) -> str:
+        name = super().extract_name(item)
 
         # ' - ' 이후의 부분 제거
         name = name.split(" - ")[0].strip()
 
+        # 모델 코드 (예: CF-3155)는 variant SKU
+        code = self.variant_sku(item).replace('"', "").strip()
+        return f"{name} {code}" if code else name
 
-        code_elem = item.select("h6")[1]
-        code = code_elem.get_text(strip=True).replace('"', "").strip()
-
-        return name + " " + code
-
-    def extract_image_url(self, item):
-        img_elem = item.select_one(self.image_selector)
-        if img_elem is None:
-            raise ValueError(
-                f"Image element not found with selector: {self.image_selector}"
-            )
-
-        img_url = img_elem.attrs.get("src", "")
-        return "https:" + img_url
-
-    def extract_additional_info(self, item: Tag):
+    def extract_additional_info(self, item: dict):
         return {"type": self.type_}
 
 
 if __name__ == "__main__":
-    scraper = HoistScraper()
+    scraper = HoistScraper("Plate-loaded")
     urls = ["https://www.hoistfitness.com/collections/ccat-plate-loaded"]
     items = scraper.scrap(urls)
     for item in items:
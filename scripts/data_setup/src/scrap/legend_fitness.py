@@ -21,7 +21,7 @@ class LegendFitnessScraper(BaseScraper):
         self.type_ = type_
 
     def extract_name(self, item: Tag) -> str:
-        name_elem = item.select_one(self.name_selector)
+        name_elem = self.name_matcher.select_one(item)
         if name_elem is None:
             raise ValueError(
                 f"Name element not found with selector: {self.name_selector}"
@@ -1,13 +1,8 @@
 import logging
-import time
 
 from bs4 import Tag
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
 from utils.base_scraper import BaseScraper
-from utils.model import ScraperConfig
+from utils.model import FAST_BROWSER_PROFILE, ScraperConfig
 
 logger = logging.getLogger(__name__)
 
@@ -16,17 +11,22 @@ MatrixScraperConfig = ScraperConfig(
     item_selector="div.card.list-group-item.h-100",
     name_selector="a.card-text.ng-star-inserted",
     image_selector="img.card-img-top",
+    browser_profile=FAST_BROWSER_PROFILE,
+    extract_in_browser=True,
 )
 
 
 class MatrixScraper(BaseScraper):
+    use_selenium = True
+
     def __init__(self, type_: str = "Selectorized"):
-        super().__init__(MatrixScraperConfig, contain_series=False, use_selenium=True)
+        super().__init__(MatrixScraperConfig, contain_series=False)
         self.machine_series = ""
         self.type_ = type_
+        self.browser_selectors = ("small",)
 
     def extract_name(self, item: Tag) -> str:
-        name_elem = item.select_one(self.name_selector)
+        name_elem = self.name_matcher.select_one(item)
         if name_elem is None:
             raise ValueError(
                 f"Name element not found with selector: {self.name_selector}"
@@ -42,26 +42,8 @@ class MatrixScraper(BaseScraper):
         return name + " " + code
 
     def handle_browser_action(self) -> None:
-        """Load More 버튼을 반복적으로 클릭"""
-        if not self.driver:
-            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
-
-        try:
-            time.sleep(5)
-            while True:
-                # Load More 버튼 찾기
-                button = "button.btn.btn-primary.ng-star-inserted"
-
-                load_more_button = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, button))
-                )
-                self.driver.execute_script("arguments[0].click();", load_more_button)
-                logger.info("Load More 버튼 클릭됨 (JavaScript)")
-                # 새로운 콘텐츠 로드 대기
-                time.sleep(3)
-
-        except (TimeoutException, NoSuchElementException):
-            logger.info("더 이상 Load More 버튼이 없습니다")
+        """Load More 버튼을 아이템이 더 늘지 않을 때까지 클릭"""
+        self.load_more_until_stable("button.btn.btn-primary.ng-star-inserted")
 
     def extract_additional_info(self, item: Tag) -> dict[str, str]:
         return {"type": self.type_}
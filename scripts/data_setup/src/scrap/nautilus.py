@@ -1,25 +1,21 @@
 import logging
 
-from utils.base_scraper import BaseScraper
 from utils.model import ScraperConfig
+from utils.storefront_api import ShopifyScraper
 
 logger = logging.getLogger(__name__)
 
-NautilusScraperConfig = ScraperConfig(
-    brand_name="Nautilus",
-    item_selector="li.grid__item",
-    name_selector="a.full-unstyled-link",
-    image_selector="img.motion-reduce",
-)
+# shop.corehandf.com (Shopify)
+NautilusScraperConfig = ScraperConfig(brand_name="Nautilus")
 
 
-class NautilusScraper(BaseScraper):
+class NautilusScraper(ShopifyScraper):
     def __init__(self, type_: str = "Selectorized"):
         super().__init__(NautilusScraperConfig, contain_series=False)
         self.machine_series = ""
         self.type_ = type_
 
-    def extract_additional_info(self, item) -> dict[str, str]:
+    def extract_additional_info(self, item: dict) -> dict[str, str]:
         return {"type": self.type_}
 
 
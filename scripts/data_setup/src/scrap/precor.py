@@ -1,9 +1,9 @@
 import logging
-import time
 
 from bs4 import Tag
 
 from utils.base_scraper import BaseScraper
+from utils.image_variants import select_image_url
 from utils.model import ScraperConfig
 
 logger = logging.getLogger(__name__)
@@ -28,16 +28,16 @@ class PrecorScraper(BaseScraper):
 
     def extract_image_url(self, item: Tag) -> str:
 
-        image_elem = item.select_one(self.image_selector)
+        image_elem = self.image_matcher.select_one(item)
         if image_elem is None:
             raise ValueError(
                 f"Image element not found with selector: {self.image_selector}"
             )
-        img_url = image_elem.attrs.get("src", "")
-        return str(img_url)
+        img_url = select_image_url(image_elem.attrs, self.image_target_width)
+        return str(img_url or "")
 
     def handle_browser_action(self) -> None:
-        time.sleep(3)  # 페이지 로딩 대기
+        self.wait_for_items()  # 페이지 로딩 대기
 
 
 if __name__ == "__main__":
@@ -1,13 +1,8 @@
 import logging
-import time
 
-from bs4 import BeautifulSoup, Tag
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from bs4 import Tag
 from utils.base_scraper import BaseScraper
-from utils.model import ScraperConfig
+from utils.model import FAST_BROWSER_PROFILE, ScraperConfig
 
 logger = logging.getLogger(__name__)
 
@@ -16,19 +11,32 @@ VilitiScraperConfig = ScraperConfig(
     item_selector="a.list_type_inner",
     name_selector="li.name",
     image_selector="img.item_img",
+    browser_profile=FAST_BROWSER_PROFILE,
+    extract_in_browser=True,
 )
 
 
 class VilitiScraper(BaseScraper):
+    use_selenium = True
+    # 상세 페이지도 JS로 그려지므로 풀의 브라우저로 동시 요청
+    detail_use_selenium = True
+
     def __init__(self, type_: str = "Selectorized"):
-        super().__init__(VilitiScraperConfig, contain_series=False, use_selenium=True)
+        super().__init__(VilitiScraperConfig, contain_series=False)
         self.machine_series = ""
         self.type_ = type_
+        # 가격(목록)과 상품명(상세 페이지)도 브라우저 안에서 선택
+        self.browser_selectors = (
+            "li.saleprice em",
+            "h2.product_headline.product_display_name",
+        )
 
-    def extract_name(self, item: Tag) -> str:
+    def extract_detail_url(self, item: Tag) -> str:
         href = item.attrs.get("href")
-        detail_url = f"https://kaesun.com{href}"
-        detail_soup = self.fetch_page(detail_url, use_selenium=True)
+        return f"https://kaesun.com{href}"
+
+    def extract_name(self, item: Tag) -> str:
+        detail_soup = self.get_detail_page(item)
 
         name_elem = detail_soup.select_one("h2.product_headline.product_display_name")
         if name_elem is None:
@@ -40,35 +48,8 @@ class VilitiScraper(BaseScraper):
         return name
 
     def handle_browser_action(self) -> None:
-        """Load More 버튼을 반복적으로 클릭"""
-        if not self.driver:
-            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
-
-        try:
-
-            time.sleep(5)
-            len_items_before = 0
-            while True:
-                # Load More 버튼 찾기
-                button = "div.product_paging.product_paging_1.animate a"
-
-                load_more_button = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, button))
-                )
-                self.driver.execute_script("arguments[0].click();", load_more_button)
-                logger.info("Load More 버튼 클릭됨 (JavaScript)")
-                # 새로운 콘텐츠 로드 대기
-                time.sleep(3)
-                page_source = self.driver.page_source  # type: ignore
-                soup = BeautifulSoup(page_source, "lxml")
-                items = soup.select(self.item_selector)
-                len_items = len(items)
-                if len_items == len_items_before:
-                    break
-                len_items_before = len_items
-
-        except (TimeoutException, NoSuchElementException):
-            logger.info("더 이상 Load More 버튼이 없습니다")
+        """Load More 버튼을 아이템이 더 늘지 않을 때까지 클릭"""
+        self.load_more_until_stable("div.product_paging.product_paging_1.animate a")
 
     def extract_additional_info(self, item: Tag) -> dict[str, str]:
         import re
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+from urllib.parse import urlparse
+
+import httpx
+from utils.http_cache import HttpCache
+from utils.http_client import HttpClient, ConnectionTrace, detect_encoding
+from utils.rate_limiter import RateLimiter
+from utils.scrape_metrics import RequestTimings
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFetcher:
+    """
+    호스트별 동시 요청 수를 제한하는 비동기 페이지 fetcher.
+    연결 설정(HTTP/2, 타임아웃, 호스트별 연결 수)과 재사용 통계는 HttpClient와 공유합니다.
+    """
+
+    def __init__(
+        self,
+        per_host_limit: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_client: HttpClient | None = None,
+    ) -> None:
+        self.http_client = http_client or HttpClient.shared()
+        self.per_host_limit = per_host_limit
+        self.rate_limiter = rate_limiter or RateLimiter.shared()
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._client: httpx.AsyncClient | None = None
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._host_semaphores:
+            limit = self.per_host_limit or self.http_client.connections_for(host)
+            self._host_semaphores[host] = asyncio.Semaphore(limit)
+        return self._host_semaphores[host]
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        self._client = self.http_client.async_client(default_encoding=detect_encoding)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_text(
+        self,
+        url: str,
+        cache: HttpCache | None = None,
+        cache_ttl: float = 0,
+        timings: dict[str, float] | None = None,
+    ) -> str:
+        """
+        URL의 본문을 디코딩된 문자열로 반환 (호스트별 동시성 제한 적용).
+        timings를 주면 단계별 시간(wait / connect / ttfb / transfer / decode, 초)을 채웁니다.
+        """
+        if self._client is None:
+            raise RuntimeError("AsyncFetcher는 async with 블록 안에서 사용해야 합니다")
+
+        cached = cache.get(url) if cache else None
+        if cache and cached and cached.is_fresh(cache_ttl):
+            cache.record_hit(cached)
+            return cached.text
+
+        timings = timings if timings is not None else {}
+        trace = RequestTimings()
+
+        async def get() -> httpx.Response:
+            # 재시도하면 마지막 시도의 시간만 남김
+            trace.phases.clear()
+            connection_trace = ConnectionTrace(trace.atrace)
+            response = await self._client.get(
+                url, headers=headers, extensions={"trace": connection_trace.atrace}
+            )
+            self.http_client.record(url, connection_trace, response)
+            return response
+
+        host = urlparse(url).netloc
+        started = time.perf_counter()
+        async with self._semaphore(host):
+            logger.info(f"비동기 페이지 요청: {url}")
+            headers = cached.conditional_headers() if cached else {}
+            try:
+                response = await self.rate_limiter.send_async(url, get)
+            finally:
+                timings.update(trace.phases)
+                # 호스트 동시성 제한과 요청 제한 대기, 재시도 백오프
+                timings["wait"] = time.perf_counter() - started - sum(trace.phases.values())
+
+        if cache and cached and response.status_code == 304:
+            cache.touch(cached)
+            cache.record_hit(cached, revalidated=True)
+            return cached.text
+
+        response.raise_for_status()
+        decode_started = time.perf_counter()
+        text = response.text
+        timings["decode"] = time.perf_counter() - decode_started
+        if cache:
+            cache.record_miss()
+            cache.store(url, text, len(response.content), response.headers)
+        return text
+
+    async def fetch_all(self, urls: list[str]) -> list[str]:
+        """여러 URL을 동시에 가져와 입력 순서대로 반환"""
+        return list(await asyncio.gather(*(self.fetch_text(url) for url in urls)))
@@ -1,21 +1,42 @@
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import threading
 import time
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterator
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
+import httpx
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from utils.model import Machine, ScraperConfig
+from utils.async_fetcher import AsyncFetcher
+from utils.checkpoint import CheckpointStore, items_hash
+from utils.dedup_index import DedupIndex
+from utils.discovery import DiscoveredUrl, DiscoveryState, discover_urls
+from utils.html_backends import (
+    BROWSER_EXTRACT_SCRIPT,
+    BrowserNode,
+    CompiledSelector,
+    HtmlNode,
+    compile_selector,
+    parse_document,
+)
+from utils.http_cache import HttpCache
+from utils.http_client import HttpClient, detect_encoding
+from utils.image_variants import resize_image_url, select_image_url
+from utils.jsonl_writer import JsonlWriter
+from utils.model import Discovery, Machine, Pagination, ScraperConfig
+from utils.page_archive import PageArchive
+from utils.rate_limiter import RateLimiter
+from utils.scrape_metrics import RequestTimings, ScrapeMetrics
+from utils.webdriver_pool import WebDriverPool
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,153 +44,798 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 내비게이션 로드 시간과 문서 + 리소스 전송량 (Timing-Allow-Origin이 없는 외부 리소스는 0으로 집계됨)
+_PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+let bytes = nav ? nav.transferSize : 0;
+for (const r of resources) bytes += r.transferSize || 0;
+const loadEnd = nav && nav.loadEventEnd > 0 ? nav.loadEventEnd : performance.now();
+return {load_ms: loadEnd - (nav ? nav.startTime : 0), bytes: bytes, resources: resources.length};
+"""
+
+# 문서 응답의 HTTP 상태 (Chrome 109+, 지원하지 않으면 0)
+_NAVIGATION_STATUS_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+return nav && nav.responseStatus ? nav.responseStatus : 0;
+"""
+
+
+def _is_not_found(error: Exception) -> bool:
+    """httpx의 404 오류인지 (페이지네이션 끝으로 간주)"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 404
+
 
 class BaseScraper:
     """머신 스크래퍼 베이스"""
 
+    # 목록/상세 페이지를 WebDriver 풀의 브라우저로 가져오는지 (클래스에 지정하면
+    # 스케줄러가 스크래퍼를 만들기 전에 브라우저 슬롯이 필요한 작업인지 알 수 있음)
+    use_selenium: bool = False
+    detail_use_selenium: bool = False  # 정적 페이지면 HTTP 요청, 아니면 풀의 브라우저 사용
+
     def __init__(
         self,
         scraper_config: ScraperConfig,
         contain_series: bool = True,
-        use_selenium: bool = False,
+        use_selenium: bool | None = None,
         selenium_timeout: int = 120,
+        driver_pool: WebDriverPool | None = None,
     ) -> None:
-        self.session = requests.Session()
-        # User-Agent 설정으로 차단 방지
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            }
-        )
+        # 호스트별 연결 풀을 모든 스크래퍼와 이미지 로더가 공유 (User-Agent 포함)
+        self.http_client = HttpClient.shared()
 
         # 설정 파일에서 브랜드별 설정 로드
         self.brand_name = scraper_config.brand_name
         self.item_selector = scraper_config.item_selector
         self.name_selector = scraper_config.name_selector
         self.image_selector = scraper_config.image_selector
+        # ScraperConfig 검증 때 컴파일된 선택자 (모든 페이지/아이템에서 재사용)
+        self.item_matcher = self._matcher(scraper_config.item_selector, scraper_config)
+        self.name_matcher = self._matcher(scraper_config.name_selector, scraper_config)
+        self.image_matcher = self._matcher(scraper_config.image_selector, scraper_config)
         self.machine_series = scraper_config.machine_series
         self.contain_series = contain_series
+        self.use_http_cache = scraper_config.use_http_cache
+        self.cache_ttl = scraper_config.cache_ttl
+        self.parser_backend = scraper_config.parser_backend
+        self.partial_parse = scraper_config.partial_parse
+        self.image_target_width = scraper_config.image_target_width
         self.current_base_url = None  # 현재 처리 중인 페이지의 베이스 URL 저장
+        self.current_url = None
 
-        # Selenium 설정
-        self.use_selenium = use_selenium
-        self.driver = None
+        # Selenium 설정 (WebDriver는 fetch 시점에 풀에서 빌려 사용)
+        if use_selenium is not None:
+            self.use_selenium = use_selenium
         self.selenium_timeout = selenium_timeout
+        self.driver_pool = driver_pool
+        self.browser_profile = scraper_config.browser_profile
+        self.extract_in_browser = scraper_config.extract_in_browser
+        # extract_in_browser일 때 name/image 선택자 외에 훅에서 사용하는 선택자
+        # (아이템 안과 문서 전체에서 실행, 예: 가격 요소나 상세 페이지의 제목)
+        self.browser_selectors: tuple[str, ...] = ()
+        self._local = threading.local()
+        self._browser_stats = {"pages": 0, "load_ms": 0.0, "bytes": 0}
+        self._browser_stats_lock = threading.Lock()
+
+        # 상세 페이지 2단계 수집 (extract_detail_url을 구현한 스크래퍼만 사용)
+        self.detail_workers = 8
+        self._detail_pages: dict[str, HtmlNode] = {}
+
+        # 사이트맵/피드로 찾아 이번 실행에서 수집할 페이지 (수집 URL -> 찾은 URL과 lastmod)
+        self.discovery_state: DiscoveryState | None = None
+        self._discovered: dict[str, DiscoveredUrl] = {}
+
+        # 마지막 scrap 실행의 JSONL 출력 파일과 아이템 수
+        self.output_path: str | None = None
+        self.last_item_count = 0
+
+    @staticmethod
+    def _matcher(selector: str, scraper_config: ScraperConfig) -> CompiledSelector | None:
+        return compile_selector(selector, scraper_config.parser_backend) if selector else None
+
+    @property
+    def driver(self) -> WebDriver | None:
+        """현재 스레드가 풀에서 빌려 쓰고 있는 WebDriver (fetch 중에만 유효)"""
+        return getattr(self._local, "driver", None)
+
+    def fetch_page(self, url: str, use_selenium: bool = False) -> HtmlNode:
+        """목록 페이지를 가져와 파싱된 문서로 반환"""
         if use_selenium:
-            self._setup_selenium()
-
-    def _setup_selenium(self) -> None:
-        """Selenium WebDriver 설정"""
-        chrome_options = Options()
-
-        # Bot 감지 우회를 위한 설정들
-        # chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-plugins")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # Bot 감지 우회 핵심 설정들
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        # 더 현실적인 User-Agent
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
+            return self.fetch_page_with_selenium(url, items_only=True)
+        else:
+            return self.fetch_page_with_requests(url, items_only=True)
 
-        # webdriver-manager를 사용하여 자동으로 chromedriver를 설치하고 로드합니다.
-        self.driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()), options=chrome_options
+    def fetch_page_with_requests(self, url: str, items_only: bool = False) -> HtmlNode:
+        """HTTP 요청으로 정적 페이지를 가져옴"""
+        return self._parse_page(url, self._load_html(url, self._request_html), items_only)
+
+    def fetch_page_with_selenium(
+        self, url: str, run_browser_action: bool = True, items_only: bool = False
+    ) -> HtmlNode:
+        """Selenium을 사용한 동적 페이지 처리"""
+        if self.extract_in_browser and PageArchive.current() is None:
+            # 페이지 아카이브는 HTML이 필요하므로 기록/재생 중에는 기존 방식 사용
+            return self._browser_document(url, run_browser_action)
+        html = self._load_html(
+            url, lambda page_url: self._browser_html(page_url, run_browser_action)
         )
+        return self._parse_page(url, html, items_only)
 
-        if not self.driver:
-            raise RuntimeError("Selenium WebDriver 초기화 실패")
+    async def fetch_page_async(self, url: str, fetcher: AsyncFetcher) -> HtmlNode:
+        """비동기 fetch 모드 (Selenium 스크래퍼는 별도 스레드에서 기존 방식으로 처리)"""
+        if self.use_selenium:
+            return await asyncio.to_thread(
+                self.fetch_page_with_selenium, url, items_only=True
+            )
 
-    def __del__(self):
-        """소멸자에서 WebDriver 종료"""
-        if hasattr(self, "driver") and self.driver:
-            self.driver.quit()
+        archive = PageArchive.current()
+        if archive and archive.replaying:
+            return self._parse_page(url, archive.read(url), items_only=True)
 
-    def fetch_page(self, url: str, use_selenium: bool = False) -> BeautifulSoup:
-        """웹페이지를 가져오고 BeautifulSoup 객체로 반환"""
-        if use_selenium:
-            return self.fetch_page_with_selenium(url)
-        else:
-            return self.fetch_page_with_requests(url)
+        timings: dict[str, float] = {}
+        try:
+            html = await fetcher.fetch_text(
+                url,
+                cache=HttpCache.shared() if self.use_http_cache else None,
+                cache_ttl=self.cache_ttl,
+                timings=timings,
+            )
+        except Exception as e:
+            logger.error(f"비동기 페이지 요청 실패: {url}, 오류: {e}")
+            raise
+        finally:
+            self._record_timings(timings, url)
+        logger.info(f"페이지 성공적으로 로드됨: {url}")
+
+        if archive:
+            archive.write(url, html)
+        return self._parse_page(url, html, items_only=True)
+
+    def _span(self, phase: str, url: str):
+        """이 스크래퍼(브랜드/시리즈)의 단계 시간을 메트릭 파일에 기록하는 컨텍스트"""
+        return ScrapeMetrics.shared().span(phase, url, self.brand_name, self.machine_series)
+
+    def _record_timings(self, timings: dict[str, float], url: str) -> None:
+        ScrapeMetrics.shared().record_phases(
+            timings, url, self.brand_name, self.machine_series
+        )
+
+    def _parse_page(self, url: str, html: str, items_only: bool) -> HtmlNode:
+        with self._span("parse", url):
+            return self.parse_html(html, items_only)
+
+    def _load_html(self, url: str, loader: Callable[[str], str]) -> str:
+        """페이지 아카이브가 활성화되어 있으면 기록하거나 (replay 시) 대신 제공"""
+        archive = PageArchive.current()
+        if archive and archive.replaying:
+            return archive.read(url)
+
+        html = loader(url)
+        if archive:
+            archive.write(url, html)
+        return html
+
+    def _request_html(self, url: str) -> str:
+        """공유 HTTP 클라이언트로 HTML을 가져옴 (디스크 HTTP 캐시 적용)"""
+        cache = HttpCache.shared() if self.use_http_cache else None
+        cached = cache.get(url) if cache else None
+        if cache and cached and cached.is_fresh(self.cache_ttl):
+            cache.record_hit(cached)
+            return cached.text
+
+        timings: dict[str, float] = {}
+        trace = RequestTimings()
+
+        def get() -> httpx.Response:
+            # 재시도하면 마지막 시도의 시간만 남김
+            trace.phases.clear()
+            return self.http_client.get(url, headers=headers, trace=trace)
 
-    def fetch_page_with_requests(self, url: str) -> BeautifulSoup:
-        """requests를 사용한 기존 방식"""
         try:
             logger.info(f"페이지 요청: {url}")
-            response = self.session.get(url, timeout=600)
+            headers = cached.conditional_headers() if cached else {}
+            started = time.perf_counter()
+            try:
+                response = RateLimiter.shared().send(url, get)
+            finally:
+                timings.update(trace.phases)
+                # 요청 제한 대기와 재시도 백오프
+                timings["wait"] = time.perf_counter() - started - sum(trace.phases.values())
+
+            if cache and cached and response.status_code == 304:
+                cache.touch(cached)
+                cache.record_hit(cached, revalidated=True)
+                return cached.text
+
             response.raise_for_status()
 
             # 인코딩 설정
-            response.encoding = response.apparent_encoding
+            with self._span("decode", url):
+                response.encoding = detect_encoding(response.content)
+                text = response.text
+
+            if cache:
+                cache.record_miss()
+                cache.store(url, text, len(response.content), response.headers)
 
-            soup = BeautifulSoup(response.text, "lxml")
             logger.info(f"페이지 성공적으로 로드됨: {url}")
-            return soup
+            return text
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"페이지 요청 실패: {url}, 오류: {e}")
             raise
+        finally:
+            self._record_timings(timings, url)
+
+    def _browser_html(self, url: str, run_browser_action: bool = True) -> str:
+        """풀에서 빌린 WebDriver로 페이지를 열고 브라우저 액션 후의 HTML을 반환"""
+
+        def page_source(driver: WebDriver) -> str:
+            with self._span("page_source", url):
+                return driver.page_source
+
+        return self._in_browser(url, run_browser_action, page_source)
+
+    def _browser_document(self, url: str, run_browser_action: bool = True) -> BrowserNode:
+        """
+        브라우저 안에서 item_selector, name/image 선택자와 browser_selectors를 실행해
+        요소의 속성과 텍스트만 JSON으로 받음 (전체 HTML 전송과 재파싱 없음)
+        """
+        item_selectors = [
+            selector
+            for selector in dict.fromkeys(
+                (self.name_selector, self.image_selector, *self.browser_selectors)
+            )
+            if selector
+        ]
+
+        def extract(driver: WebDriver) -> BrowserNode:
+            with self._span("browser_extract", url):
+                data = driver.execute_script(
+                    BROWSER_EXTRACT_SCRIPT,
+                    self.item_selector,
+                    item_selectors,
+                    list(self.browser_selectors),
+                )
+            return BrowserNode(data)
 
-    def fetch_page_with_selenium(self, url: str) -> BeautifulSoup:
-        """Selenium을 사용한 동적 페이지 처리"""
-        try:
-            logger.info(f"Selenium으로 페이지 요청: {url}")
-            self.driver.get(url)  # type: ignore
+        return self._in_browser(url, run_browser_action, extract)
 
-            # 페이지 로드 대기
-            WebDriverWait(self.driver, self.selenium_timeout).until(  # type: ignore
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            # 브라우저 액션 (오버라이드 가능)
-            self.handle_browser_action()
+    def _in_browser(
+        self,
+        url: str,
+        run_browser_action: bool,
+        read: Callable[[WebDriver], Any],
+    ) -> Any:
+        """풀에서 빌린 WebDriver로 페이지를 열고 브라우저 액션 후 read(driver)의 결과를 반환"""
+        pool = self.driver_pool or WebDriverPool.shared()
+        try:
+            with pool.driver(self.browser_profile) as driver:
+                self._local.driver = driver
+                try:
+                    logger.info(f"Selenium으로 페이지 요청: {url}")
+                    started = time.perf_counter()
+                    with self._span("navigate", url):
+                        self._navigate(driver, url)
+
+                        # 페이지 로드 대기
+                        WebDriverWait(driver, self.selenium_timeout).until(
+                            EC.presence_of_element_located((By.TAG_NAME, "body"))
+                        )
+                    # 브라우저 액션 (오버라이드 가능, 상세 페이지에서는 생략)
+                    if run_browser_action:
+                        with self._span("browser_action", url):
+                            self.handle_browser_action()
+
+                    # 최종 HTML 또는 추출 결과 가져오기
+                    result = read(driver)
+                    self._log_browser_metrics(driver, url, time.perf_counter() - started)
+                finally:
+                    self._local.driver = None
 
-            # 최종 HTML 가져오기
-            page_source = self.driver.page_source  # type: ignore
-            soup = BeautifulSoup(page_source, "lxml")
             logger.info(f"Selenium으로 페이지 성공적으로 로드됨: {url}")
-            return soup
+            return result
 
         except Exception as e:
             logger.error(f"Selenium 페이지 요청 실패: {url}, 오류: {e}")
             raise
 
+    def _navigate(self, driver: WebDriver, url: str) -> None:
+        """요청 제한을 지켜 페이지를 열고, 429/5xx 응답이면 백오프 후 다시 연다"""
+        limiter = RateLimiter.shared()
+        attempt = 0
+        while True:
+            limiter.wait(url)
+            driver.get(url)
+            try:
+                status = driver.execute_script(_NAVIGATION_STATUS_SCRIPT) or 200
+            except Exception:
+                status = 200
+            delay = limiter.update(url, status, attempt=attempt)
+            if delay is None or attempt >= limiter.max_retries:
+                return
+            logger.info(f"Selenium 응답 {status}, {delay:.1f}초 후 재시도: {url}")
+            time.sleep(delay)
+            attempt += 1
+
+    def _log_browser_metrics(self, driver: WebDriver, url: str, elapsed: float) -> None:
+        """Performance API로 페이지 로드 시간과 전송량을 기록 (브랜드별 누적 포함)"""
+        try:
+            metrics = driver.execute_script(_PAGE_METRICS_SCRIPT)
+        except Exception as e:
+            logger.debug(f"페이지 성능 지표 수집 실패: {url}, 오류: {e}")
+            return
+
+        with self._browser_stats_lock:
+            stats = self._browser_stats
+            stats["pages"] += 1
+            stats["load_ms"] += metrics["load_ms"]
+            stats["bytes"] += metrics["bytes"]
+            totals = dict(stats)
+
+        logger.info(
+            f"[{self.brand_name}] 페이지 로드 {metrics['load_ms']:.0f}ms "
+            f"(브라우저 액션 포함 {elapsed:.1f}s), "
+            f"전송 {metrics['bytes'] / 1024:.0f} KiB, 리소스 {metrics['resources']}개: {url}"
+        )
+        logger.info(
+            f"[{self.brand_name}] 누적 {totals['pages']}페이지, "
+            f"평균 로드 {totals['load_ms'] / totals['pages']:.0f}ms, "
+            f"전송 {totals['bytes'] / 1024:.0f} KiB"
+        )
+
+    def parse_html(self, html: str, items_only: bool = False) -> HtmlNode:
+        """
+        HTML 문자열을 설정된 파서 백엔드로 파싱 (기본은 BeautifulSoup).
+        items_only이고 partial_parse가 켜져 있으면 item_selector 서브트리만 파싱합니다.
+        """
+        item_selector = self.item_selector if items_only and self.partial_parse else None
+        return parse_document(html, self.parser_backend, item_selector)
+
     def handle_browser_action(self):
         pass
 
-    def scrap(self, target_urls: list[str]) -> list[Machine]:
+    def count_items_in_browser(self) -> int:
+        """현재 브라우저 DOM에서 item_selector에 맞는 요소 수 (요소 참조 대신 개수만 전송)"""
+        if not self.driver:
+            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", self.item_selector
+        )
+
+    def wait_for_items(self, timeout: float = 30, settle: float = 1.0) -> int:
+        """
+        item_selector 요소가 나타나고, 개수가 settle초 동안 변하지 않을 때까지 대기.
+        고정 sleep 대신 DOM 상태를 폴링하므로 로딩이 끝나는 즉시 반환합니다.
+        """
+        if not self.driver:
+            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
+
+        state = {"count": -1, "changed_at": time.monotonic()}
+
+        def items_settled(_driver) -> bool:
+            count = self.count_items_in_browser()
+            now = time.monotonic()
+            if count != state["count"]:
+                state["count"], state["changed_at"] = count, now
+                return False
+            return count > 0 and now - state["changed_at"] >= settle
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.25).until(items_settled)
+        except TimeoutException:
+            logger.warning(
+                f"{timeout}초 안에 아이템 로딩이 끝나지 않았습니다 (현재 {state['count']}개)"
+            )
+        return max(state["count"], 0)
+
+    def load_more_until_stable(
+        self,
+        button_selector: str,
+        timeout: float = 10,
+        button_timeout: float = 3,
+        max_clicks: int = 100,
+    ) -> int:
+        """
+        Load More 버튼을 클릭하고 아이템 수가 늘어날 때까지만 기다리는 과정을 반복.
+        버튼이 사라지거나, 클릭 후 timeout초 안에 아이템 수가 늘지 않으면 종료합니다.
+        """
+        if not self.driver:
+            raise RuntimeError("Selenium WebDriver가 초기화되지 않았습니다")
+
+        count = self.wait_for_items()
+        for _ in range(max_clicks):
+            try:
+                load_more_button = WebDriverWait(self.driver, button_timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, button_selector))
+                )
+            except TimeoutException:
+                logger.info("더 이상 Load More 버튼이 없습니다")
+                break
+
+            self.driver.execute_script("arguments[0].click();", load_more_button)
+            logger.info("Load More 버튼 클릭됨 (JavaScript)")
+
+            try:
+                WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                    lambda _driver: self.count_items_in_browser() > count
+                )
+            except TimeoutException:
+                logger.info("Load More 후 아이템 수가 늘지 않아 종료합니다")
+                break
+            count = self.wait_for_items(timeout=timeout, settle=0.5)
+
+        logger.info(f"Load More 완료: 아이템 {count}개")
+        return count
 
+    def scrap(
+        self,
+        target_urls: list[str] | Pagination | Discovery,
+        keep_items: bool = True,
+        checkpoint: CheckpointStore | None = None,
+        dedup: DedupIndex | None = None,
+    ) -> list[Machine]:
+        """
+        페이지마다 추출한 아이템을 바로 JSONL 파일에 추가.
+        target_urls는 URL 목록, Pagination(빈 페이지가 나올 때까지 미리 요청) 또는
+        Discovery(사이트맵/피드에서 마지막 수집 이후 바뀐 상품 페이지만)입니다.
+        keep_items=False면 아이템을 메모리에 모으지 않고 빈 리스트를 반환합니다 (개수는 last_item_count).
+        checkpoint를 주면 이미 완료된 URL은 건너뛰고, 실패한 URL은 기록한 뒤 나머지를 계속 수집합니다.
+        dedup을 주면 다른 페이지나 스크래퍼에서 이미 수집한 머신은 쓰지 않습니다.
+        """
+        pages = self._target_pages(target_urls, checkpoint)
         items = []
-        for url in target_urls:
-            print(f"Brand: {self.brand_name}, Machine Series: {self.machine_series}, Processing URL: {url}")
-            self.current_base_url = self._get_base_url(url)  # 베이스 URL 저장
-            soup = self.fetch_page(url, use_selenium=self.use_selenium)
-            new_items = self.extract_items(soup)
-            # 상품 아이템 추출
-            if not new_items:
-                logger.warning(f"URL에서 아이템을 찾지 못했습니다.")
-            items.extend(new_items)
-
-        # 결과 저장
-        if items:
-            self.save_to_json(items)
+        failed = []
+        with self._open_writer() as writer:
+            for url, soup in pages:
+                try:
+                    if isinstance(soup, Exception):
+                        raise soup
+                    page_items = self._process_page(url, soup)
+                except Exception as e:
+                    if checkpoint is None:
+                        raise
+                    self._record_failure(checkpoint, url, e)
+                    failed.append(url)
+                    continue
+                page_items = self._write_page(writer, url, page_items, checkpoint, dedup)
+                if keep_items:
+                    items.extend(page_items)
+
+        self._raise_if_failed(failed)
+        return items
 
+    async def scrap_async(
+        self,
+        target_urls: list[str] | Pagination | Discovery,
+        fetcher: AsyncFetcher,
+        keep_items: bool = True,
+        checkpoint: CheckpointStore | None = None,
+        dedup: DedupIndex | None = None,
+    ) -> list[Machine]:
+        """target_urls를 동시에 가져온 뒤 URL 순서대로 아이템을 추출해 JSONL 파일에 추가"""
+        pages = self._target_pages_async(target_urls, fetcher, checkpoint)
+        items = []
+        failed = []
+        with self._open_writer() as writer:
+            async for url, soup in pages:
+                try:
+                    if isinstance(soup, Exception):
+                        raise soup
+                    # 추출 (상세 페이지 요청 포함)은 이벤트 루프를 막지 않도록 스레드에서 실행
+                    page_items = await asyncio.to_thread(self._process_page, url, soup)
+                except Exception as e:
+                    if checkpoint is None:
+                        await pages.aclose()
+                        raise
+                    self._record_failure(checkpoint, url, e)
+                    failed.append(url)
+                    continue
+                page_items = self._write_page(writer, url, page_items, checkpoint, dedup)
+                if keep_items:
+                    items.extend(page_items)
+
+        self._raise_if_failed(failed)
         return items
 
+    def _target_pages(
+        self,
+        target_urls: list[str] | Pagination | Discovery,
+        checkpoint: CheckpointStore | None,
+    ) -> Iterator[tuple[str, HtmlNode | Exception]]:
+        """target_urls의 페이지를 순서대로 (URL, 파싱된 문서 또는 예외)로 전달"""
+        if isinstance(target_urls, Discovery):
+            # 바뀐 페이지만 고르므로 체크포인트의 완료 기록으로 건너뛰지 않음
+            return self._fetch_each(self._discovered_pages(target_urls))
+        if isinstance(target_urls, Pagination):
+            return self._paginate(target_urls, checkpoint)
+        return self._fetch_each(self._pending_urls(target_urls, checkpoint))
+
+    def _target_pages_async(
+        self,
+        target_urls: list[str] | Pagination | Discovery,
+        fetcher: AsyncFetcher,
+        checkpoint: CheckpointStore | None,
+    ) -> AsyncIterator[tuple[str, HtmlNode | Exception]]:
+        """_target_pages의 비동기 버전"""
+        if isinstance(target_urls, Discovery):
+            return self._discover_async(target_urls, fetcher)
+        if isinstance(target_urls, Pagination):
+            return self._paginate_async(target_urls, fetcher, checkpoint)
+        return self._fetch_each_async(self._pending_urls(target_urls, checkpoint), fetcher)
+
+    def default_discovery(self, target_urls: list[str] | Pagination) -> Discovery | None:
+        """ScrapEntry에 discovery가 없을 때 목록 URL에서 만들 사이트맵/피드 (기본은 없음)"""
+        return None
+
+    def discovered_page_url(self, url: str) -> str:
+        """
+        사이트맵/피드에서 찾은 상품 페이지 URL을 이 스크래퍼가 수집할 URL로 변환.
+        목록 페이지용 선택자로는 상품 페이지를 추출할 수 없으므로 기본 구현은 지원하지 않음
+        (StorefrontApiScraper는 상품 JSON API URL로 변환).
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__}는 사이트맵/피드로 찾은 상품 페이지 수집을 지원하지 않습니다"
+        )
+
+    def _discovered_pages(self, discovery: Discovery) -> list[str]:
+        """사이트맵/피드에서 찾은 페이지 중 마지막 수집 이후 바뀐 페이지의 수집 URL"""
+        if self.discovery_state is None:
+            self.discovery_state = DiscoveryState()
+        found = discover_urls(discovery, self.http_client)
+        changed = self.discovery_state.changed(self.checkpoint_key, found)
+        self._discovered = {self.discovered_page_url(page.url): page for page in changed}
+        logger.info(
+            f"[{self.checkpoint_key}] 사이트맵/피드에서 페이지 {len(found)}개 발견, "
+            f"새로 생기거나 바뀐 페이지 {len(changed)}개 수집"
+        )
+        return list(self._discovered)
+
+    async def _discover_async(
+        self, discovery: Discovery, fetcher: AsyncFetcher
+    ) -> AsyncIterator[tuple[str, HtmlNode | Exception]]:
+        urls = await asyncio.to_thread(self._discovered_pages, discovery)
+        pages = self._fetch_each_async(urls, fetcher)
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            await pages.aclose()
+
+    def _fetch_each(self, urls: list[str]) -> Iterator[tuple[str, HtmlNode | Exception]]:
+        """URL을 순서대로 가져옴 (실패는 예외 객체로 전달)"""
+        for url in urls:
+            try:
+                yield url, self.fetch_page(url, use_selenium=self.use_selenium)
+            except Exception as e:
+                yield url, e
+
+    async def _fetch_each_async(
+        self, urls: list[str], fetcher: AsyncFetcher
+    ) -> AsyncIterator[tuple[str, HtmlNode | Exception]]:
+        """모든 URL을 동시에 요청하고 URL 순서대로 전달"""
+        pages = [asyncio.ensure_future(self.fetch_page_async(url, fetcher)) for url in urls]
+        try:
+            for url, page in zip(urls, pages):
+                try:
+                    yield url, await page
+                except Exception as e:
+                    yield url, e
+        finally:
+            for page in pages:
+                page.cancel()
+
+    def _paginate(
+        self, pagination: Pagination, checkpoint: CheckpointStore | None
+    ) -> Iterator[tuple[str, HtmlNode | Exception]]:
+        """
+        pagination.lookahead개 페이지를 미리 동시에 요청하면서 순서대로 전달하고,
+        아이템이 없는 첫 페이지, 404, 직전 페이지와 아이템이 같은 페이지(범위를 벗어난 페이지
+        번호를 마지막 페이지로 돌려주는 사이트)에서 멈춤 (체크포인트로 완료된 페이지는 요청하지 않음).
+        """
+        done = checkpoint.done_urls(self.checkpoint_key) if checkpoint else set()
+        end = pagination.start + pagination.max_pages
+        futures: dict[int, Future] = {}
+        next_page = pagination.start
+        previous = None
+
+        with ThreadPoolExecutor(max_workers=pagination.lookahead) as executor:
+
+            def fill(until: int) -> None:
+                nonlocal next_page
+                while next_page < min(until, end):
+                    url = pagination.url(next_page)
+                    if url not in done:
+                        futures[next_page] = executor.submit(
+                            self.fetch_page, url, self.use_selenium
+                        )
+                    next_page += 1
+
+            try:
+                for page in range(pagination.start, end):
+                    fill(page + pagination.lookahead)
+                    url = pagination.url(page)
+                    future = futures.pop(page, None)
+                    if future is None:
+                        continue  # 이전 실행에서 완료된 페이지
+                    try:
+                        soup = future.result()
+                    except Exception as e:
+                        if not self._ends_pagination(e):
+                            yield url, e
+                        break
+                    if not self._has_items(soup, url):
+                        break
+                    signature = self._page_signature(soup)
+                    if self._repeats_previous(signature, previous, url):
+                        break
+                    previous = signature
+                    yield url, soup
+                    if self._is_last_page(soup):
+                        break
+            finally:
+                for future in futures.values():
+                    future.cancel()
+
+    async def _paginate_async(
+        self,
+        pagination: Pagination,
+        fetcher: AsyncFetcher,
+        checkpoint: CheckpointStore | None,
+    ) -> AsyncIterator[tuple[str, HtmlNode | Exception]]:
+        """_paginate의 비동기 버전"""
+        done = checkpoint.done_urls(self.checkpoint_key) if checkpoint else set()
+        end = pagination.start + pagination.max_pages
+        tasks: dict[int, asyncio.Future] = {}
+        next_page = pagination.start
+        previous = None
+
+        def fill(until: int) -> None:
+            nonlocal next_page
+            while next_page < min(until, end):
+                url = pagination.url(next_page)
+                if url not in done:
+                    tasks[next_page] = asyncio.ensure_future(
+                        self.fetch_page_async(url, fetcher)
+                    )
+                next_page += 1
+
+        try:
+            for page in range(pagination.start, end):
+                fill(page + pagination.lookahead)
+                url = pagination.url(page)
+                task = tasks.pop(page, None)
+                if task is None:
+                    continue
+                try:
+                    soup = await task
+                except Exception as e:
+                    if not self._ends_pagination(e):
+                        yield url, e
+                    break
+                if not self._has_items(soup, url):
+                    break
+                signature = self._page_signature(soup)
+                if self._repeats_previous(signature, previous, url):
+                    break
+                previous = signature
+                yield url, soup
+                if self._is_last_page(soup):
+                    break
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    def _has_items(self, soup: HtmlNode, url: str) -> bool:
+        if self.item_matcher.select_one(soup) is None:
+            logger.info(f"아이템이 없는 페이지에서 페이지네이션 종료: {url}")
+            return False
+        return True
+
+    def _page_signature(self, soup: HtmlNode) -> str:
+        """페이지 아이템 요소의 텍스트와 속성 해시 (같은 페이지가 반복되는지 비교용)"""
+        digest = hashlib.sha256()
+        for item in self.item_matcher.select(soup):
+            digest.update(item.get_text(" ", strip=True).encode("utf-8"))
+            digest.update(json.dumps(item.attrs, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _repeats_previous(self, signature: str, previous: str | None, url: str) -> bool:
+        if signature != previous:
+            return False
+        logger.info(f"직전 페이지와 같은 아이템이 반복되어 페이지네이션 종료: {url}")
+        return True
+
+    def _is_last_page(self, soup: HtmlNode) -> bool:
+        """다음 페이지를 요청하지 않아도 되는 마지막 페이지인지 (알 수 없으면 False)"""
+        return False
+
+    def _ends_pagination(self, error: Exception) -> bool:
+        """페이지 요청 오류가 페이지네이션의 끝을 뜻하는지 (기본은 404)"""
+        return _is_not_found(error)
+
+    @property
+    def checkpoint_key(self) -> str:
+        return f"{self.brand_name}/{self.machine_series}"
+
+    def _pending_urls(
+        self, target_urls: list[str], checkpoint: CheckpointStore | None
+    ) -> list[str]:
+        if checkpoint is None:
+            return list(target_urls)
+        done = checkpoint.done_urls(self.checkpoint_key)
+        pending = [url for url in target_urls if url not in done]
+        if len(pending) < len(target_urls):
+            logger.info(
+                f"[{self.checkpoint_key}] 완료된 페이지 {len(target_urls) - len(pending)}개 건너뜀, "
+                f"남은 페이지 {len(pending)}개"
+            )
+        return pending
+
+    def _write_page(
+        self,
+        writer: JsonlWriter,
+        url: str,
+        page_items: list[Machine],
+        checkpoint: CheckpointStore | None,
+        dedup: DedupIndex | None = None,
+    ) -> list[Machine]:
+        """페이지의 아이템을 (중복을 뺀 뒤) 쓰고 체크포인트를 기록. 실제로 쓴 아이템을 반환"""
+        content_hash = items_hash(page_items)
+        discovered = self._discovered.get(url)
+        if dedup is not None and page_items:
+            # 사이트맵/피드로 다시 수집한 페이지는 이전 실행의 목록 페이지보다 새 내용이므로 이어받음
+            page_items = dedup.claim(
+                self.checkpoint_key,
+                url,
+                page_items,
+                os.path.abspath(writer.path),
+                take_over=discovered is not None,
+            )
+        writer.write_page(page_items)
+        self.last_item_count = writer.count
+        if checkpoint is not None:
+            # 아이템이 없는 페이지는 파일이 생성되지 않으므로 출력 파일은 기록하지 않음
+            output_file = os.path.abspath(writer.path) if page_items else None
+            checkpoint.mark_done(
+                self.checkpoint_key, url, content_hash, output_file, len(page_items)
+            )
+        if discovered is not None and self.discovery_state is not None:
+            # 수집에 성공한 페이지만 lastmod를 기록 (실패한 페이지는 다음 실행에서 다시 수집)
+            output_file = os.path.abspath(writer.path) if page_items else None
+            self.discovery_state.mark_scraped(self.checkpoint_key, discovered, output_file)
+        return page_items
+
+    def _record_failure(self, checkpoint: CheckpointStore, url: str, error: Exception) -> None:
+        logger.error(f"페이지 수집 실패 (다음 실행에서 재시도): {url}, 오류: {error}")
+        checkpoint.mark_failed(self.checkpoint_key, url, f"{type(error).__name__}: {error}")
+
+    def _raise_if_failed(self, failed: list[str]) -> None:
+        if failed:
+            raise RuntimeError(f"{len(failed)}개 페이지 수집 실패: {', '.join(failed)}")
+
+    def _open_writer(self) -> JsonlWriter:
+        timestamp = int(time.time())
+        self.output_path = (
+            f"scripts/data_setup/scraped_data/{self.brand_name}_{self.machine_series}_"
+            f"machines_{timestamp}.jsonl"
+        )
+        self.last_item_count = 0
+        return JsonlWriter(self.output_path)
+
+    def _process_page(self, url: str, soup: HtmlNode) -> list[Machine]:
+        """가져온 페이지 하나에서 아이템을 추출"""
+        print(f"Brand: {self.brand_name}, Machine Series: {self.machine_series}, Processing URL: {url}")
+        self.current_base_url = self._get_base_url(url)  # 베이스 URL 저장
+        self.current_url = url
+        new_items = self.extract_items(soup)
+        # 상품 아이템 추출
+        if not new_items:
+            logger.warning(f"URL에서 아이템을 찾지 못했습니다.")
+        return new_items
+
     def _get_base_url(self, url: str) -> str:
         """URL에서 베이스 URL을 추출"""
         parsed = urlparse(url)
@@ -190,17 +856,27 @@ class BaseScraper:
 
         return image_url
 
-    def extract_items(self, soup: BeautifulSoup) -> list[Machine]:
+    def extract_items(self, soup: HtmlNode) -> list[Machine]:
         """shop-item _shop_item 클래스를 가진 요소들을 추출"""
-        items = []
-
         # 다양한 클래스 선택자로 시도
 
-        found_items = soup.select(self.item_selector)
+        found_items = self.item_matcher.select(soup)
         logger.info(f"'{self.item_selector}' 선택자로 {len(found_items)}개 아이템 발견")
         shop_items = found_items
 
+        # 상세 페이지가 필요한 스크래퍼는 아이템 추출 전에 한꺼번에 동시 요청
+        self._prefetch_detail_pages(shop_items)
+
+        items = self._extract_item_infos(shop_items)
+        self._detail_pages = {}
+        return items
+
+    def _extract_item_infos(self, shop_items: list) -> list[Machine]:
+        """아이템마다 extract_item_info를 호출 (실패한 아이템은 건너뜀)하고 합계 시간을 기록"""
+        items = []
+        elapsed = 0.0
         for idx, item in enumerate(shop_items):
+            started = time.perf_counter()
             try:
                 item_data = self.extract_item_info(item)
                 if item_data:
@@ -208,16 +884,79 @@ class BaseScraper:
             except Exception as e:
                 logger.error(f"아이템 {idx} 정보 추출 중 오류: {e}")
                 continue
-
+            finally:
+                elapsed += time.perf_counter() - started
+
+        ScrapeMetrics.shared().record(
+            "extract_item",
+            self.current_url or "",
+            elapsed,
+            self.brand_name,
+            self.machine_series,
+            count=len(shop_items),
+        )
         logger.info(f"총 {len(items)}개 아이템 정보 추출 완료")
         return items
 
-    def extract_item_info(self, item: Tag) -> Machine:
+    def extract_detail_url(self, item: HtmlNode) -> str | None:
+        """아이템의 상세 페이지 URL (상세 페이지가 필요한 스크래퍼에서 구현)"""
+        return None
+
+    def get_detail_page(self, item: HtmlNode) -> HtmlNode:
+        """미리 가져온 아이템의 상세 페이지 (extract_name 등에서 사용)"""
+        detail_url = self.extract_detail_url(item)
+        if detail_url is None:
+            raise ValueError("상세 페이지 URL을 찾을 수 없습니다")
+
+        detail_soup = self._detail_pages.get(detail_url)
+        if detail_soup is None:
+            raise ValueError(f"상세 페이지를 가져오지 못했습니다: {detail_url}")
+        return detail_soup
+
+    def _prefetch_detail_pages(self, items: list[HtmlNode]) -> None:
+        """목록의 상세 페이지 URL을 모아 동시에 가져온 뒤 URL별로 보관"""
+        detail_urls = []
+        for item in items:
+            try:
+                detail_url = self.extract_detail_url(item)
+            except Exception as e:
+                logger.error(f"상세 페이지 URL 추출 중 오류: {e}")
+                continue
+            if detail_url:
+                detail_urls.append(detail_url)
+
+        # 같은 상세 페이지는 한 번만 요청
+        detail_urls = list(dict.fromkeys(detail_urls))
+        if not detail_urls:
+            return
+
+        if self.detail_use_selenium:
+            fetch = partial(self.fetch_page_with_selenium, run_browser_action=False)
+        else:
+            fetch = self.fetch_page_with_requests
+
+        logger.info(f"상세 페이지 {len(detail_urls)}개 동시 요청")
+        workers = min(self.detail_workers, len(detail_urls))
+        with (
+            self._span("detail_prefetch", self.current_url or ""),
+            ThreadPoolExecutor(max_workers=workers) as executor,
+        ):
+            futures = {executor.submit(fetch, url): url for url in detail_urls}
+            for future in as_completed(futures):
+                detail_url = futures[future]
+                try:
+                    self._detail_pages[detail_url] = future.result()
+                except Exception as e:
+                    logger.error(f"상세 페이지 요청 실패: {detail_url}, 오류: {e}")
+
+    def extract_item_info(self, item: HtmlNode) -> Machine:
 
         name = self.extract_name(item)
 
         image_url = self.extract_image_url(item)
         image_url = self._normalize_image_url(str(image_url))
+        # CDN이 크기 변환을 지원하면 원본 대신 image_target_width 크기로 요청
+        image_url = resize_image_url(image_url, self.image_target_width)
 
         detail = self.extract_additional_info(item)
 
@@ -234,38 +973,35 @@ class BaseScraper:
             detail=detail,
         )
 
-    def extract_name(self, item: Tag) -> str:
-        name_elem = item.select_one(self.name_selector)
+    def extract_name(self, item: HtmlNode) -> str:
+        name_elem = self.name_matcher.select_one(item)
         if name_elem is None:
             raise ValueError(
                 f"Name element not found with selector: {self.name_selector}"
             )
         return name_elem.get_text(strip=True)
 
-    def extract_image_url(self, item: Tag) -> str:
-        image_elem = item.select_one(self.image_selector)
+    def extract_image_url(self, item: HtmlNode) -> str:
+        image_elem = self.image_matcher.select_one(item)
         if image_elem is None:
             raise ValueError(
                 f"Image element not found with selector: {self.image_selector}"
             )
 
-        image_url = image_elem.attrs.get("src")
+        # 지연 로딩 자리 표시 이미지나 큰 원본 대신 srcset/data-src에서 알맞은 크기를 선택
+        image_url = select_image_url(image_elem.attrs, self.image_target_width)
         if image_url is None:
             raise ValueError("Image src attribute not found")
 
-        # AttributeValuelist인 경우 첫 번째 값 사용
-        if isinstance(image_url, list):
-            image_url = image_url[0] if image_url else ""
-
         return image_url
 
-    def extract_additional_info(self, item: Tag) -> Any:
+    def extract_additional_info(self, item: HtmlNode) -> Any:
         """추가 정보 추출 (필요시 구현)"""
         # 예: 가격, 설명 등 추가 필드 추출 가능
         return None
 
     def save_to_json(self, data: list[Machine]) -> None:
-        """데이터를 JSON 파일로 저장"""
+        """데이터를 JSON 파일로 한 번에 저장 (scrap은 JSONL로 스트리밍 저장)"""
         timestamp = int(time.time())
         filename = (
             f"scripts/data_setup/scraped_data/{self.brand_name}_{self.machine_series}_"
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable
+
+from utils.model import Machine
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_PATH = Path(__file__).resolve().parents[2] / ".cache" / "checkpoints.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_checkpoint (
+    scraper_key TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    finished_at REAL,
+    content_hash TEXT,
+    output_file TEXT,
+    item_count INTEGER,
+    error TEXT,
+    PRIMARY KEY (scraper_key, url)
+)
+"""
+
+
+def items_hash(items: Iterable[Machine]) -> str:
+    """페이지에서 추출한 아이템 내용의 해시 (페이지가 바뀌었는지 비교용)"""
+    digest = hashlib.sha256()
+    for item in items:
+        digest.update(
+            json.dumps(item.model_dump(), ensure_ascii=False, sort_keys=True, default=str)
+            .encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+class CheckpointStore:
+    """
+    (스크래퍼 키, URL) 단위의 수집 체크포인트 (SQLite).
+
+    성공한 페이지는 완료 시각, 아이템 내용 해시, 출력 파일을 기록하고
+    실패한 페이지는 오류를 기록합니다. 다시 실행하면 완료된 페이지(출력 파일이 남아 있는 경우)는
+    건너뛰고 실패했거나 기록이 없는 페이지만 수집합니다.
+    여러 프로세스(스케줄러)가 같은 파일을 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, path: str | Path = CHECKPOINT_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 호출마다 새 연결을 사용하므로 스레드/프로세스 간 공유 문제가 없음
+        return sqlite3.connect(self.path, timeout=30)
+
+    def done_urls(self, scraper_key: str) -> set[str]:
+        """완료로 기록되어 있고 출력 파일도 남아 있는 URL"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT url, output_file FROM page_checkpoint "
+                "WHERE scraper_key = ? AND status = 'done'",
+                (scraper_key,),
+            ).fetchall()
+        return {
+            url for url, output_file in rows if not output_file or os.path.exists(output_file)
+        }
+
+    def mark_done(
+        self,
+        scraper_key: str,
+        url: str,
+        content_hash: str,
+        output_file: str | None,
+        item_count: int,
+    ) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO page_checkpoint "
+                "(scraper_key, url, status, finished_at, content_hash, output_file, "
+                "item_count, error) VALUES (?, ?, 'done', ?, ?, ?, ?, NULL)",
+                (scraper_key, url, time.time(), content_hash, output_file, item_count),
+            )
+
+    def mark_failed(self, scraper_key: str, url: str, error: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO page_checkpoint "
+                "(scraper_key, url, status, finished_at, error) "
+                "VALUES (?, ?, 'failed', ?, ?)",
+                (scraper_key, url, time.time(), error),
+            )
+
+    def clear(self, scraper_keys: Iterable[str] | None = None) -> None:
+        """체크포인트 삭제 (scraper_keys를 주면 해당 스크래퍼만)"""
+        with closing(self._connect()) as conn, conn:
+            if scraper_keys is None:
+                conn.execute("DELETE FROM page_checkpoint")
+            else:
+                conn.executemany(
+                    "DELETE FROM page_checkpoint WHERE scraper_key = ?",
+                    [(key,) for key in set(scraper_keys)],
+                )
+
+    def counts(self) -> dict[str, int]:
+        """상태별 페이지 수"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM page_checkpoint GROUP BY status"
+            ).fetchall()
+        return dict(rows)
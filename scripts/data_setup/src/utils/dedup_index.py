@@ -0,0 +1,207 @@
+import logging
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from utils.model import Machine
+
+logger = logging.getLogger(__name__)
+
+DEDUP_PATH = Path(__file__).resolve().parents[2] / ".cache" / "dedup.sqlite"
+
+# 같은 이미지를 가리키는 캐시 무효화용 쿼리 파라미터 (예: Shopify CDN의 ?v=1700000000)
+_CACHE_BUSTING_PARAMS = {"v", "ver", "version", "t", "ts"}
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS machine_key (
+        key TEXT PRIMARY KEY,
+        brand TEXT NOT NULL,
+        name TEXT NOT NULL,
+        image_url TEXT NOT NULL,
+        scraper_key TEXT NOT NULL,
+        url TEXT NOT NULL,
+        output_file TEXT,
+        first_seen REAL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS machine_source (
+        key TEXT NOT NULL,
+        scraper_key TEXT NOT NULL,
+        url TEXT NOT NULL,
+        seen_at REAL,
+        PRIMARY KEY (key, scraper_key, url)
+    )
+    """,
+)
+
+
+def normalize_text(text: str | None) -> str:
+    """대소문자, 전각/반각, 공백, 구두점 차이를 무시한 비교용 문자열"""
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return re.sub(r"[\W_]+", " ", text).strip()
+
+
+def normalize_image_url(image_url: str | None) -> str:
+    """
+    비교용 이미지 URL: http/https 구분, 호스트 대소문자, fragment, 캐시 무효화 파라미터를 무시하고
+    나머지 쿼리 파라미터는 정렬
+    """
+    if not image_url:
+        return ""
+    parts = urlsplit(image_url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _CACHE_BUSTING_PARAMS
+    )
+    url = f"//{parts.netloc.lower()}{parts.path}"
+    return f"{url}?{urlencode(query)}" if query else url
+
+
+def dedup_key(machine: Machine | Mapping[str, Any]) -> str:
+    """정규화한 (브랜드, 이름, 이미지 URL) 키 (Machine 또는 수집 파일에서 읽은 dict)"""
+    if isinstance(machine, Mapping):
+        brand, name, image_url = (machine.get(k) for k in ("brand", "name", "image_url"))
+    else:
+        brand, name, image_url = machine.brand, machine.name, machine.image_url
+    return "|".join((normalize_text(brand), normalize_text(name), normalize_image_url(image_url)))
+
+
+class DedupIndex:
+    """
+    수집 중 머신 중복 제거 인덱스 (SQLite).
+
+    여러 SCRAP_CONFIG 항목이 같은 컬렉션이나 시리즈를 겹쳐 수집하는 경우가 있어,
+    정규화한 (브랜드, 이름, 이미지 URL) 키마다 처음 수집한 출처(스크래퍼 키, URL, 출력 파일)를
+    기록하고 이후 다른 출처에서 나온 같은 머신은 JSONL에 쓰기 전에 버립니다.
+    버린 머신도 출처는 모두 machine_source에 남습니다.
+    처음 출처의 출력 파일이 삭제된 키는 다음에 수집한 출처가 이어받습니다.
+    scrap --discover로 다시 수집한 상품 페이지는 같은 스크래퍼의 목록 페이지가 차지한 키를
+    이어받습니다 (take_over, 가격 등만 바뀐 머신도 새 내용으로 기록).
+    CheckpointStore처럼 여러 프로세스(스케줄러)가 같은 파일을 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, path: str | Path = DEDUP_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 호출마다 새 연결을 사용하므로 스레드/프로세스 간 공유 문제가 없음
+        return sqlite3.connect(self.path, timeout=30)
+
+    def claim(
+        self,
+        scraper_key: str,
+        url: str,
+        items: list[Machine],
+        output_file: str | None,
+        take_over: bool = False,
+    ) -> list[Machine]:
+        """
+        페이지의 아이템 중 다른 출처(또는 같은 페이지 안)에서 이미 나온 머신을 뺀 목록을 반환하고,
+        남은 머신은 이 출처의 것으로 기록. take_over이면 같은 스크래퍼의 다른 URL이 차지한 키도
+        이 출처로 옮깁니다.
+        """
+        now = time.time()
+        kept = []
+        seen = set()
+        with closing(self._connect()) as conn, conn:
+            # 다른 프로세스와 같은 키를 동시에 차지하지 않도록 쓰기 잠금을 먼저 잡음
+            conn.execute("BEGIN IMMEDIATE")
+            for item in items:
+                key = dedup_key(item)
+                conn.execute(
+                    "INSERT OR REPLACE INTO machine_source (key, scraper_key, url, seen_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, scraper_key, url, now),
+                )
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                owner = conn.execute(
+                    "SELECT scraper_key, url, output_file FROM machine_key WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if owner is not None:
+                    owner_key, owner_url, owner_file = owner
+                    same_source = (owner_key, owner_url) == (scraper_key, url) or (
+                        take_over and owner_key == scraper_key
+                    )
+                    if not same_source and owner_file and os.path.exists(owner_file):
+                        continue
+                conn.execute(
+                    "INSERT OR REPLACE INTO machine_key (key, brand, name, image_url, "
+                    "scraper_key, url, output_file, first_seen) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        item.brand,
+                        item.name,
+                        item.image_url,
+                        scraper_key,
+                        url,
+                        output_file,
+                        now,
+                    ),
+                )
+                kept.append(item)
+
+        if len(kept) < len(items):
+            logger.info(
+                f"[{scraper_key}] 중복 머신 {len(items) - len(kept)}개 제외: {url}"
+            )
+        return kept
+
+    def sources(self, machine: Machine) -> list[tuple[str, str]]:
+        """머신이 수집된 모든 (스크래퍼 키, URL) (마지막으로 본 시각 순)"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT scraper_key, url FROM machine_source WHERE key = ? ORDER BY seen_at",
+                (dedup_key(machine),),
+            ).fetchall()
+        return [tuple(row) for row in rows]
+
+    def clear(self, scraper_keys: Iterable[str] | None = None) -> None:
+        """인덱스 삭제 (scraper_keys를 주면 해당 스크래퍼가 처음 수집한 키와 출처만)"""
+        with closing(self._connect()) as conn, conn:
+            if scraper_keys is None:
+                conn.execute("DELETE FROM machine_key")
+                conn.execute("DELETE FROM machine_source")
+                return
+            params = [(key,) for key in set(scraper_keys)]
+            conn.executemany("DELETE FROM machine_key WHERE scraper_key = ?", params)
+            conn.executemany("DELETE FROM machine_source WHERE scraper_key = ?", params)
+
+    def summary(self, since: float | None = None, top: int = 5) -> str:
+        """since 이후 수집된 출처 기준의 중복 현황과 중복이 가장 많은 출처 쌍"""
+        since = since or 0.0
+        with closing(self._connect()) as conn:
+            (machines,) = conn.execute(
+                "SELECT COUNT(DISTINCT key) FROM machine_source WHERE seen_at >= ?", (since,)
+            ).fetchone()
+            # 출처(스크래퍼 키 + URL)가 처음 출처와 다른 기록이 버린 중복
+            overlaps = conn.execute(
+                "SELECT m.scraper_key, s.scraper_key, COUNT(*) FROM machine_source s "
+                "JOIN machine_key m ON m.key = s.key "
+                "WHERE s.seen_at >= ? AND (s.scraper_key != m.scraper_key OR s.url != m.url) "
+                "GROUP BY m.scraper_key, s.scraper_key ORDER BY COUNT(*) DESC",
+                (since,),
+            ).fetchall()
+        dropped = sum(count for _, _, count in overlaps)
+        lines = [f"Dedup index: {machines} machines, {dropped} duplicates dropped"]
+        for owner, source, count in overlaps[:top]:
+            lines.append(f"  {source} -> {owner}: {count}")
+        return "\n".join(lines)
@@ -0,0 +1,220 @@
+import gzip
+import logging
+import os
+import re
+import sqlite3
+import time
+import xml.etree.ElementTree as ET
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Iterable
+
+from utils.http_client import HttpClient
+from utils.model import Discovery
+from utils.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_PATH = Path(__file__).resolve().parents[2] / ".cache" / "discovery.sqlite"
+
+# 사이트맵 인덱스 안의 사이트맵을 따라가는 최대 깊이
+MAX_SITEMAP_DEPTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS discovered_url (
+    scraper_key TEXT NOT NULL,
+    url TEXT NOT NULL,
+    lastmod REAL,
+    output_file TEXT,
+    scraped_at REAL,
+    PRIMARY KEY (scraper_key, url)
+)
+"""
+
+
+@dataclass
+class DiscoveredUrl:
+    url: str
+    lastmod: float | None  # 사이트맵 lastmod / 피드 updated·pubDate (없으면 None)
+
+
+def parse_lastmod(value: str | None) -> float | None:
+    """W3C 날짜(사이트맵, Atom) 또는 RFC 822 날짜(RSS)를 타임스탬프로 변환"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            logger.warning(f"알 수 없는 날짜 형식: {value}")
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _local(tag: str) -> str:
+    """네임스페이스를 뺀 태그 이름"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(element: ET.Element, name: str) -> str | None:
+    for child in element:
+        if _local(child.tag) == name:
+            return (child.text or "").strip()
+    return None
+
+
+def parse_feed(content: bytes) -> tuple[list[DiscoveredUrl], list[DiscoveredUrl]]:
+    """
+    사이트맵(urlset), 사이트맵 인덱스, RSS, Atom 문서에서 (페이지 URL, 하위 사이트맵 URL) 목록을 추출.
+    .xml.gz 사이트맵처럼 gzip으로 압축된 본문도 처리합니다.
+    """
+    if content[:2] == b"\x1f\x8b":
+        content = gzip.decompress(content)
+    root = ET.fromstring(content)
+    kind = _local(root.tag)
+    pages, sitemaps = [], []
+
+    if kind in ("urlset", "sitemapindex"):
+        target = pages if kind == "urlset" else sitemaps
+        for entry in root:
+            loc = _child_text(entry, "loc")
+            if loc:
+                target.append(DiscoveredUrl(loc, parse_lastmod(_child_text(entry, "lastmod"))))
+    elif kind == "rss":
+        for item in root.iter():
+            if _local(item.tag) != "item":
+                continue
+            link = _child_text(item, "link")
+            if link:
+                pages.append(DiscoveredUrl(link, parse_lastmod(_child_text(item, "pubDate"))))
+    elif kind == "feed":  # Atom
+        for entry in root:
+            if _local(entry.tag) != "entry":
+                continue
+            links = [
+                child.get("href")
+                for child in entry
+                if _local(child.tag) == "link" and child.get("rel", "alternate") == "alternate"
+            ]
+            if links and links[0]:
+                updated = _child_text(entry, "updated") or _child_text(entry, "published")
+                pages.append(DiscoveredUrl(links[0], parse_lastmod(updated)))
+    else:
+        raise ValueError(f"사이트맵/피드가 아닌 문서입니다: <{kind}>")
+    return pages, sitemaps
+
+
+def _fetch(url: str, http_client: HttpClient) -> bytes:
+    response = RateLimiter.shared().send(url, lambda: http_client.get(url))
+    response.raise_for_status()
+    return response.content
+
+
+def discover_urls(
+    discovery: Discovery, http_client: HttpClient | None = None
+) -> list[DiscoveredUrl]:
+    """
+    Discovery의 사이트맵/피드를 읽어 include/exclude 패턴에 맞는 페이지 URL을 반환
+    (사이트맵 인덱스는 sitemap_include에 맞는 하위 사이트맵만 따라감, 같은 URL은 한 번만)
+    """
+    http_client = http_client or HttpClient.shared()
+    include = re.compile(discovery.include) if discovery.include else None
+    exclude = re.compile(discovery.exclude) if discovery.exclude else None
+    sitemap_include = re.compile(discovery.sitemap_include) if discovery.sitemap_include else None
+
+    found: dict[str, DiscoveredUrl] = {}
+    queue = [(url, 0) for url in discovery.urls]
+    visited = set()
+    while queue:
+        feed_url, depth = queue.pop(0)
+        if feed_url in visited:
+            continue
+        visited.add(feed_url)
+        logger.info(f"사이트맵/피드 읽는 중: {feed_url}")
+        pages, sitemaps = parse_feed(_fetch(feed_url, http_client))
+
+        for page in pages:
+            if include and not include.search(page.url):
+                continue
+            if exclude and exclude.search(page.url):
+                continue
+            found.setdefault(page.url, page)
+        for sitemap in sitemaps:
+            if depth + 1 > MAX_SITEMAP_DEPTH:
+                logger.warning(f"사이트맵 인덱스가 너무 깊어 건너뜀: {sitemap.url}")
+                continue
+            if sitemap_include is None or sitemap_include.search(sitemap.url):
+                queue.append((sitemap.url, depth + 1))
+
+    return list(found.values())
+
+
+class DiscoveryState:
+    """
+    사이트맵/피드로 찾은 페이지마다 마지막으로 수집한 시점의 lastmod (SQLite).
+
+    다음 실행에서는 처음 보는 URL, lastmod가 기록보다 새로운 URL, 출력 파일이 삭제된 URL만
+    다시 수집합니다 (lastmod가 없는 URL은 처음 볼 때만 수집).
+    CheckpointStore처럼 여러 프로세스(스케줄러)가 같은 파일을 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, path: str | Path = DISCOVERY_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 호출마다 새 연결을 사용하므로 스레드/프로세스 간 공유 문제가 없음
+        return sqlite3.connect(self.path, timeout=30)
+
+    def changed(self, scraper_key: str, discovered: list[DiscoveredUrl]) -> list[DiscoveredUrl]:
+        """마지막 수집 이후 바뀌었거나 새로 생긴 페이지"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT url, lastmod, output_file FROM discovered_url WHERE scraper_key = ?",
+                (scraper_key,),
+            ).fetchall()
+        scraped = {url: (lastmod, output_file) for url, lastmod, output_file in rows}
+
+        changed = []
+        for page in discovered:
+            if page.url not in scraped:
+                changed.append(page)
+                continue
+            lastmod, output_file = scraped[page.url]
+            if output_file and not os.path.exists(output_file):
+                changed.append(page)
+            elif page.lastmod is not None and (lastmod is None or page.lastmod > lastmod):
+                changed.append(page)
+        return changed
+
+    def mark_scraped(
+        self, scraper_key: str, page: DiscoveredUrl, output_file: str | None
+    ) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO discovered_url "
+                "(scraper_key, url, lastmod, output_file, scraped_at) VALUES (?, ?, ?, ?, ?)",
+                (scraper_key, page.url, page.lastmod, output_file, time.time()),
+            )
+
+    def clear(self, scraper_keys: Iterable[str] | None = None) -> None:
+        """기록 삭제 (scraper_keys를 주면 해당 스크래퍼만)"""
+        with closing(self._connect()) as conn, conn:
+            if scraper_keys is None:
+                conn.execute("DELETE FROM discovered_url")
+            else:
+                conn.executemany(
+                    "DELETE FROM discovered_url WHERE scraper_key = ?",
+                    [(key,) for key in set(scraper_keys)],
+                )
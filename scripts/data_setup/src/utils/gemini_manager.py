@@ -1,6 +1,6 @@
 import google.generativeai as genai
 from datetime import timedelta
-import requests
+import httpx
 from typing import Optional
 
 from utils.image_processor import ImageProcessor
@@ -114,7 +114,7 @@ class GeminiManager:
 
         except FileNotFoundError:
             return f"오류: 로컬 이미지 파일({image_source})을 찾을 수 없습니다."
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             return f"오류: URL({image_source})에서 이미지를 불러오는 데 실패했습니다. ({e})"
         except Exception as e:
             return f"이미지 처리 또는 콘텐츠 생성 중 오류가 발생했습니다: {e}"
@@ -0,0 +1,337 @@
+"""
+HTML 파서 백엔드.
+
+기본값은 BeautifulSoup(lxml)이고, 큰 카탈로그 페이지에서는 lxml(미리 컴파일한 CSS 선택자)이나
+selectolax를 쓸 수 있습니다. lxml / selectolax 노드는 스크래퍼 훅(extract_name,
+extract_image_url 등)이 사용하는 BeautifulSoup Tag의 일부 인터페이스
+(select, select_one, get_text, attrs, get)를 그대로 제공합니다.
+Selenium 스크래퍼는 HTML을 넘겨받지 않고 브라우저 안에서 선택자를 실행한 결과(BrowserNode)를
+같은 인터페이스로 사용할 수 있습니다.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Callable, Union
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+logger = logging.getLogger(__name__)
+
+PARSER_BACKENDS = ("bs4", "lxml", "selectolax")
+
+
+def _join_text(texts, separator: str, strip: bool) -> str:
+    # BeautifulSoup의 get_text(strip=True)처럼 텍스트 조각별로 strip 후 빈 조각은 제외
+    if strip:
+        texts = (text.strip() for text in texts)
+        texts = (text for text in texts if text)
+    return separator.join(texts)
+
+
+@lru_cache(maxsize=None)
+def _compile_lxml_selector(selector: str) -> Callable[[Any], list]:
+    """CSS 선택자를 XPath로 한 번만 변환/컴파일 (BeautifulSoup처럼 하위 요소만 검색)"""
+    from cssselect import HTMLTranslator
+    from lxml import etree
+
+    xpath = HTMLTranslator().css_to_xpath(selector, prefix="descendant::")
+    return etree.XPath(xpath)
+
+
+class LxmlNode:
+    """lxml.html 요소를 BeautifulSoup Tag처럼 다루기 위한 어댑터"""
+
+    __slots__ = ("_element",)
+
+    def __init__(self, element: Any) -> None:
+        self._element = element
+
+    @property
+    def name(self) -> str:
+        return self._element.tag
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        return dict(self._element.attrib)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._element.get(key, default)
+
+    def select(self, selector: str) -> list["LxmlNode"]:
+        return [LxmlNode(e) for e in _compile_lxml_selector(selector)(self._element)]
+
+    def select_one(self, selector: str) -> "LxmlNode | None":
+        found = _compile_lxml_selector(selector)(self._element)
+        return LxmlNode(found[0]) if found else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return _join_text(self._iter_text(), separator, strip)
+
+    def _iter_text(self):
+        for node in self._element.iter():
+            # 주석의 text와 script/style 내용은 제외 (tail은 부모의 텍스트)
+            is_element = isinstance(node.tag, str)
+            if is_element and node.tag not in ("script", "style") and node.text:
+                yield node.text
+            if node is not self._element and node.tail:
+                yield node.tail
+
+
+class SelectolaxNode:
+    """selectolax(lexbor) 노드를 BeautifulSoup Tag처럼 다루기 위한 어댑터"""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: Any) -> None:
+        self._node = node
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        # 값 없는 속성(<input disabled>)은 BeautifulSoup처럼 빈 문자열
+        return {k: v if v is not None else "" for k, v in self._node.attributes.items()}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.attrs.get(key, default)
+
+    def _descendants(self, selector: str) -> list[Any]:
+        # lexbor의 css()는 노드 자신도 매칭하므로 BeautifulSoup처럼 하위 요소만 남김
+        own_id = self._node.mem_id
+        return [n for n in self._node.css(selector) if n.mem_id != own_id]
+
+    def select(self, selector: str) -> list["SelectolaxNode"]:
+        return [SelectolaxNode(n) for n in self._descendants(selector)]
+
+    def select_one(self, selector: str) -> "SelectolaxNode | None":
+        found = self._node.css_first(selector)
+        if found is not None and found.mem_id == self._node.mem_id:
+            rest = self._descendants(selector)
+            found = rest[0] if rest else None
+        return SelectolaxNode(found) if found is not None else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        texts = (
+            node.text_content
+            for node in self._node.traverse(include_text=True)
+            if node.tag == "-text" and node.parent.tag not in ("script", "style")
+        )
+        return _join_text((t for t in texts if t), separator, strip)
+
+
+# 브라우저 안에서 item_selector와 하위 선택자를 실행해 필요한 값만 JSON으로 반환
+# (arguments: item_selector, 아이템별 선택자 목록, 문서 전체에서 찾을 선택자 목록)
+BROWSER_EXTRACT_SCRIPT = """
+const [itemSelector, itemSelectors, documentSelectors] = arguments;
+const SKIP = new Set(["SCRIPT", "STYLE", "TEMPLATE", "NOSCRIPT"]);
+function texts(el) {
+  const out = [];
+  const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+  for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+    if (n.nodeValue && !SKIP.has(n.parentElement.tagName)) out.push(n.nodeValue);
+  }
+  return out;
+}
+function node(el, selectors, withText) {
+  const attrs = {};
+  for (const a of el.attributes) attrs[a.name] = a.value;
+  const result = {tag: el.tagName.toLowerCase(), attrs: attrs};
+  if (withText) result.texts = texts(el);
+  if (selectors.length) {
+    result.matches = {};
+    for (const s of selectors) {
+      result.matches[s] = Array.from(el.querySelectorAll(s), (m) => node(m, [], true));
+    }
+  }
+  return result;
+}
+const root = node(document.documentElement, documentSelectors, false);
+root.matches = root.matches || {};
+root.matches[itemSelector] = Array.from(
+  document.querySelectorAll(itemSelector), (el) => node(el, itemSelectors, false)
+);
+return root;
+"""
+
+
+class BrowserNode:
+    """
+    BROWSER_EXTRACT_SCRIPT가 반환한 요소 JSON을 BeautifulSoup Tag처럼 다루기 위한 어댑터.
+    브라우저에서 미리 실행한 선택자의 결과만 select할 수 있고, 텍스트는 선택자로 찾은
+    하위 요소에만 있습니다 (아이템/문서 자체의 텍스트는 전송하지 않음).
+    """
+
+    __slots__ = ("name", "_attrs", "_texts", "_matches")
+
+    def __init__(self, data: dict) -> None:
+        self.name = data.get("tag", "")
+        self._attrs = data.get("attrs") or {}
+        self._texts = data.get("texts")
+        self._matches = data.get("matches") or {}
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        return self._attrs
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._attrs.get(key, default)
+
+    def select(self, selector: str) -> list["BrowserNode"]:
+        if selector not in self._matches:
+            raise KeyError(
+                f"브라우저에서 실행하지 않은 선택자: {selector} (browser_selectors에 추가 필요)"
+            )
+        return [BrowserNode(match) for match in self._matches[selector]]
+
+    def select_one(self, selector: str) -> "BrowserNode | None":
+        found = self.select(selector)
+        return found[0] if found else None
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if self._texts is None:
+            raise ValueError(f"브라우저에서 텍스트를 가져오지 않은 요소입니다: <{self.name}>")
+        return _join_text(self._texts, separator, strip)
+
+
+HtmlNode = Union[Tag, LxmlNode, SelectolaxNode, BrowserNode]
+
+
+class CompiledSelector:
+    """
+    한 번 컴파일해 모든 아이템에 재사용하는 CSS 선택자.
+    node.select(selector)와 달리 호출마다 선택자 캐시를 조회하거나 다시 해석하지 않습니다.
+    (selectolax는 컴파일된 선택자를 지원하지 않아 문자열로 전달)
+    """
+
+    __slots__ = ("selector", "_soupsieve", "_xpath")
+
+    def __init__(self, selector: str, backend: str = "bs4") -> None:
+        self.selector = selector
+        # 잘못된 선택자는 여기서 SelectorSyntaxError / cssselect.SelectorError
+        self._soupsieve = soupsieve.compile(selector)
+        self._xpath = _compile_lxml_selector(selector) if backend == "lxml" else None
+
+    def select(self, node: HtmlNode) -> list[HtmlNode]:
+        if isinstance(node, Tag):
+            return self._soupsieve.select(node)
+        if isinstance(node, LxmlNode):
+            xpath = self._xpath or _compile_lxml_selector(self.selector)
+            return [LxmlNode(e) for e in xpath(node._element)]
+        return node.select(self.selector)
+
+    def select_one(self, node: HtmlNode) -> HtmlNode | None:
+        if isinstance(node, Tag):
+            return self._soupsieve.select_one(node)
+        if isinstance(node, LxmlNode):
+            xpath = self._xpath or _compile_lxml_selector(self.selector)
+            found = xpath(node._element)
+            return LxmlNode(found[0]) if found else None
+        return node.select_one(self.selector)
+
+    def __str__(self) -> str:
+        return self.selector
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector: str, backend: str = "bs4") -> CompiledSelector:
+    """같은 선택자/백엔드는 설정이 여러 개여도 한 번만 컴파일"""
+    return CompiledSelector(selector, backend)
+
+# 태그, .class, #id, [attr], [attr=value]로만 이루어진 단순 선택자
+_SIMPLE_COMPOUND = re.compile(
+    r"^(?P<tag>[a-zA-Z][\w-]*|\*)?"
+    r"(?P<rest>(?:[.#][\w-]+|\[[\w-]+(?:=(?:\"[^\"]*\"|'[^']*'|[\w-]+))?\])*)$"
+)
+_SIMPLE_PART = re.compile(
+    r"([.#])([\w-]+)|\[([\w-]+)(?:=(?:\"([^\"]*)\"|'([^']*)'|([\w-]+)))?\]"
+)
+
+
+def _compound_matcher(compound: str) -> Callable[[str, dict], bool] | None:
+    match = _SIMPLE_COMPOUND.match(compound)
+    if not match or not compound:
+        return None
+
+    tag = match.group("tag")
+    classes: set[str] = set()
+    attrs: dict[str, str | None] = {}
+    for kind, value, attr, dq, sq, bare in _SIMPLE_PART.findall(match.group("rest")):
+        if kind == ".":
+            classes.add(value)
+        elif kind == "#":
+            attrs["id"] = value
+        else:
+            attrs[attr] = dq or sq or bare or None
+
+    def matches(name: str, element_attrs: dict) -> bool:
+        if tag not in (None, "*") and name != tag:
+            return False
+        if classes:
+            element_classes = element_attrs.get("class") or ""
+            if isinstance(element_classes, str):
+                element_classes = element_classes.split()
+            if not classes.issubset(element_classes):
+                return False
+        for attr, expected in attrs.items():
+            if attr not in element_attrs:
+                return False
+            if expected is not None and element_attrs[attr] != expected:
+                return False
+        return True
+
+    return matches
+
+
+@lru_cache(maxsize=None)
+def item_strainer(item_selector: str) -> SoupStrainer | None:
+    """
+    item_selector의 아이템 컨테이너만 남기는 SoupStrainer (단순 선택자만 지원, 아니면 None).
+    하위 선택자("ul.products li.product")는 첫 조상 요소의 서브트리를 남겨
+    파싱 후에도 같은 item_selector로 select할 수 있게 합니다.
+    """
+    matchers = []
+    for group in item_selector.split(","):
+        compounds = group.replace(">", " ").split()
+        matcher = _compound_matcher(compounds[0]) if compounds else None
+        if matcher is None:
+            return None
+        matchers.append(matcher)
+
+    def keep(name: str, attrs: dict) -> bool:
+        return any(matcher(name, attrs or {}) for matcher in matchers)
+
+    return SoupStrainer(keep)
+
+
+def parse_document(
+    html: str, backend: str = "bs4", item_selector: str | None = None
+) -> HtmlNode:
+    """
+    선택한 백엔드로 HTML을 파싱해 문서 루트 노드를 반환.
+    item_selector를 주면 (bs4 백엔드에서) 아이템 서브트리만 남기는 부분 파싱을 합니다.
+    """
+    if backend == "bs4":
+        strainer = item_strainer(item_selector) if item_selector else None
+        if strainer is not None:
+            return BeautifulSoup(html, "lxml", parse_only=strainer)
+        if item_selector:
+            logger.debug(f"부분 파싱을 지원하지 않는 선택자라 전체 파싱: {item_selector}")
+        return BeautifulSoup(html, "lxml")
+    if backend == "lxml":
+        import lxml.html
+
+        try:
+            return LxmlNode(lxml.html.document_fromstring(html))
+        except ValueError:
+            # 인코딩 선언(<?xml ... encoding=...?>)이 있는 문자열은 bytes로만 파싱 가능
+            return LxmlNode(lxml.html.document_fromstring(html.encode("utf-8")))
+    if backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        return SelectolaxNode(LexborHTMLParser(html).root)
+    raise ValueError(f"Unknown parser backend: {backend}")
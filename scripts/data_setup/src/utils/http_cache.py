@@ -0,0 +1,155 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "http"
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    text: str
+    size: int  # 원본 응답 바이트 수 (절약량 계산용)
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return ttl > 0 and time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    URL 단위의 디스크 응답 캐시.
+
+    본문은 디코딩된 텍스트를 gzip으로 저장하고, ETag / Last-Modified를 함께 보관해
+    다음 실행에서 조건부 GET(If-None-Match / If-Modified-Since)으로 재검증합니다.
+    """
+
+    _shared: "HttpCache | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Path = CACHE_DIR) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0  # TTL 안이라 요청 없이 사용
+        self.revalidated = 0  # 304 응답으로 디스크 본문 사용
+        self.misses = 0
+        self.bytes_saved = 0
+
+    @classmethod
+    def shared(cls) -> "HttpCache":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.html.gz"
+
+    def get(self, url: str) -> CachedResponse | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with gzip.open(body_path, "rt", encoding="utf-8") as f:
+                text = f.read()
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return None
+        return CachedResponse(text=text, **meta)
+
+    def store(self, url: str, text: str, size: int, headers: Mapping[str, str]) -> None:
+        """응답을 저장 (검증자 헤더가 없으면 TTL 용도로만 사용됨)"""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "size": size,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        tmp_body = self._tmp_path(body_path)
+        with gzip.open(tmp_body, "wt", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_body, body_path)
+        self._write_meta(meta_path, meta)
+
+    def touch(self, entry: CachedResponse) -> None:
+        """304 응답 후 fetched_at만 갱신"""
+        meta_path, _ = self._paths(entry.url)
+        entry.fetched_at = time.time()
+        meta = {
+            "url": entry.url,
+            "size": entry.size,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fetched_at": entry.fetched_at,
+        }
+        self._write_meta(meta_path, meta)
+
+    def _tmp_path(self, path: Path) -> Path:
+        # 동시에 같은 URL을 쓰는 경우를 대비해 임시 파일에 쓴 뒤 교체
+        return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    def _write_meta(self, meta_path: Path, meta: dict) -> None:
+        tmp_meta = self._tmp_path(meta_path)
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, meta_path)
+
+    def record_hit(self, entry: CachedResponse, revalidated: bool = False) -> None:
+        with self._lock:
+            if revalidated:
+                self.revalidated += 1
+            else:
+                self.hits += 1
+            self.bytes_saved += entry.size
+        how = "304 재검증" if revalidated else "TTL 유효"
+        logger.info(f"캐시 사용 ({how}): {entry.url}")
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def counters(self) -> dict[str, int]:
+        """다른 프로세스(스케줄러의 부모)에 넘겨 합산할 카운터"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "bytes_saved": self.bytes_saved,
+            }
+
+    def merge(self, counters: Mapping[str, int]) -> None:
+        """counters()로 받은 다른 프로세스의 카운터를 더함"""
+        with self._lock:
+            self.hits += counters.get("hits", 0)
+            self.revalidated += counters.get("revalidated", 0)
+            self.misses += counters.get("misses", 0)
+            self.bytes_saved += counters.get("bytes_saved", 0)
+
+    def summary(self) -> str:
+        return (
+            f"HTTP cache: {self.hits} hits, {self.revalidated} revalidated (304), "
+            f"{self.misses} misses, {self.bytes_saved / 1024:.1f} KiB saved"
+        )
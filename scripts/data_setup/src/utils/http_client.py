@@ -0,0 +1,224 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Mapping
+from urllib.parse import urlparse
+
+import httpx
+from charset_normalizer import from_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+# 연결과 응답 대기를 나눠 제한 (read는 바이트 사이의 최대 간격이라 큰 이미지도 끊기지 않음)
+DEFAULT_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=30.0, pool=60.0)
+
+
+def detect_encoding(content: bytes) -> str:
+    """requests의 apparent_encoding과 같은 방식으로 인코딩 추정"""
+    best = from_bytes(content).best()
+    return best.encoding if best else "utf-8"
+
+
+def _host_of(url: str) -> str:
+    return urlparse(url).netloc
+
+
+class ConnectionStats:
+    """호스트별 요청 수와 새로 연 연결 수 (나머지 요청은 keep-alive / HTTP/2 연결을 재사용)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests: dict[str, int] = defaultdict(int)
+        self.connections: dict[str, int] = defaultdict(int)
+        self.http2_requests: dict[str, int] = defaultdict(int)
+
+    def record(self, host: str, new_connection: bool, http_version: str) -> None:
+        with self._lock:
+            self.requests[host] += 1
+            if new_connection:
+                self.connections[host] += 1
+            if http_version == "HTTP/2":
+                self.http2_requests[host] += 1
+
+    def reuse_rate(self, host: str | None = None) -> float:
+        """연결을 새로 열지 않은 요청의 비율"""
+        with self._lock:
+            hosts = [host] if host else list(self.requests)
+            requests = sum(self.requests[h] for h in hosts)
+            connections = sum(self.connections[h] for h in hosts)
+        return (requests - connections) / requests if requests else 0.0
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        """다른 프로세스(스케줄러의 부모)에 넘겨 합산할 호스트별 카운터"""
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "connections": dict(self.connections),
+                "http2_requests": dict(self.http2_requests),
+            }
+
+    def merge(self, counters: Mapping[str, Mapping[str, int]]) -> None:
+        """counters()로 받은 다른 프로세스의 카운터를 더함"""
+        with self._lock:
+            for name in ("requests", "connections", "http2_requests"):
+                totals = getattr(self, name)
+                for host, count in counters.get(name, {}).items():
+                    totals[host] += count
+
+    def summary(self, top: int = 5) -> str:
+        with self._lock:
+            requests = sum(self.requests.values())
+            connections = sum(self.connections.values())
+            http2 = sum(self.http2_requests.values())
+            busiest = sorted(self.requests, key=lambda h: -self.requests[h])[:top]
+        if not requests:
+            return "HTTP connections: no requests"
+        lines = [
+            f"HTTP connections: {requests} requests over {connections} connections "
+            f"(reuse {(requests - connections) / requests:.0%}, HTTP/2 {http2 / requests:.0%})"
+        ]
+        for host in busiest:
+            lines.append(
+                f"  {host}: {self.requests[host]} requests, {self.connections[host]} "
+                f"connections (reuse {self.reuse_rate(host):.0%})"
+            )
+        return "\n".join(lines)
+
+
+class ConnectionTrace:
+    """httpcore trace 이벤트에서 이 요청이 새 연결을 열었는지 확인하고 다른 trace에도 전달"""
+
+    def __init__(self, inner: Callable[[str, dict], Any] | None = None) -> None:
+        self.inner = inner
+        self.new_connection = False
+
+    def _on_event(self, name: str) -> None:
+        if name == "connection.connect_tcp.started":
+            self.new_connection = True
+
+    def __call__(self, name: str, info: dict) -> None:
+        self._on_event(name)
+        if self.inner:
+            self.inner(name, info)
+
+    async def atrace(self, name: str, info: dict) -> None:
+        self._on_event(name)
+        if self.inner:
+            await self.inner(name, info)
+
+
+class HttpClient:
+    """
+    스크래퍼, 이미지 로더, 업로더가 함께 쓰는 HTTP 클라이언트.
+
+    호스트마다 keep-alive 연결 풀을 가진 httpx.Client(HTTP/2)를 하나씩 두므로 같은 호스트로의
+    요청은 TCP+TLS 핸드셰이크 없이 연결을 재사용하고, HTTP/2를 지원하는 서버에서는 한 연결로
+    여러 요청을 동시에 보냅니다. 풀 크기는 per_host_connections(호스트별로 host_limits에서
+    조정 가능)이며, 연결 재사용률은 stats로 확인합니다.
+    """
+
+    _shared: "HttpClient | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        per_host_connections: int = 4,
+        keepalive_expiry: float = 30.0,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        http2: bool = True,
+    ) -> None:
+        self.per_host_connections = per_host_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self.http2 = http2
+        self.host_limits: dict[str, int] = {}
+        self.stats = ConnectionStats()
+        self._clients: dict[str, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "HttpClient":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def connections_for(self, host: str) -> int:
+        return self.host_limits.get(host, self.per_host_connections)
+
+    def limits_for(self, host: str) -> httpx.Limits:
+        connections = self.connections_for(host)
+        return httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def client_for(self, url: str) -> httpx.Client:
+        host = _host_of(url)
+        with self._lock:
+            client = self._clients.get(host)
+            if client is None:
+                client = httpx.Client(
+                    headers=DEFAULT_HEADERS,
+                    timeout=self.timeout,
+                    limits=self.limits_for(host),
+                    http2=self.http2,
+                    follow_redirects=True,
+                )
+                self._clients[host] = client
+            return client
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        trace: Callable[[str, dict], Any] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        URL의 호스트에 해당하는 풀로 GET 요청. trace(예: RequestTimings)를 주면 httpx trace
+        이벤트를 함께 전달합니다.
+        """
+        connection_trace = ConnectionTrace(trace)
+        response = self.client_for(url).get(
+            url, headers=headers, extensions={"trace": connection_trace}, **kwargs
+        )
+        self.record(url, connection_trace, response)
+        return response
+
+    def record(self, url: str, trace: ConnectionTrace, response: httpx.Response) -> None:
+        self.stats.record(_host_of(url), trace.new_connection, response.http_version)
+
+    def async_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """
+        같은 설정의 비동기 클라이언트 (이벤트 루프마다 하나씩 만들어 사용).
+        호스트별 연결 수는 호출하는 쪽에서 connections_for()로 제한합니다.
+        """
+        return httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=None,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            http2=self.http2,
+            follow_redirects=True,
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
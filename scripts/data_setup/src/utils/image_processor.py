@@ -1,7 +1,9 @@
 from PIL import Image, ImageChops
-import requests
 import io
 
+from utils.http_client import HttpClient
+from utils.rate_limiter import RateLimiter
+
 class ImageProcessor:
     """
     이미지 로드, 자동 크롭, 리사이징 등 다양한 이미지 전처리 기능을 제공하는 클래스.
@@ -9,7 +11,9 @@ class ImageProcessor:
     def load_image(self, image_source: str) -> Image.Image:
         """URL 또는 로컬 경로에서 이미지를 로드합니다."""
         if image_source.startswith("http://") or image_source.startswith("https://"):
-            response = requests.get(image_source)
+            response = RateLimiter.shared().send(
+                image_source, lambda: HttpClient.shared().get(image_source)
+            )
             response.raise_for_status()
             img = Image.open(io.BytesIO(response.content))
         else:
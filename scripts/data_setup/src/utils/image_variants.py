@@ -0,0 +1,133 @@
+import re
+from typing import Any, Mapping
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 지연 로딩 스크립트가 실제 이미지를 넣어 두는 속성 (앞에 있을수록 우선)
+SRCSET_ATTRIBUTES = ("data-srcset", "data-lazy-srcset", "srcset")
+SRC_ATTRIBUTES = ("data-src", "data-lazy-src", "data-original", "src")
+
+# 지연 로딩 전의 자리 표시 이미지 (data: URI, 투명 gif 등)
+_PLACEHOLDER = re.compile(
+    r"^data:|(?:^|/)[^/]*(?:blank|spacer|placeholder|transparent|lazy|loading)[^/]*\.(?:gif|png|svg)$",
+    re.IGNORECASE,
+)
+
+# URL에 들어 있는 크기: WordPress "-300x300.jpg", Shopify "_600x.jpg" / "_600x600.jpg",
+# Webflow "-p-500.jpeg", imweb 등 "_400x400.jpg"
+_WORDPRESS_SIZE = re.compile(r"[-_](\d+)x\d+(?=\.\w+$)")
+_SHOPIFY_SIZE = re.compile(r"_(?:(\d+)x\d*|x\d+)(?:@\dx)?(?=\.\w+$)")
+_WEBFLOW_SIZE = re.compile(r"-p-(\d+)(?=\.\w+$)")
+
+# Webflow가 업로드한 이미지마다 만드는 반응형 변형의 너비 (원본보다 작은 것만 존재)
+WEBFLOW_WIDTHS = (500, 800, 1080, 1600, 2000, 2600, 3200)
+
+
+def _attr(attrs: Mapping[str, Any], name: str) -> str:
+    value = attrs.get(name)
+    # AttributeValueList인 경우 첫 번째 값 사용
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    return str(value).strip() if value else ""
+
+
+def _is_placeholder(url: str) -> bool:
+    return not url or bool(_PLACEHOLDER.search(url))
+
+
+def parse_srcset(srcset: str) -> list[tuple[str, int | None]]:
+    """srcset을 (URL, 너비) 목록으로 변환. 너비 서술자(600w)가 없으면 URL에서 추정"""
+    candidates = []
+    # URL에 쉼표가 들어갈 수 있으므로 "공백 뒤의 쉼표"나 서술자 뒤의 쉼표로 나눔
+    for entry in re.split(r",\s+|(?<=\d[wx]),", srcset.strip()):
+        parts = entry.strip().split()
+        if not parts or _is_placeholder(parts[0]):
+            continue
+        url = parts[0]
+        width = None
+        if len(parts) > 1 and parts[1].endswith("w") and parts[1][:-1].isdigit():
+            width = int(parts[1][:-1])
+        candidates.append((url, width if width is not None else url_width(url)))
+    return candidates
+
+
+def url_width(url: str) -> int | None:
+    """CDN/CMS가 URL에 넣은 이미지 너비 (알 수 없으면 None)"""
+    parts = urlsplit(url)
+    if _is_shopify(url):
+        # Shopify 접미사("_600x")는 "logo_2x.png" 같은 파일명과 겹치므로 Shopify CDN에서만 확인
+        match = _SHOPIFY_SIZE.search(parts.path)
+        if match and match.group(1):
+            return int(match.group(1))
+        width = dict(parse_qsl(parts.query)).get("width", "")
+        return int(width) if width.isdigit() else None
+    for pattern in (_WEBFLOW_SIZE, _WORDPRESS_SIZE):
+        match = pattern.search(parts.path)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def select_image_url(attrs: Mapping[str, Any], target_width: int | None) -> str | None:
+    """
+    img 요소(또는 같은 키를 가진 dict)의 srcset, data-src, src 중에서 target_width 이상인
+    가장 작은 변형을 고르고, 없으면 크기가 붙지 않은 원본(보통 가장 큼), 그것도 없으면 가장 큰
+    변형을 반환. 너비를 알 수 없으면 지연 로딩된 실제 이미지(data-src 등)를 src보다 우선합니다.
+    target_width가 None이면 src 그대로.
+    """
+    if target_width is None:
+        return _attr(attrs, "src") or None
+
+    sources = [
+        url for url in (_attr(attrs, name) for name in SRC_ATTRIBUTES) if not _is_placeholder(url)
+    ]
+    candidates = [(url, url_width(url)) for url in sources]
+    for name in SRCSET_ATTRIBUTES:
+        candidates.extend(parse_srcset(_attr(attrs, name)))
+
+    sized = [(width, url) for url, width in candidates if width]
+    wide_enough = [c for c in sized if c[0] >= target_width]
+    if wide_enough:
+        return min(wide_enough)[1]
+    unsized = [url for url, width in candidates if not width]
+    if unsized:
+        return unsized[0]
+    if sized:
+        return max(sized)[1]
+    return _attr(attrs, "src") or None
+
+
+def _is_shopify(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.netloc.endswith("cdn.shopify.com") or parts.path.startswith("/cdn/shop/")
+
+
+def _is_webflow(url: str) -> bool:
+    host = urlsplit(url).netloc
+    return host.endswith("webflow.com") or host.endswith("website-files.com")
+
+
+def resize_image_url(url: str, target_width: int | None) -> str:
+    """
+    이미지 CDN이 크기 변환을 지원하면 target_width 너비의 URL로 변경.
+    Shopify: 크기 접미사를 지우고 width 파라미터 지정 (원본보다 크게 늘리지는 않음).
+    Webflow: 더 큰 -p-<너비> 변형을 target_width 이상인 가장 작은 변형으로 교체.
+    """
+    if not url or target_width is None:
+        return url
+    parts = urlsplit(url)
+
+    if _is_shopify(url):
+        path = _SHOPIFY_SIZE.sub("", parts.path)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "width"]
+        query.append(("width", str(target_width)))
+        return urlunsplit(parts._replace(path=path, query=urlencode(query)))
+
+    if _is_webflow(url):
+        match = _WEBFLOW_SIZE.search(parts.path)
+        if match:
+            width = next((w for w in WEBFLOW_WIDTHS if w >= target_width), None)
+            if width is not None and width < int(match.group(1)):
+                path = _WEBFLOW_SIZE.sub(f"-p-{width}", parts.path)
+                return urlunsplit(parts._replace(path=path))
+
+    return url
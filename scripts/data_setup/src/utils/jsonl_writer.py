@@ -0,0 +1,68 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import IO, Iterable
+
+from utils.model import Machine
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlWriter:
+    """
+    Machine을 한 줄에 하나씩 JSON Lines 파일로 추가하는 스트리밍 writer.
+
+    파일은 첫 아이템을 쓸 때 생성되고(아이템이 없으면 파일도 없음),
+    write_page마다 flush하므로 중간에 실패해도 그때까지 수집한 페이지는 남습니다.
+    """
+
+    def __init__(self, path: str | Path, fsync: bool = False) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self.count = 0
+        self._file: IO[str] | None = None
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write_page(self, items: Iterable[Machine]) -> int:
+        """한 페이지의 아이템을 추가하고 디스크로 flush (추가한 개수 반환)"""
+        written = 0
+        for item in items:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(
+                json.dumps(item.model_dump(), ensure_ascii=False, default=str) + "\n"
+            )
+            written += 1
+
+        if self._file is not None and written:
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        self.count += written
+        return written
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info(f"{self.count}개 아이템이 {self.path}에 저장되었습니다.")
+
+
+def read_jsonl(path: str | Path) -> Iterable[dict]:
+    """JSON Lines 파일을 한 줄씩 읽음 (마지막 줄이 잘린 경우 해당 줄만 건너뜀)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"{path}:{line_no} 줄을 읽지 못해 건너뜁니다.")
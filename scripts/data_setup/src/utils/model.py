@@ -1,6 +1,9 @@
-from typing import Any
+import re
+from functools import partial
+from typing import Any, Callable, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, model_validator
+from utils.html_backends import compile_selector
 
 
 class Machine(BaseModel):
@@ -10,9 +13,165 @@ class Machine(BaseModel):
     detail: Any | None = None
 
 
+class BrowserProfile(BaseModel):
+    """Selenium 스크래퍼의 Chrome 설정. 같은 프로필끼리만 WebDriver를 공유합니다."""
+
+    model_config = ConfigDict(frozen=True)
+
+    headless: bool = False
+    # CDP Network.setBlockedURLs로 차단할 리소스 (page_source만 읽으므로 불필요)
+    block_images: bool = False
+    block_media: bool = False
+    block_fonts: bool = False
+    block_third_party: bool = False  # 광고/분석/채팅 위젯 등 알려진 외부 호스트
+    blocked_urls: tuple[str, ...] = ()  # 추가 차단 패턴 (와일드카드 * 지원)
+
+
+# 헤드리스 + 이미지/미디어/폰트/외부 트래커 차단
+FAST_BROWSER_PROFILE = BrowserProfile(
+    headless=True,
+    block_images=True,
+    block_media=True,
+    block_fonts=True,
+    block_third_party=True,
+)
+
+
 class ScraperConfig(BaseModel):
     brand_name: str
-    item_selector: str
-    name_selector: str  # item selector 내부에서 식별만되면 가능
-    image_selector: str  # item selector 내부에서 식별만되면 가능
+    # HTML 선택자 (JSON API로 수집하는 StorefrontApiScraper는 사용하지 않음)
+    item_selector: str = ""
+    name_selector: str = ""  # item selector 내부에서 식별만되면 가능
+    image_selector: str = ""  # item selector 내부에서 식별만되면 가능
     machine_series: str = ""
+    # 디스크 HTTP 캐시: TTL(초) 안에는 요청 없이 사용, 이후에는 조건부 GET으로 재검증
+    use_http_cache: bool = True
+    cache_ttl: float = 0
+    # HTML 파서 백엔드: bs4(기본), lxml(미리 컴파일한 CSS 선택자), selectolax
+    parser_backend: Literal["bs4", "lxml", "selectolax"] = "bs4"
+    # 목록 페이지에서 item_selector 서브트리만 파싱 (bs4 + 단순 선택자에서만 적용)
+    partial_parse: bool = False
+    browser_profile: BrowserProfile = BrowserProfile()
+    # Selenium 스크래퍼: page_source를 넘겨받아 파싱하는 대신 브라우저 안에서 선택자를 실행
+    extract_in_browser: bool = False
+    # srcset / data-src / CDN 크기 변형 중 이 너비 이상인 가장 작은 이미지를 선택
+    # (ImageProcessor가 자동 크롭 후 384px로 줄이므로 여유를 둔 값, None이면 src를 그대로 사용).
+    # Shopify CDN 이미지는 모두 ?width=<값> URL로 바뀌므로 처음 적용한 뒤의 diff에는
+    # 해당 머신들이 image_url 변경으로 나옵니다.
+    image_target_width: int | None = 768
+
+    @model_validator(mode="after")
+    def _compile_selectors(self) -> "ScraperConfig":
+        """선택자를 설정 로드 시점에 컴파일 (잘못된 선택자는 스크래핑 전에 오류)"""
+        for field in ("item_selector", "name_selector", "image_selector"):
+            selector = getattr(self, field)
+            if not selector:
+                continue
+            try:
+                compile_selector(selector, self.parser_backend)
+            except Exception as e:
+                raise ValueError(f"{self.brand_name} {field} '{selector}': {e}") from e
+        return self
+
+
+class Pagination(BaseModel):
+    """
+    페이지 번호가 들어가는 목록 URL. 고정된 페이지 수 대신 lookahead개 페이지를 동시에 요청하고
+    item_selector에 맞는 아이템이 없는 첫 페이지(또는 404), 직전 페이지와 아이템이 같은 페이지에서
+    멈춥니다.
+    """
+
+    url_template: str  # 예: "https://example.com/collections/all?page={page}"
+    start: int = 1
+    lookahead: int = 3
+    max_pages: int = 100
+
+    def url(self, page: int) -> str:
+        return self.url_template.replace("{page}", str(page))
+
+
+class Discovery(BaseModel):
+    """
+    사이트맵(sitemap.xml, .xml.gz, 사이트맵 인덱스) 또는 상품 피드(RSS / Atom)로 찾는 상품 페이지.
+    scrap --discover에서 목록 페이지 대신 사용하며, lastmod가 마지막 수집 이후 바뀐 페이지만
+    수집합니다 (utils/discovery.py).
+    """
+
+    # 예: ["https://example.com/sitemap.xml"] 또는 ["https://example.com/collections/x.atom"]
+    urls: list[str]
+    include: str | None = None  # 상품 페이지 URL 정규식 (예: r"/products/")
+    exclude: str | None = None
+    sitemap_include: str | None = None  # 사이트맵 인덱스에서 따라갈 하위 사이트맵 정규식
+
+    @model_validator(mode="after")
+    def _compile_patterns(self) -> "Discovery":
+        """정규식을 설정 로드 시점에 확인 (잘못된 패턴은 스크래핑 전에 오류)"""
+        for field in ("include", "exclude", "sitemap_include"):
+            pattern = getattr(self, field)
+            if pattern is None:
+                continue
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"discovery {field} '{pattern}': {e}") from e
+        return self
+
+
+class ScrapEntry(BaseModel):
+    """SCRAP_CONFIG 항목. 스크래퍼는 build()를 호출할 때 생성됩니다."""
+
+    brand: str
+    series: str = ""
+    type_: str = ""
+    urls: list[str] = []
+    pagination: Pagination | None = None  # 지정하면 urls 대신 사용
+    # scrap --discover일 때 urls / pagination 대신 사용할 사이트맵/피드
+    discovery: Discovery | None = None
+    factory: Callable[[], Any]
+
+    @property
+    def targets(self) -> "list[str] | Pagination":
+        """scrap()에 넘길 대상 (고정 URL 목록 또는 페이지네이션)"""
+        return self.pagination or self.urls
+
+    def scrape_targets(
+        self, scraper: Any, discover: bool = False
+    ) -> "list[str] | Pagination | Discovery":
+        """
+        discover이면 discovery(없으면 스크래퍼가 targets에서 만든 피드, 예: Shopify 컬렉션의
+        Atom 피드), 아니면 targets
+        """
+        if discover:
+            discovery = self.discovery or scraper.default_discovery(self.targets)
+            if discovery is not None:
+                return discovery
+        return self.targets
+
+    @property
+    def needs_browser(self) -> bool:
+        """
+        스크래퍼 클래스가 WebDriver 풀을 사용하는지 (use_selenium / detail_use_selenium).
+        스크래퍼를 만들지 않고 확인하므로 스케줄러가 브라우저 슬롯 배정에 사용합니다.
+        """
+        scraper_class = self.factory.func if isinstance(self.factory, partial) else self.factory
+        return bool(
+            getattr(scraper_class, "use_selenium", False)
+            or getattr(scraper_class, "detail_use_selenium", False)
+        )
+
+    @property
+    def label(self) -> str:
+        return " / ".join(part for part in (self.brand, self.series, self.type_) if part)
+
+    def build(self) -> Any:
+        return self.factory()
+
+    def matches(
+        self, brands: list[str] | None = None, series: list[str] | None = None
+    ) -> bool:
+        """브랜드/시리즈 필터 (대소문자 무시, 지정하지 않은 필터는 모두 통과)"""
+        if brands and self.brand.lower() not in {b.lower() for b in brands}:
+            return False
+        if series and self.series.lower() not in {s.lower() for s in series}:
+            return False
+        return True
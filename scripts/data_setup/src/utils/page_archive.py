@@ -0,0 +1,99 @@
+import hashlib
+import json
+import logging
+import threading
+import warnings
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "index.json"
+
+
+class PageArchive:
+    """
+    스크래퍼가 가져온 HTML을 URL 단위로 저장하는 압축(zip) 아카이브.
+
+    record 모드에서는 fetch_page / fetch_page_with_selenium이 반환한 페이지를 저장하고,
+    replay 모드에서는 네트워크나 브라우저 없이 저장된 페이지를 그대로 돌려줍니다.
+    Selenium 페이지는 handle_browser_action 이후의 최종 HTML이 저장됩니다.
+    """
+
+    _current: "PageArchive | None" = None
+
+    def __init__(self, path: str | Path, mode: str) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown archive mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        if mode == "replay":
+            if not self.path.exists():
+                raise FileNotFoundError(f"Page archive not found: {self.path}")
+            self._zip = zipfile.ZipFile(self.path, "r")
+            self._index = self._read_index()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._zip = zipfile.ZipFile(self.path, "a", compression=zipfile.ZIP_DEFLATED)
+            self._index = self._read_index()
+
+    @classmethod
+    def current(cls) -> "PageArchive | None":
+        """현재 활성화된 아카이브 (없으면 None)"""
+        return cls._current
+
+    @classmethod
+    @contextmanager
+    def activate(cls, path: str | Path, mode: str) -> Iterator["PageArchive"]:
+        archive = cls(path, mode)
+        cls._current = archive
+        try:
+            yield archive
+        finally:
+            cls._current = None
+            archive.close()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def _entry_name(url: str) -> str:
+        return f"pages/{hashlib.sha256(url.encode('utf-8')).hexdigest()}.html"
+
+    def _read_index(self) -> dict[str, str]:
+        if INDEX_NAME not in self._zip.namelist():
+            return {}
+        return json.loads(self._zip.read(INDEX_NAME).decode("utf-8"))
+
+    def urls(self) -> list[str]:
+        return list(self._index)
+
+    def read(self, url: str) -> str:
+        name = self._entry_name(url)
+        with self._lock:
+            try:
+                data = self._zip.read(name)
+            except KeyError:
+                raise KeyError(f"아카이브에 저장되지 않은 URL: {url}") from None
+        logger.info(f"아카이브에서 페이지 재생: {url}")
+        return data.decode("utf-8")
+
+    def write(self, url: str, html: str) -> None:
+        name = self._entry_name(url)
+        with self._lock, warnings.catch_warnings():
+            # 같은 URL을 다시 기록하면 나중 항목이 읽힘
+            warnings.simplefilter("ignore", UserWarning)
+            self._zip.writestr(name, html.encode("utf-8"))
+            self._index[url] = name
+        logger.info(f"아카이브에 페이지 기록: {url}")
+
+    def close(self) -> None:
+        with self._lock, warnings.catch_warnings():
+            if self.mode == "record":
+                warnings.simplefilter("ignore", UserWarning)
+                self._zip.writestr(INDEX_NAME, json.dumps(self._index, ensure_ascii=False))
+            self._zip.close()
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, Mapping
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 공유 없이 스레드 간에만 공유
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+STATE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "ratelimit"
+
+THROTTLE_STATUSES = {429, 503}  # 속도를 줄여야 한다는 신호
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _host_of(url_or_host: str) -> str:
+    return urlparse(url_or_host).netloc or url_or_host
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP-date)를 남은 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    호스트별 토큰 버킷 요청 제한기.
+
+    버킷 상태는 호스트마다 STATE_DIR의 파일에 저장하고 fcntl 잠금으로 갱신하므로
+    스레드와 프로세스(스케줄러의 자식 프로세스 포함)가 같은 한도를 나눠 씁니다.
+    429/503 응답이 오면 속도를 절반으로 줄이고(AIMD) Retry-After 동안 해당 호스트 요청을
+    멈추며, 성공할 때마다 속도를 조금씩 다시 올립니다.
+    state_ttl초 넘게 요청이 없던 호스트는 지난 실행에서 줄인 속도를 버리고 처음 상태로 시작합니다
+    (아직 끝나지 않은 Retry-After 차단은 유지).
+    """
+
+    _shared: "RateLimiter | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: float = 4.0,
+        min_rate: float = 0.1,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        max_retries: int = 4,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+        state_ttl: float = 3600.0,
+        state_dir: Path = STATE_DIR,
+    ) -> None:
+        self.rate = rate  # 호스트별 초당 요청 수 상한 (host_rates로 개별 지정 가능)
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.state_ttl = state_ttl
+        self.host_rates: dict[str, float] = {}
+        self.host_bursts: dict[str, float] = {}
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._local_lock = threading.Lock()
+        self._local_state: dict[str, dict] = {}
+
+    @classmethod
+    def shared(cls) -> "RateLimiter":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def set_host_rate(self, host: str, rate: float, burst: float | None = None) -> None:
+        """
+        특정 호스트의 초당 요청 수 상한을 지정 (burst를 주면 한 번에 몰아 보낼 수 있는 요청 수도,
+        예: burst=1이면 모든 요청 사이에 1/rate초 간격)
+        """
+        self.host_rates[_host_of(host)] = rate
+        if burst is not None:
+            self.host_bursts[_host_of(host)] = burst
+
+    def _max_rate(self, host: str) -> float:
+        return self.host_rates.get(host, self.rate)
+
+    def _burst(self, host: str) -> float:
+        return self.host_bursts.get(host, self.burst)
+
+    @contextmanager
+    def _locked_state(self, host: str) -> Iterator[dict]:
+        """호스트 버킷 상태를 잠근 채로 읽고, 블록이 끝나면 다시 기록"""
+        default = {
+            "tokens": self._burst(host),
+            "updated": time.time(),
+            "rate": self._max_rate(host),
+            "blocked_until": 0.0,
+        }
+        if fcntl is None:
+            with self._local_lock:
+                yield self._local_state.setdefault(host, default)
+            return
+
+        path = self.state_dir / f"{re.sub(r'[^A-Za-z0-9.-]', '_', host)}.json"
+        with open(path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = {**default, **json.loads(f.read() or "{}")}
+                except json.JSONDecodeError:
+                    state = default
+                if default["updated"] - state["updated"] > self.state_ttl:
+                    state = {**default, "blocked_until": state["blocked_until"]}
+                yield state
+                f.seek(0)
+                f.truncate()
+                json.dump(state, f)
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _reserve(self, host: str) -> float:
+        """토큰을 하나 가져가면 0, 아니면 다시 시도하기까지 기다릴 초"""
+        with self._locked_state(host) as state:
+            now = time.time()
+            rate = min(state["rate"], self._max_rate(host))
+            state["tokens"] = min(
+                self._burst(host), state["tokens"] + (now - state["updated"]) * rate
+            )
+            state["updated"] = now
+            if now < state["blocked_until"]:
+                return state["blocked_until"] - now
+            if state["tokens"] >= 1:
+                state["tokens"] -= 1
+                return 0.0
+            return (1 - state["tokens"]) / rate
+
+    def wait(self, url: str) -> None:
+        """요청을 보내도 될 때까지 대기 (동기)"""
+        host = _host_of(url)
+        while (delay := self._reserve(host)) > 0:
+            time.sleep(delay + random.uniform(0, 0.05))
+
+    async def wait_async(self, url: str) -> None:
+        """요청을 보내도 될 때까지 대기 (비동기)"""
+        host = _host_of(url)
+        # 상태 파일 잠금(flock)과 I/O가 이벤트 루프를 막지 않도록 스레드에서 실행
+        while (delay := await asyncio.to_thread(self._reserve, host)) > 0:
+            await asyncio.sleep(delay + random.uniform(0, 0.05))
+
+    def backoff(self, attempt: int) -> float:
+        """지수 백오프 + full jitter"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2**attempt))
+
+    def update(
+        self,
+        url: str,
+        status: int,
+        headers: Mapping[str, str] | None = None,
+        attempt: int = 0,
+    ) -> float | None:
+        """
+        응답 상태를 반영해 속도를 조정. 재시도할 상태면 재시도 전 대기할 초를, 아니면 None을 반환.
+        """
+        host = _host_of(url)
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+
+        with self._locked_state(host) as state:
+            if status in THROTTLE_STATUSES:
+                state["rate"] = max(self.min_rate, state["rate"] * self.decrease)
+                if retry_after is not None:
+                    state["blocked_until"] = max(
+                        state["blocked_until"], time.time() + retry_after
+                    )
+                rate = state["rate"]
+            elif status < 400:
+                state["rate"] = min(self._max_rate(host), state["rate"] + self.increase)
+
+        if status in THROTTLE_STATUSES:
+            logger.warning(
+                f"요청 제한 응답 {status}: {host} (초당 {rate:.2f}회로 감속"
+                + (f", Retry-After {retry_after:.0f}초)" if retry_after is not None else ")")
+            )
+        if status not in RETRY_STATUSES:
+            return None
+        if retry_after is not None:
+            return retry_after + random.uniform(0, 1)
+        return self.backoff(attempt)
+
+    def send(self, url: str, request: Callable[[], Any]) -> Any:
+        """
+        request()를 요청 제한에 맞춰 실행하고 429/5xx면 백오프 후 재시도.
+        request는 status_code와 headers를 가진 응답(requests / httpx)을 반환해야 합니다.
+        """
+        attempt = 0
+        while True:
+            self.wait(url)
+            response = request()
+            delay = self.update(url, response.status_code, response.headers, attempt)
+            if delay is None or attempt >= self.max_retries:
+                return response
+            logger.info(f"{delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {url}")
+            time.sleep(delay)
+            attempt += 1
+
+    async def send_async(self, url: str, request: Callable[[], Awaitable[Any]]) -> Any:
+        """send()의 비동기 버전"""
+        attempt = 0
+        while True:
+            await self.wait_async(url)
+            response = await request()
+            delay = await asyncio.to_thread(
+                self.update, url, response.status_code, response.headers, attempt
+            )
+            if delay is None or attempt >= self.max_retries:
+                return response
+            logger.info(f"{delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {url}")
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from utils.jsonl_writer import read_jsonl
+
+logger = logging.getLogger(__name__)
+
+METRICS_DIR = Path(__file__).resolve().parents[2] / ".cache" / "metrics"
+# 스케줄러의 자식 프로세스도 같은 파일에 기록하도록 경로를 환경 변수로 전달
+METRICS_PATH_ENV = "IRONDEX_SCRAPE_METRICS"
+
+# httpcore trace 단계 → 기록할 단계 (connect_tcp에는 DNS 조회가 포함됨)
+_TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "connect",
+    "send_request_headers": "ttfb",
+    "send_request_body": "ttfb",
+    "receive_response_headers": "ttfb",
+    "receive_response_body": "transfer",
+}
+
+
+class RequestTimings:
+    """
+    httpx의 trace 확장으로 요청 한 번의 단계별 시간(connect / ttfb / transfer)을 모음.
+    extensions={"trace": timings}(동기) 또는 {"trace": timings.atrace}(비동기)로 전달합니다.
+    """
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self._started: dict[str, float] = {}
+
+    def _on_event(self, name: str, info: dict) -> None:
+        # 예: "connection.connect_tcp.started", "http11.receive_response_body.complete"
+        _, step, event = name.rsplit(".", 2)
+        phase = _TRACE_PHASES.get(step)
+        if phase is None:
+            return
+        if event == "started":
+            self._started[step] = time.perf_counter()
+        elif step in self._started:
+            elapsed = time.perf_counter() - self._started.pop(step)
+            self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+
+    def __call__(self, name: str, info: dict) -> None:
+        self._on_event(name, info)
+
+    async def atrace(self, name: str, info: dict) -> None:
+        self._on_event(name, info)
+
+
+class ScrapeMetrics:
+    """
+    URL별 단계 시간(span)을 JSON Lines 파일에 한 줄씩 기록.
+
+    한 줄은 {"ts", "pid", "brand", "series", "url", "phase", "seconds", "count"} 형식입니다.
+    run_scraping이 실행마다 start_run()으로 새 파일을 지정하며, 지정되지 않았으면
+    (스크래퍼 단독 실행 등) 아무것도 기록하지 않습니다.
+    """
+
+    _shared: "ScrapeMetrics | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str | Path | None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._file = None
+
+    @classmethod
+    def shared(cls) -> "ScrapeMetrics":
+        with cls._shared_lock:
+            path = os.environ.get(METRICS_PATH_ENV)
+            if cls._shared is None or str(cls._shared.path or "") != (path or ""):
+                if cls._shared is not None:
+                    cls._shared.close()
+                cls._shared = cls(path)
+            return cls._shared
+
+    @classmethod
+    def start_run(cls, metrics_dir: Path = METRICS_DIR) -> Path:
+        """이번 실행의 메트릭 파일 경로를 정하고 환경 변수로 공유"""
+        metrics_dir.mkdir(parents=True, exist_ok=True)
+        path = metrics_dir / f"scrap_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.jsonl"
+        os.environ[METRICS_PATH_ENV] = str(path)
+        return path
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def record(
+        self,
+        phase: str,
+        url: str,
+        seconds: float,
+        brand: str = "",
+        series: str = "",
+        count: int = 1,
+    ) -> None:
+        if self.path is None:
+            return
+        line = json.dumps(
+            {
+                "ts": time.time(),
+                "pid": os.getpid(),
+                "brand": brand,
+                "series": series,
+                "url": url,
+                "phase": phase,
+                "seconds": round(seconds, 6),
+                "count": count,
+            },
+            ensure_ascii=False,
+        )
+        with self._lock:
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(line + "\n")
+                self._file.flush()
+            except OSError as e:
+                logger.warning(f"메트릭 기록 실패 ({self.path}): {e}")
+
+    def record_phases(
+        self, phases: dict[str, float], url: str, brand: str = "", series: str = ""
+    ) -> None:
+        for phase, seconds in phases.items():
+            self.record(phase, url, seconds, brand, series)
+
+    @contextmanager
+    def span(self, phase: str, url: str, brand: str = "", series: str = "") -> Iterator[None]:
+        """블록 실행 시간을 phase로 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, url, time.perf_counter() - started, brand, series)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_metrics(path: str | Path) -> list[dict[str, Any]]:
+    """메트릭 파일을 읽음 (잘린 줄은 건너뜀)"""
+    return list(read_jsonl(path))
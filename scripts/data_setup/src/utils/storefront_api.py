@@ -0,0 +1,211 @@
+import json
+import logging
+from html import unescape
+from typing import Any, AsyncIterator, Iterator
+from urllib.parse import urlparse
+
+from utils.async_fetcher import AsyncFetcher
+from utils.base_scraper import BaseScraper
+from utils.checkpoint import CheckpointStore
+from utils.image_variants import select_image_url
+from utils.model import Discovery, Machine, Pagination, ScraperConfig
+
+logger = logging.getLogger(__name__)
+
+
+class StorefrontApiScraper(BaseScraper):
+    """
+    HTML 대신 쇼핑몰 플랫폼의 상품 JSON API로 컬렉션 전체를 가져오는 스크래퍼.
+
+    SCRAP_CONFIG의 URL(또는 Pagination)은 기존 목록 페이지 URL을 그대로 쓰고,
+    컬렉션마다 API 페이지 URL로 바꿔 page_size개씩 요청합니다. 요청 제한, HTTP 캐시,
+    페이지 아카이브, 체크포인트는 HTML 스크래퍼와 같은 경로를 사용하며
+    (API 페이지 URL 단위로 기록), 브라우저나 DOM 파싱은 필요 없습니다.
+    아이템은 상품 dict이고 extract_name / extract_image_url /
+    extract_additional_info에 그대로 전달됩니다.
+    Discovery(scrap --discover)로 찾은 상품 페이지는 상품 하나의 API URL로 바꿔 수집합니다.
+    """
+
+    page_size = 100
+    # 피드에서 상품 페이지로 인정할 URL 정규식
+    product_url_pattern: str | None = None
+
+    def __init__(self, scraper_config: ScraperConfig, contain_series: bool = True) -> None:
+        super().__init__(scraper_config, contain_series=contain_series, use_selenium=False)
+
+    def api_url_template(self, collection_url: str) -> str:
+        """목록 페이지 URL에 해당하는 API URL ({page} 자리에 페이지 번호)"""
+        raise NotImplementedError
+
+    def products_of(self, data: Any) -> list[dict]:
+        """API 응답에서 상품 목록을 꺼냄"""
+        raise NotImplementedError
+
+    def collection_urls(self, target_urls: list[str] | Pagination) -> list[str]:
+        """목록 페이지 URL에서 쿼리(페이지 번호 등)를 뺀 컬렉션 URL (중복 제거)"""
+        if isinstance(target_urls, Pagination):
+            target_urls = [target_urls.url(target_urls.start)]
+        collections = []
+        for url in target_urls:
+            parsed = urlparse(url)
+            collections.append(f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}")
+        return list(dict.fromkeys(collections))
+
+    def feed_url(self, collection_url: str) -> str | None:
+        """컬렉션에 속한 상품과 수정 시각을 나열하는 피드 URL (없으면 None)"""
+        return None
+
+    def default_discovery(self, target_urls: list[str] | Pagination) -> Discovery | None:
+        """컬렉션마다의 피드 (scrap --discover에서 컬렉션 전체 대신 바뀐 상품만 수집)"""
+        feeds = [self.feed_url(url) for url in self.collection_urls(target_urls)]
+        if not feeds or None in feeds:
+            return None
+        return Discovery(urls=feeds, include=self.product_url_pattern)
+
+    def api_pagination(self, collection_url: str) -> Pagination:
+        # 한 페이지에 page_size개를 받으므로 대부분 요청 한 번으로 끝남 (미리 요청하지 않음)
+        return Pagination(url_template=self.api_url_template(collection_url), lookahead=1)
+
+    def _target_pages(
+        self,
+        target_urls: list[str] | Pagination | Discovery,
+        checkpoint: CheckpointStore | None,
+    ) -> Iterator[tuple[str, Any]]:
+        if isinstance(target_urls, Discovery):
+            yield from super()._target_pages(target_urls, checkpoint)
+            return
+        for collection_url in self.collection_urls(target_urls):
+            yield from self._paginate(self.api_pagination(collection_url), checkpoint)
+
+    async def _target_pages_async(
+        self,
+        target_urls: list[str] | Pagination | Discovery,
+        fetcher: AsyncFetcher,
+        checkpoint: CheckpointStore | None,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        if isinstance(target_urls, Discovery):
+            sources = [super()._target_pages_async(target_urls, fetcher, checkpoint)]
+        else:
+            sources = (
+                self._paginate_async(self.api_pagination(collection_url), fetcher, checkpoint)
+                for collection_url in self.collection_urls(target_urls)
+            )
+        for pages in sources:
+            try:
+                async for page in pages:
+                    yield page
+            finally:
+                await pages.aclose()
+
+    def parse_html(self, html: str, items_only: bool = False) -> list[dict]:
+        """API 응답(JSON)을 상품 목록으로 변환"""
+        return self.products_of(json.loads(html))
+
+    def _has_items(self, products: list[dict], url: str) -> bool:
+        if not products:
+            logger.info(f"상품이 없는 페이지에서 페이지네이션 종료: {url}")
+            return False
+        return True
+
+    def _is_last_page(self, products: list[dict]) -> bool:
+        return len(products) < self.page_size
+
+    def extract_items(self, products: list[dict]) -> list[Machine]:
+        logger.info(f"API 응답에서 {len(products)}개 상품 발견")
+        return self._extract_item_infos(products)
+
+    def extract_name(self, product: dict) -> str:
+        raise NotImplementedError
+
+    def extract_image_url(self, product: dict) -> str:
+        images = product.get("images") or []
+        if not images or not images[0].get("src"):
+            raise ValueError(f"상품 이미지가 없습니다: {self.extract_name(product)}")
+        # WooCommerce는 srcset을 함께 주고, Shopify 원본은 extract_item_info에서 CDN 크기로 변경
+        return select_image_url(images[0], self.image_target_width) or images[0]["src"]
+
+
+class ShopifyScraper(StorefrontApiScraper):
+    """
+    Shopify 스토어의 /collections/<handle>/products.json (페이지당 최대 250개).
+    이미지는 크기 접미사가 없는 원본 CDN URL입니다.
+    """
+
+    page_size = 250
+    product_url_pattern = r"/products/"
+
+    def api_url_template(self, collection_url: str) -> str:
+        return f"{collection_url}/products.json?limit={self.page_size}&page={{page}}"
+
+    def products_of(self, data: Any) -> list[dict]:
+        # 상품 하나의 /products/<handle>.json 응답은 {"product": {...}}
+        if "product" in data:
+            return [data["product"]]
+        return data.get("products", [])
+
+    def feed_url(self, collection_url: str) -> str:
+        # 컬렉션 Atom 피드: 상품마다 링크와 updated
+        return f"{collection_url}.atom"
+
+    def discovered_page_url(self, url: str) -> str:
+        """상품 페이지 URL(/products/<handle>)의 상품 JSON (/products/<handle>.json)"""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}.json"
+
+    def extract_name(self, product: dict) -> str:
+        name = (product.get("title") or "").strip()
+        if not name:
+            raise ValueError("상품 이름(title)이 없습니다")
+        return name
+
+    def variant_sku(self, product: dict) -> str:
+        """첫 번째 variant의 SKU (없으면 빈 문자열)"""
+        variants = product.get("variants") or []
+        return (variants[0].get("sku") or "").strip() if variants else ""
+
+    def variant_price(self, product: dict) -> str | None:
+        variants = product.get("variants") or []
+        return variants[0].get("price") if variants else None
+
+
+class WooCommerceScraper(StorefrontApiScraper):
+    """
+    WooCommerce Store API (/wp-json/wc/store/v1/products, 페이지당 최대 100개).
+    목록 URL의 마지막 경로(/product-category/.../<slug>/)를 카테고리로 사용합니다.
+    """
+
+    page_size = 100
+    product_url_pattern = r"/product/"
+
+    def api_url_template(self, collection_url: str) -> str:
+        parsed = urlparse(collection_url)
+        category = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+        return (
+            f"{parsed.scheme}://{parsed.netloc}/wp-json/wc/store/v1/products"
+            f"?category={category}&per_page={self.page_size}&page={{page}}"
+        )
+
+    def products_of(self, data: Any) -> list[dict]:
+        return data
+
+    def feed_url(self, collection_url: str) -> str:
+        # 상품 카테고리의 RSS 피드 (WordPress 분류 피드, pubDate만 있어 새 상품 위주로 찾음)
+        return f"{collection_url}/feed/"
+
+    def discovered_page_url(self, url: str) -> str:
+        """상품 페이지 URL(/product/<slug>/)의 slug로 Store API 상품 조회"""
+        parsed = urlparse(url)
+        slug = parsed.path.rstrip("/").rsplit("/", 1)[-1]
+        return f"{parsed.scheme}://{parsed.netloc}/wp-json/wc/store/v1/products?slug={slug}"
+
+    def _ends_pagination(self, error: Exception) -> bool:
+        # 범위를 넘은 페이지는 400 (rest_invalid_page_number)
+        response = getattr(error, "response", None)
+        return getattr(response, "status_code", None) in (400, 404)
+
+    def extract_name(self, product: dict) -> str:
+        # 이름은 HTML 엔티티로 인코딩되어 옴 (예: &#8211;)
+        name = unescape(product.get("name") or "").strip()
+        if not name:
+            raise ValueError("상품 이름(name)이 없습니다")
+        return name
@@ -1,9 +1,10 @@
 import os
 import uuid
 
-import requests
 from config.supabase import SUPABASE_SERVICE_ROLE_KEY, SUPABASE_URL
 from supabase import Client, create_client
+from utils.http_client import HttpClient
+from utils.rate_limiter import RateLimiter
 
 
 class SupabaseManager:
@@ -140,7 +141,9 @@ class SupabaseManager:
                 "Chrome/58.0.3029.110 Safari/537.36"
             )
         }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = RateLimiter.shared().send(
+            url, lambda: HttpClient.shared().get(url, headers=headers)
+        )
         response.raise_for_status()
         content = response.content
         content_type = response.headers.get("content-type", "application/octet-stream")
@@ -220,3 +223,18 @@ class SupabaseManager:
             print(f"Successfully upserted {len(data)} rows to table '{table_name}'.")
         except Exception as e:
             print(f"Error upserting data to table '{table_name}': {e}")
+
+    def update_in_table(self, *, table_name: str, data: dict, match: dict):
+        """
+        Updates the rows of a Supabase table whose columns equal the values in `match`.
+
+        Args:
+            table_name: The name of the table to update.
+            data: The column values to set.
+            match: Column -> value filters selecting the rows to update.
+        """
+        try:
+            self.client.table(table_name).update(data).match(match).execute()
+            print(f"Successfully updated rows matching {match} in table '{table_name}'.")
+        except Exception as e:
+            print(f"Error updating table '{table_name}': {e}")
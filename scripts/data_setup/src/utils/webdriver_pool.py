@@ -0,0 +1,254 @@
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+from utils.model import BrowserProfile
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE = BrowserProfile()
+
+IMAGE_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp",
+)
+MEDIA_URL_PATTERNS = ("*.mp4", "*.webm", "*.m3u8", "*.mov", "*.mp3", "*.ogg")
+FONT_URL_PATTERNS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+THIRD_PARTY_URL_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*analytics.tiktok.com*",
+    "*klaviyo.com*",
+    "*static.zdassets.com*",
+    "*widget.intercom.io*",
+    "*youtube.com/embed*",
+    "*player.vimeo.com*",
+)
+
+# Resource Timing 버퍼 기본값(250개)을 넘는 페이지도 전송량을 집계할 수 있도록 확장
+_RESOURCE_BUFFER_SCRIPT = "performance.setResourceTimingBufferSize(10000);"
+
+
+def blocked_url_patterns(profile: BrowserProfile) -> list[str]:
+    """프로필에서 Network.setBlockedURLs에 넘길 URL 패턴 목록"""
+    patterns: list[str] = []
+    if profile.block_images:
+        patterns.extend(IMAGE_URL_PATTERNS)
+    if profile.block_media:
+        patterns.extend(MEDIA_URL_PATTERNS)
+    if profile.block_fonts:
+        patterns.extend(FONT_URL_PATTERNS)
+    if profile.block_third_party:
+        patterns.extend(THIRD_PARTY_URL_PATTERNS)
+    patterns.extend(profile.blocked_urls)
+    return patterns
+
+
+def build_chrome_options(profile: BrowserProfile = DEFAULT_PROFILE) -> Options:
+    """스크래퍼 공통 Chrome 옵션"""
+    chrome_options = Options()
+
+    # Bot 감지 우회를 위해 기본은 일반 모드, 프로필에서 헤드리스 선택 가능
+    if profile.headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-plugins")
+    chrome_options.add_argument("--window-size=1920,1080")
+
+    # Bot 감지 우회 핵심 설정들
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+
+    # 더 현실적인 User-Agent
+    chrome_options.add_argument(
+        "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+    return chrome_options
+
+
+class WebDriverPool:
+    """
+    Selenium 스크래퍼들이 빌려 쓰는 WebDriver 풀.
+
+    드라이버는 처음 필요할 때 생성되고, 반납되면 같은 BrowserProfile을 쓰는 다음 스크래퍼가
+    재사용합니다. 동시에 실행되는 Chrome 수는 프로필과 관계없이 max_drivers로 제한되며,
+    max_uses번 사용된 드라이버는 종료 후 새로 생성됩니다.
+    """
+
+    _shared: "WebDriverPool | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_drivers: int = 2, max_uses: int = 50) -> None:
+        self.max_drivers = max_drivers
+        self.max_uses = max_uses
+        self._idle: dict[BrowserProfile, list[webdriver.Chrome]] = {}
+        self._uses: dict[int, int] = {}
+        self._profiles: dict[int, BrowserProfile] = {}
+        self._started = 0
+        self._condition = threading.Condition()
+        self._driver_path: str | None = None
+
+    @classmethod
+    def shared(cls) -> "WebDriverPool":
+        """프로세스 전체에서 공유하는 기본 풀"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    def __enter__(self) -> "WebDriverPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start_driver(self, profile: BrowserProfile) -> webdriver.Chrome:
+        # chromedriver 설치/확인은 풀 당 한 번만 수행
+        if self._driver_path is None:
+            self._driver_path = ChromeDriverManager().install()
+
+        logger.info(f"새 Chrome WebDriver 시작 (headless={profile.headless})")
+        driver = webdriver.Chrome(
+            service=ChromeService(self._driver_path),
+            options=build_chrome_options(profile),
+        )
+        if not driver:
+            raise RuntimeError("Selenium WebDriver 초기화 실패")
+
+        try:
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": _RESOURCE_BUFFER_SCRIPT},
+            )
+            patterns = blocked_url_patterns(profile)
+            if patterns:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+                logger.info(f"리소스 차단 패턴 {len(patterns)}개 적용")
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        with self._condition:
+            self._uses.pop(id(driver), None)
+            self._profiles.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"WebDriver 종료 중 오류: {e}")
+
+    def _pop_other_idle(self, profile: BrowserProfile) -> webdriver.Chrome | None:
+        for other, drivers in self._idle.items():
+            if other != profile and drivers:
+                return drivers.pop()
+        return None
+
+    def acquire(self, profile: BrowserProfile = DEFAULT_PROFILE) -> webdriver.Chrome:
+        """
+        같은 프로필의 유휴 드라이버를 빌리거나, 한도 내에서 새로 시작 (한도 초과 시 대기).
+        한도가 찼는데 다른 프로필의 드라이버만 놀고 있으면 그 드라이버를 종료하고 새로 시작합니다.
+        """
+        evicted = None
+        with self._condition:
+            while True:
+                if self._idle.get(profile):
+                    return self._idle[profile].pop()
+                if self._started < self.max_drivers:
+                    break
+                evicted = self._pop_other_idle(profile)
+                if evicted is not None:
+                    break
+                self._condition.wait()
+            if evicted is None:
+                self._started += 1
+
+        if evicted is not None:
+            # 슬롯은 그대로 넘겨받으므로 _started는 변하지 않음
+            self._quit_driver(evicted)
+
+        try:
+            driver = self._start_driver(profile)
+        except Exception:
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._uses[id(driver)] = 0
+            self._profiles[id(driver)] = profile
+        return driver
+
+    def release(self, driver: webdriver.Chrome, broken: bool = False) -> None:
+        """드라이버 반납 (오류가 났거나 너무 오래 쓴 드라이버는 종료)"""
+        with self._condition:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+            profile = self._profiles.get(id(driver), DEFAULT_PROFILE)
+        if broken or uses >= self.max_uses:
+            self._quit_driver(driver)
+            with self._condition:
+                self._started -= 1
+                self._condition.notify()
+            return
+
+        try:
+            # 다음 브랜드에 이전 세션 상태가 남지 않도록 정리
+            driver.delete_all_cookies()
+        except Exception:
+            self.release(driver, broken=True)
+            return
+
+        with self._condition:
+            self._idle.setdefault(profile, []).append(driver)
+            # 다른 프로필을 기다리는 스레드도 유휴 드라이버를 넘겨받을 수 있도록 모두 깨움
+            self._condition.notify_all()
+
+    @contextmanager
+    def driver(
+        self, profile: BrowserProfile = DEFAULT_PROFILE
+    ) -> Iterator[webdriver.Chrome]:
+        driver = self.acquire(profile)
+        broken = False
+        try:
+            yield driver
+        except TimeoutException:
+            # 페이지 대기 시간 초과는 드라이버 자체의 문제가 아니므로 재사용
+            raise
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self) -> None:
+        """유휴 드라이버를 모두 종료"""
+        with self._condition:
+            idle = [driver for drivers in self._idle.values() for driver in drivers]
+            self._idle = {}
+            self._started -= len(idle)
+            self._condition.notify_all()
+        for driver in idle:
+            self._quit_driver(driver)
+        if idle:
+            logger.info(f"WebDriver {len(idle)}개 종료")
@@ -0,0 +1,9 @@
+"""
+Unit tests for the scraping utilities. Run from scripts/data_setup:
+
+    python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -0,0 +1,81 @@
+from process.preprocess import Preprocessor
+from utils.base_scraper import BaseScraper
+from utils.dedup_index import DedupIndex
+from utils.discovery import DiscoveredUrl, DiscoveryState
+from utils.jsonl_writer import JsonlWriter
+from utils.model import Machine, ScraperConfig
+
+LISTING_URL = "https://example.com/collections/strength"
+PRODUCT_URL = "https://example.com/products/chest-press"
+IMAGE_URL = "https://example.com/images/chest-press.jpg"
+
+
+def _machine(price: int) -> Machine:
+    return Machine(
+        brand="Example", name="Chest Press", image_url=IMAGE_URL, detail={"price": price}
+    )
+
+
+def _scraper(discovery_state: DiscoveryState) -> BaseScraper:
+    scraper = BaseScraper(ScraperConfig(brand_name="Example"))
+    scraper.discovery_state = discovery_state
+    return scraper
+
+
+def test_discovered_rescrape_keeps_price_change(tmp_path):
+    """A product page re-scraped under --discover replaces the listing's copy of the machine."""
+    dedup = DedupIndex(tmp_path / "dedup.sqlite")
+    state = DiscoveryState(tmp_path / "discovery.sqlite")
+
+    # Earlier listing run: the listing page owns the machine
+    listing = _scraper(state)
+    with JsonlWriter(tmp_path / "listing.jsonl") as writer:
+        assert listing._write_page(writer, LISTING_URL, [_machine(100)], None, dedup)
+
+    # --discover run: only the price changed on the product page
+    discover = _scraper(state)
+    page = DiscoveredUrl(PRODUCT_URL, lastmod=2_000_000_000.0)
+    discover._discovered = {PRODUCT_URL: page}
+    with JsonlWriter(tmp_path / "discover.jsonl") as writer:
+        written = discover._write_page(writer, PRODUCT_URL, [_machine(120)], None, dedup)
+
+    assert [item.detail for item in written] == [{"price": 120}]
+    assert state.changed(discover.checkpoint_key, [page]) == []
+    assert dedup.sources(_machine(120)) == [
+        (listing.checkpoint_key, LISTING_URL),
+        (discover.checkpoint_key, PRODUCT_URL),
+    ]
+
+
+def test_other_scraper_duplicate_still_dropped(tmp_path):
+    """take_over only applies within the same scraper key."""
+    dedup = DedupIndex(tmp_path / "dedup.sqlite")
+    owner_file = tmp_path / "owner.jsonl"
+    owner_file.write_text("{}\n", encoding="utf-8")
+    assert dedup.claim("Example/A", LISTING_URL, [_machine(100)], str(owner_file))
+
+    kept = dedup.claim("Example/B", PRODUCT_URL, [_machine(120)], None, take_over=True)
+
+    assert kept == []
+
+
+def test_preprocess_keeps_only_the_taken_over_row(tmp_path):
+    """After a --discover take-over, preprocessing reads the machine once, from the newer file."""
+    dedup = DedupIndex(tmp_path / "dedup.sqlite")
+    state = DiscoveryState(tmp_path / "discovery.sqlite")
+    scraped_dir = tmp_path / "scraped_data"
+
+    listing = _scraper(state)
+    with JsonlWriter(scraped_dir / "Example__machines_1700000000.jsonl") as writer:
+        listing._write_page(writer, LISTING_URL, [_machine(100)], None, dedup)
+
+    discover = _scraper(state)
+    discover._discovered = {PRODUCT_URL: DiscoveredUrl(PRODUCT_URL, lastmod=2_000_000_000.0)}
+    with JsonlWriter(scraped_dir / "Example__machines_1700000100.jsonl") as writer:
+        discover._write_page(writer, PRODUCT_URL, [_machine(120)], None, dedup)
+
+    preprocessor = Preprocessor()
+    preprocessor.scraped_data_dir = str(scraped_dir)
+    machines = preprocessor.read_scraped_machines()
+
+    assert [machine["detail"] for machine in machines] == [{"price": 120}]